@@ -0,0 +1,106 @@
+#! /usr/local/bin/python3
+#
+# Compares the composite (per-attribute) ZPR68 zone status against the
+# single 'Z{zone}' status dump.
+#
+# Running:
+#   ./benchmark-zone-status.py                       # simulated amp on a pty
+#   ./benchmark-zone-status.py --tty /dev/ttyUSB0    # real ZPR68
+#
+# The simulated amp paces replies at the serial line rate (--baud) and adds
+# --latency seconds of processing time per reply, so results reflect the
+# number of round trips and bytes on the wire rather than Python overhead.
+
+import argparse
+import asyncio
+import os
+import pty
+import re
+import threading
+import time
+
+from pyxantech import async_get_amp_controller, get_device_config
+
+AMP_TYPE = 'zpr68-10'
+
+ATTRIBUTE_REPLIES = {
+    b'C': b'PY',
+    b'V': b'V20',
+    b'I': b'I3',
+    b'M': b'MN',
+    b'T': b'T06',
+    b'B': b'B07',
+}
+REQUEST = re.compile(rb'\?(\d\d)([CVIMTB])=|Z(\d\d)')
+
+
+def simulated_amp(baud: int, latency: float) -> str:
+    """Start a simulated ZPR68 on a pseudo-terminal and return its path."""
+    byte_time = 10 / baud  # start + 8 data + stop bits
+
+    def reply(request: re.Match[bytes]) -> bytes:
+        if request[3]:
+            return b'\n\r\a%s 03 00 20 00C 00C 06 06 07 07 1 0 40 \n\r' % request[3]
+        return b'?%s%s+\n\r' % (request[1], ATTRIBUTE_REPLIES[request[2]])
+
+    def listener(port: int) -> None:
+        buffer = b''
+        while True:
+            buffer += os.read(port, 1)
+            request = REQUEST.fullmatch(buffer)
+            if request is None:
+                continue
+            buffer = b''
+            response = reply(request)
+            time.sleep(latency + byte_time * (len(request[0]) + len(response)))
+            os.write(port, response)
+
+    master, slave = pty.openpty()
+    threading.Thread(target=listener, args=[master], daemon=True).start()
+    return os.ttyname(slave)
+
+
+async def measure(label: str, rounds: int, zones: list[int], read) -> None:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await read(zones)
+    elapsed = time.perf_counter() - start
+    per_zone = elapsed / (rounds * len(zones)) * 1000
+    print(f'{label:<28} {elapsed:8.3f} s total {per_zone:8.2f} ms/zone')
+
+
+async def main(args: argparse.Namespace) -> None:
+    port = args.tty or simulated_amp(args.baud, args.latency)
+    amp = await async_get_amp_controller(AMP_TYPE, port, asyncio.get_running_loop())
+    zones = list(get_device_config(AMP_TYPE, 'zones'))
+
+    async def dump(zones: list[int]) -> None:
+        for zone in zones:
+            await amp.zone_status(zone)
+
+    async def composite(zones: list[int]) -> None:
+        for zone in zones:
+            await amp.zone_status(zone)
+
+    async def composite_batch(zones: list[int]) -> None:
+        await amp.zone_statuses(zones)
+
+    print(f'{len(zones)} zones x {args.rounds} rounds ({port})')
+    await measure('dump (Z{zone})', args.rounds, zones, dump)
+    amp.enable_composite_status()
+    await measure('composite per zone', args.rounds, zones, composite)
+    await measure('composite, one batch', args.rounds, zones, composite_batch)
+    await amp.close()
+
+
+parser = argparse.ArgumentParser(description='ZPR68 zone status benchmark')
+parser.add_argument('--tty', help='serial port of a real amp (default: simulated)')
+parser.add_argument(
+    '--rounds', type=int, default=5, help='reads of every zone per method'
+)
+parser.add_argument('--baud', type=int, default=9600, help='simulated line rate')
+parser.add_argument(
+    '--latency', type=float, default=0.01, help='simulated seconds per reply'
+)
+
+asyncio.run(main(parser.parse_args()))
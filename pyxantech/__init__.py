@@ -13,48 +13,96 @@ Example usage:
     amp = await async_get_amp_controller('xantech8', '/dev/ttyUSB0', loop)
     status = await amp.zone_status(1)
     await amp.set_volume(1, 20)
+
+    # Synchronous, backed by the shared async engine thread
+    amp = get_amp_controller('xantech8', '/dev/ttyUSB0', use_engine=True)
+    status = amp.zone_status(1)
 """
 
 from __future__ import annotations
 
-import asyncio
-import logging
-import re
-import time
 from abc import ABC, abstractmethod
+import asyncio
 from dataclasses import dataclass, field
-from functools import wraps
+from functools import cache, wraps
+import logging
 from threading import RLock
+import time
 from typing import TYPE_CHECKING, Any
 
 import serial
 
+from .baud import (
+    BAUD_RATES,
+    candidate_baud_rates,
+    default_baud_cache_path,
+    load_cached_baud,
+    save_cached_baud,
+)
+from .capture import CaptureWriter
+from .chassis import ChassisLayout, get_chassis_layout
 from .config import (
     DEVICE_CONFIG,
+    LEVEL_TABLES,
     PROTOCOL_CONFIG,
     RS232_RESPONSE_PATTERNS,
     get_with_log,
 )
+from .dispatch import FLAT_FEATURE, CompiledCommand, lookup
+from .engine import AsyncEngine, get_engine
+from .events import ZoneChangeEvent, ZoneStateTracker
+from .health import (
+    BREAKER_OPEN,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_HEALTH_INTERVAL,
+    DEFAULT_RESET_TIMEOUT,
+    AmpUnavailableError,
+    CircuitBreaker,
+    LinkStateEvent,
+)
+from .history import DEFAULT_HISTORY_SIZE, ZoneHistory
+from .levels import LevelTable, statuses_to_db
 from .protocol import (
+    BACKPRESSURE_WAIT,
     CONF_COMMAND_EOL,
     CONF_COMMAND_SEPARATOR,
     CONF_RESPONSE_EOL,
+    DEFAULT_MAX_QUEUE_SIZE,
+    QueueFullError,
+    QueueMetrics,
+    RequestDroppedError,
     RS232ControlProtocol,
     async_get_rs232_protocol,
+    log_timeout,
+    resolve_deadline,
 )
+from .ramp import plan_ramp
+from .snapshot import DEFAULT_SNAPSHOT_INTERVAL, load_snapshot
+from .trace import TRACE_RECEIVE, TRACE_SEND, TRACE_TIMEOUT, CommandTrace
 
 if TYPE_CHECKING:
     from asyncio import AbstractEventLoop
-    from collections.abc import Callable, KeysView
+    from collections.abc import Callable, Coroutine, Iterable, KeysView, Mapping
+    from pathlib import Path
 
 __all__ = [
     'ZoneStatus',
+    'ZoneChangeEvent',
     'AmpControlBase',
+    'AmpControlAsyncBase',
+    'CommandTrace',
     'get_amp_controller',
     'async_get_amp_controller',
     'get_async_monoprice',
+    'get_engine',
+    'QueueFullError',
+    'AmpUnavailableError',
+    'RequestDroppedError',
     'SUPPORTED_AMP_TYPES',
     'BAUD_RATES',
+    'negotiate_baud',
+    'zone_status_queries',
+    'parse_zone_status',
     'MONOPRICE6',
 ]
 
@@ -62,12 +110,14 @@ LOG = logging.getLogger(__name__)
 
 # backwards compatibility constant
 MONOPRICE6 = 'monoprice6'
-BAUD_RATES = [9600, 14400, 19200, 38400, 57600, 115200]
 
 SUPPORTED_AMP_TYPES: KeysView[str] = DEVICE_CONFIG.keys()
 
 CONF_SERIAL_CONFIG = 'rs232'
 
+DEFAULT_BAUD_PROBE_TIMEOUT = 0.3
+DEFAULT_IDEMPOTENT_MAX_AGE = 30.0
+
 
 def get_device_config(
     amp_type: str,
@@ -102,6 +152,12 @@ def get_protocol_config(amp_type: str, key: str) -> Any:
     return PROTOCOL_CONFIG[protocol].get(key)
 
 
+_BOOL_FIELDS = frozenset(
+    {'power', 'mute', 'paged', 'linked', 'pa', 'do_not_disturb', 'keypad'}
+)
+_INT_FIELDS = frozenset({'zone', 'volume', 'treble', 'bass', 'balance', 'source'})
+
+
 @dataclass
 class ZoneStatus:
     """Represents the current status of an amplifier zone.
@@ -169,15 +225,12 @@ class ZoneStatus:
         Returns:
             ZoneStatus instance with parsed values.
         """
-        bool_keys = {'power', 'mute', 'paged', 'linked', 'pa', 'do_not_disturb', 'keypad'}
-        int_keys = {'zone', 'volume', 'treble', 'bass', 'balance', 'source'}
-
         parsed: dict[str, Any] = {'_raw': data.copy()}
 
         for key, value in data.items():
-            if key in bool_keys:
+            if key in _BOOL_FIELDS:
                 parsed[key] = value in ('1', '01', True, 1)
-            elif key in int_keys:
+            elif key in _INT_FIELDS:
                 try:
                     parsed[key] = int(value)
                 except (ValueError, TypeError):
@@ -229,14 +282,609 @@ class ZoneStatus:
         return cls.from_dict(match_dict)
 
 
-class AmpControlBase(ABC):
-    """Abstract base class for amplifier control interfaces.
+class _AmpControlCommon:
+    """State and helpers shared by the sync and async controllers."""
+
+    _amp_type: str
+    _tracker: ZoneStateTracker
+    _trace: CommandTrace
+    _breaker: CircuitBreaker
+    _layout: ChassisLayout
+    _present_units: set[int] | None = None
+    _history: ZoneHistory | None = None
+    _idempotent_max_age: float | None = None
+    _idempotent_since = 0.0
+    _suppressed_writes: dict[str, int]
+    _composite_reads: bool = False
+
+    @property
+    def amp_type(self) -> str:
+        """Amplifier type (e.g., 'xantech8')."""
+        return self._amp_type
+
+    @property
+    def tracker(self) -> ZoneStateTracker:
+        """Cache of the last known state of every zone."""
+        return self._tracker
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """Circuit breaker guarding the serial link (see link_state)."""
+        return self._breaker
+
+    @property
+    def trace(self) -> CommandTrace:
+        """Ring buffer of recent serial commands and replies (see dump())."""
+        return self._trace
+
+    @property
+    def layout(self) -> ChassisLayout:
+        """Zone-to-chassis addressing for this amp's series."""
+        return self._layout
+
+    @property
+    def present_units(self) -> tuple[int, ...]:
+        """Chassis found by probe_chassis() (every unit until probed)."""
+        if self._present_units is None:
+            return self._layout.units
+        return tuple(sorted(self._present_units))
+
+    @property
+    def present_zones(self) -> tuple[int, ...]:
+        """Zones on chassis found by probe_chassis()."""
+        return tuple(
+            zone for unit in self.present_units for zone in self._layout.zones_of(unit)
+        )
+
+    def cached_status(self, zone: int) -> dict[str, Any] | None:
+        """Return the last known status of a zone without querying the amp.
+
+        Args:
+            zone: Zone number.
+
+        Returns:
+            Dictionary with zone status or None if the zone was never read.
+        """
+        status = self._tracker.get(zone)
+        return status.dict if status else None
+
+    @property
+    def link_state(self) -> str:
+        """Circuit breaker state: 'closed', 'open' or 'half_open'.
+
+        While open, calls fail immediately with AmpUnavailableError instead of
+        waiting for the serial timeout (see pyxantech.health).
+        """
+        return self._breaker.state
+
+    def add_link_listener(
+        self, listener: Callable[[LinkStateEvent], None]
+    ) -> Callable[[], None]:
+        """Register a callback for circuit breaker state changes.
+
+        Args:
+            listener: Called with a LinkStateEvent on every transition.
+
+        Returns:
+            Callable that removes the listener.
+        """
+        return self._breaker.add_listener(listener)
+
+    def is_stale(self, zone: int) -> bool:
+        """Whether a zone's cached status is provisional (from a snapshot)."""
+        return self._tracker.is_stale(zone)
+
+    def save_snapshot(self) -> None:
+        """Persist the cached zone state now (no-op without snapshot_path)."""
+        self._tracker.save()
+
+    def add_change_listener(
+        self, listener: Callable[[ZoneChangeEvent], None]
+    ) -> Callable[[], None]:
+        """Register a callback for zone attribute changes.
+
+        Args:
+            listener: Called with a ZoneChangeEvent for each changed attribute.
+
+        Returns:
+            Callable that removes the listener.
+        """
+        return self._tracker.add_listener(listener)
+
+    def subscribe_changes(self, maxsize: int = 0) -> asyncio.Queue[ZoneChangeEvent]:
+        """Return an asyncio queue receiving zone change events.
+
+        Args:
+            maxsize: Maximum queue size (0 for unbounded).
+
+        Returns:
+            Queue of ZoneChangeEvent bound to the running event loop.
+        """
+        return self._tracker.subscribe(maxsize)
+
+    def unsubscribe_changes(self, queue: asyncio.Queue[ZoneChangeEvent]) -> None:
+        """Stop delivering change events to a queue from subscribe_changes()."""
+        self._tracker.unsubscribe(queue)
+
+    @property
+    def history(self) -> ZoneHistory | None:
+        """Zone change history, once enabled with record_history()."""
+        return self._history
+
+    def record_history(self, size: int = DEFAULT_HISTORY_SIZE) -> ZoneHistory:
+        """Start recording zone attribute changes in memory.
+
+        The currently cached state is recorded first. Calling this again
+        returns the existing recorder.
+
+        Args:
+            size: Changes kept per zone (see pyxantech.history).
+
+        Returns:
+            The ZoneHistory receiving this controller's changes.
+        """
+        if self._history is None:
+            history = ZoneHistory(size)
+            for zone, status in self._tracker.zones.items():
+                for name, value in status.dict.items():
+                    history.record(ZoneChangeEvent(zone, name, None, value))
+            history.attach(self._tracker.add_listener)
+            self._history = history
+        return self._history
+
+    def enable_idempotent_writes(
+        self, max_age: float = DEFAULT_IDEMPOTENT_MAX_AGE
+    ) -> None:
+        """Skip set_* writes that would not change the amp's known state.
+
+        A write is suppressed only when the zone was read from the amp within
+        max_age seconds, after this mode was enabled (and not merely loaded
+        from a snapshot), and the cached value already equals the requested
+        one. Stale or unknown state always goes to the wire. While enabled,
+        sent values are merged into the cached state, so it keeps following
+        the writes until the next read resyncs it. update_zone() skips
+        fields the same way.
+
+        Args:
+            max_age: Seconds a zone read stays fresh enough to trust.
+        """
+        if self._idempotent_max_age is None:
+            # writes made while disabled were not merged into the cache
+            self._idempotent_since = time.monotonic()
+        self._idempotent_max_age = max_age
+        if not hasattr(self, '_suppressed_writes'):
+            self._suppressed_writes = {}
+
+    def disable_idempotent_writes(self) -> None:
+        """Send every set_* write again (counters are kept)."""
+        self._idempotent_max_age = None
+
+    @property
+    def suppressed_writes(self) -> dict[str, int]:
+        """Writes skipped by enable_idempotent_writes(), by ZoneStatus field."""
+        return dict(getattr(self, '_suppressed_writes', {}))
+
+    def enable_composite_status(self) -> None:
+        """Read zone status with per-attribute queries where the protocol has them.
+
+        For protocols listing 'zone_status_commands' (zpr68), zone_status()
+        and zone_statuses() then send one query per attribute instead of the
+        single status dump. This costs one paced round trip per attribute
+        (~306 ms against ~60 ms per zpr68 zone), so the dump stays the
+        default. Fields without a query, or whose reply did not parse, are
+        left out of the returned status.
+        """
+        self._composite_reads = True
+
+    def disable_composite_status(self) -> None:
+        """Read zone status with the protocol's single status query again."""
+        self._composite_reads = False
+
+    def _composite_status_queries(self, zone: int) -> list[bytes] | None:
+        """Per-attribute status queries, if enabled and the protocol has them."""
+        if not self._composite_reads:
+            return None
+        return _composite_status_queries(self._amp_type, zone)
+
+    def _write_redundant(
+        self, zone: int, name: str, value: Any, max_age: float | None = None
+    ) -> bool:
+        """Whether a write matches fresh known state (and count it if so).
+
+        Args:
+            zone: Zone number.
+            name: ZoneStatus field written.
+            value: Requested value.
+            max_age: Freshness limit (defaults to the idempotent write mode's;
+                without one nothing is redundant).
+        """
+        if max_age is None:
+            max_age = self._idempotent_max_age
+            if max_age is None:
+                return False
+        value = _sent_value(self._amp_type, name, value)
+        if not self._known_fresh(zone, name, value, max_age):
+            return False
+        self._count_suppressed(name)
+        LOG.debug('Suppressed redundant write: zone=%s, %s=%s', zone, name, value)
+        return True
+
+    def _known_fresh(self, zone: int, name: str, value: Any, max_age: float) -> bool:
+        """Whether a zone was read within max_age and its field equals value.
+
+        Reads from before idempotent write mode was enabled are not trusted.
+        """
+        age = self._tracker.age(zone)
+        max_age = min(max_age, time.monotonic() - self._idempotent_since)
+        if age is None or age > max_age or self._tracker.is_stale(zone):
+            return False
+        status = self._tracker.get(zone)
+        return status is not None and getattr(status, name) == value
+
+    def _count_suppressed(self, name: str, count: int = 1) -> None:
+        if not hasattr(self, '_suppressed_writes'):
+            self._suppressed_writes = {}
+        self._suppressed_writes[name] = self._suppressed_writes.get(name, 0) + count
+
+    def _record_write(self, zone: int, name: str, value: Any) -> None:
+        """Merge a sent value into the cached state in idempotent write mode."""
+        self._record_writes(zone, {name: value})
+
+    def _record_writes(self, zone: int, values: dict[str, Any]) -> None:
+        """Merge sent values (as clamped on the wire) in idempotent write mode."""
+        if self._idempotent_max_age is None:
+            return
+        self._tracker.merge(
+            zone,
+            {
+                name: _sent_value(self._amp_type, name, value)
+                for name, value in values.items()
+            },
+        )
+
+    def _forget_writes(self, zones: Iterable[int]) -> None:
+        """Distrust the cached state of zones a write changed in unknown ways.
+
+        In idempotent write mode the zones are marked stale, so no later write
+        to them is suppressed until they are read again.
+        """
+        if self._idempotent_max_age is None:
+            return
+        self._tracker.mark_stale(zones)
+
+    def _record_all_off(self) -> None:
+        """Merge the power-off of every zone in idempotent write mode."""
+        for zone in list(self._tracker.zones):
+            self._record_write(zone, 'power', False)
+
+    def _plan_update(
+        self, zone: int, values: dict[str, Any]
+    ) -> tuple[dict[str, Any], list[bytes]]:
+        """Order, filter and encode the writes of an update_zone() call.
+
+        Returns:
+            Tuple of the values to send (in send order) and the commands,
+            combined into one write where the protocol allows it.
+
+        Raises:
+            ValueError: If the zone, a field or a value is invalid.
+        """
+        for name in values:
+            if name not in _UPDATE_COMMANDS:
+                raise ValueError(f'Cannot update zone field {name!r}')
+        _check_zone(self._amp_type, zone)
+
+        changes = {
+            name: values[name]
+            for name in _UPDATE_COMMANDS
+            if values.get(name) is not None
+            and not self._write_redundant(zone, name, values[name])
+        }
+        commands = [
+            _UPDATE_COMMANDS[name](self._amp_type, zone, value)
+            for name, value in changes.items()
+        ]
+        return changes, _combine_commands(self._amp_type, commands)
+
+    def _plan_many(
+        self, name: str, zones: Iterable[int], value: Any
+    ) -> tuple[list[int], list[bytes]]:
+        """Plan writing one value to several zones.
+
+        A broadcast command is used when the protocol has one and the zones
+        cover every zone of every present chassis (see probe_chassis()),
+        since the protocols' all-zones commands address the whole chain;
+        otherwise one command per zone, combined into one write where the
+        protocol allows it. In idempotent write mode zones already at the
+        value are skipped.
+
+        Returns:
+            Tuple of the zones written and the commands to send.
+
+        Raises:
+            ValueError: If a zone or the value is invalid.
+        """
+        targets = list(dict.fromkeys(zones))
+        if not targets:
+            return [], []
+        # validates every zone and the value before anything is sent
+        commands = {
+            zone: _UPDATE_COMMANDS[name](self._amp_type, zone, value)
+            for zone in targets
+        }
+
+        broadcast = _broadcast_cmd(self._amp_type, name, value)
+        if broadcast is not None and set(self.present_zones) <= set(targets):
+            sent = _sent_value(self._amp_type, name, value)
+            max_age = self._idempotent_max_age
+            if max_age is not None and all(
+                self._known_fresh(zone, name, sent, max_age) for zone in targets
+            ):
+                self._count_suppressed(name, len(targets))
+                return [], []
+            return targets, [broadcast]
+
+        pending = [
+            zone for zone in targets if not self._write_redundant(zone, name, value)
+        ]
+        return pending, _combine_commands(
+            self._amp_type, [commands[zone] for zone in pending]
+        )
+
+    def level_table(self, name: str) -> LevelTable:
+        """Return the step-to-dB table of a level field.
+
+        Args:
+            name: 'volume', 'bass', 'treble' or 'balance'.
+
+        Raises:
+            ValueError: If the series has no dB table for the field.
+        """
+        table = LEVEL_TABLES.get(self._amp_type, {}).get(name)
+        if table is None:
+            raise ValueError(f'No dB table for {name} on amp type {self._amp_type}')
+        return table
+
+    def volume_db(self, zone: int) -> float | None:
+        """Return a zone's cached volume in dB (None if never read)."""
+        status = self._tracker.get(zone)
+        if status is None:
+            return None
+        return self.level_table('volume').to_db(status.volume)
+
+    def levels_db(self) -> dict[int, dict[str, float]]:
+        """Return the cached volume/tone/balance of every zone in dB.
+
+        Fields the series has no dB table for are omitted.
+        """
+        statuses = {zone: status.dict for zone, status in self._tracker.zones.items()}
+        return statuses_to_db(LEVEL_TABLES.get(self._amp_type, {}), statuses)
+
+
+class AmpControlBase(_AmpControlCommon, ABC):
+    """Abstract base class for synchronous amplifier control interfaces.
+
+    Async controllers implement the same methods as coroutines (see
+    AmpControlAsyncBase).
+
+    Every command method accepts keyword-only timeout (seconds, including time
+    spent waiting for the port) and deadline (absolute time.monotonic()) limits.
+    A request whose limit passes before it is sent is never sent.
+    """
+
+    @abstractmethod
+    def zone_status(
+        self,
+        zone: int,
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> dict[str, Any] | None:
+        """Get the current status of a zone.
+
+        Args:
+            zone: Zone number (format varies by amp type, e.g., 11-16 for unit 1).
+
+        Returns:
+            Dictionary with zone status or None if unavailable.
+        """
+
+    @abstractmethod
+    def set_power(
+        self,
+        zone: int,
+        power: bool,
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> None:
+        """Set zone power state.
+
+        Args:
+            zone: Zone number.
+            power: True to turn on, False to turn off.
+        """
+
+    @abstractmethod
+    def set_mute(
+        self,
+        zone: int,
+        mute: bool,
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> None:
+        """Set zone mute state.
+
+        Args:
+            zone: Zone number.
+            mute: True to mute, False to unmute.
+        """
+
+    @abstractmethod
+    def set_volume(
+        self,
+        zone: int,
+        volume: int,
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> None:
+        """Set zone volume level.
+
+        Args:
+            zone: Zone number.
+            volume: Volume level (0 to max_volume, typically 38).
+        """
+
+    @abstractmethod
+    def set_treble(
+        self,
+        zone: int,
+        treble: int,
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> None:
+        """Set zone treble level.
+
+        Args:
+            zone: Zone number.
+            treble: Treble level (typically 0-14, where 7 is neutral).
+        """
+
+    @abstractmethod
+    def set_bass(
+        self,
+        zone: int,
+        bass: int,
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> None:
+        """Set zone bass level.
+
+        Args:
+            zone: Zone number.
+            bass: Bass level (typically 0-14, where 7 is neutral).
+        """
+
+    @abstractmethod
+    def set_balance(
+        self,
+        zone: int,
+        balance: int,
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> None:
+        """Set zone balance.
+
+        Args:
+            zone: Zone number.
+            balance: Balance level (0=left, 10=center, 20=right typically).
+        """
+
+    @abstractmethod
+    def set_source(
+        self,
+        zone: int,
+        source: int,
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> None:
+        """Set zone input source.
+
+        Args:
+            zone: Zone number.
+            source: Source input number (1-6 or 1-8 depending on amp).
+        """
+
+    @abstractmethod
+    def restore_zone(
+        self,
+        status: dict[str, Any],
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> None:
+        """Restore zone to a previously saved state.
+
+        Args:
+            status: Dictionary with zone status to restore.
+        """
+
+    @abstractmethod
+    def get_power(
+        self,
+        zone: int,
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> bool | None:
+        """Read a zone's power state with a single-attribute query.
+
+        Args:
+            zone: Zone number.
+
+        Returns:
+            Power state, or None if the reply could not be parsed.
+        """
+
+    @abstractmethod
+    def probe_chassis(
+        self,
+        *,
+        force: bool = False,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> tuple[int, ...]:
+        """Find which chained chassis answer, reading one zone per unit.
+
+        Args:
+            force: Probe again even if already probed.
+
+        Returns:
+            Chassis numbers that responded.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Save the zone snapshot and release the serial port."""
+
+    def set_volume_db(self, zone: int, db: float, **kwargs: Any) -> None:
+        """Set zone volume to the step nearest a dB level (0 dB is maximum)."""
+        self.set_volume(zone, self.level_table('volume').to_step(db), **kwargs)
+
+    def set_bass_db(self, zone: int, db: float, **kwargs: Any) -> None:
+        """Set zone bass to the step nearest a dB boost or cut."""
+        self.set_bass(zone, self.level_table('bass').to_step(db), **kwargs)
+
+    def set_treble_db(self, zone: int, db: float, **kwargs: Any) -> None:
+        """Set zone treble to the step nearest a dB boost or cut."""
+        self.set_treble(zone, self.level_table('treble').to_step(db), **kwargs)
+
+    def set_balance_db(self, zone: int, db: float, **kwargs: Any) -> None:
+        """Set zone balance to the step nearest a dB offset (positive is right)."""
+        self.set_balance(zone, self.level_table('balance').to_step(db), **kwargs)
+
+
+class AmpControlAsyncBase(_AmpControlCommon, ABC):
+    """Abstract base class for asyncio amplifier control interfaces.
 
-    Defines the common interface for both sync and async implementations.
+    Mirrors AmpControlBase with coroutine methods, and the same keyword-only
+    timeout and deadline limits.
     """
 
     @abstractmethod
-    def zone_status(self, zone: int) -> dict[str, Any] | None:
+    async def zone_status(
+        self,
+        zone: int,
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> dict[str, Any] | None:
         """Get the current status of a zone.
 
         Args:
@@ -247,7 +895,14 @@ class AmpControlBase(ABC):
         """
 
     @abstractmethod
-    def set_power(self, zone: int, power: bool) -> None:
+    async def set_power(
+        self,
+        zone: int,
+        power: bool,
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> None:
         """Set zone power state.
 
         Args:
@@ -256,7 +911,14 @@ class AmpControlBase(ABC):
         """
 
     @abstractmethod
-    def set_mute(self, zone: int, mute: bool) -> None:
+    async def set_mute(
+        self,
+        zone: int,
+        mute: bool,
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> None:
         """Set zone mute state.
 
         Args:
@@ -265,7 +927,14 @@ class AmpControlBase(ABC):
         """
 
     @abstractmethod
-    def set_volume(self, zone: int, volume: int) -> None:
+    async def set_volume(
+        self,
+        zone: int,
+        volume: int,
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> None:
         """Set zone volume level.
 
         Args:
@@ -274,7 +943,14 @@ class AmpControlBase(ABC):
         """
 
     @abstractmethod
-    def set_treble(self, zone: int, treble: int) -> None:
+    async def set_treble(
+        self,
+        zone: int,
+        treble: int,
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> None:
         """Set zone treble level.
 
         Args:
@@ -283,7 +959,14 @@ class AmpControlBase(ABC):
         """
 
     @abstractmethod
-    def set_bass(self, zone: int, bass: int) -> None:
+    async def set_bass(
+        self,
+        zone: int,
+        bass: int,
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> None:
         """Set zone bass level.
 
         Args:
@@ -292,7 +975,14 @@ class AmpControlBase(ABC):
         """
 
     @abstractmethod
-    def set_balance(self, zone: int, balance: int) -> None:
+    async def set_balance(
+        self,
+        zone: int,
+        balance: int,
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> None:
         """Set zone balance.
 
         Args:
@@ -301,7 +991,14 @@ class AmpControlBase(ABC):
         """
 
     @abstractmethod
-    def set_source(self, zone: int, source: int) -> None:
+    async def set_source(
+        self,
+        zone: int,
+        source: int,
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> None:
         """Set zone input source.
 
         Args:
@@ -310,15 +1007,77 @@ class AmpControlBase(ABC):
         """
 
     @abstractmethod
-    def restore_zone(self, status: dict[str, Any]) -> None:
+    async def restore_zone(
+        self,
+        status: dict[str, Any],
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> None:
         """Restore zone to a previously saved state.
 
         Args:
             status: Dictionary with zone status to restore.
         """
 
+    @abstractmethod
+    async def get_power(
+        self,
+        zone: int,
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> bool | None:
+        """Read a zone's power state with a single-attribute query.
+
+        Args:
+            zone: Zone number.
+
+        Returns:
+            Power state, or None if the reply could not be parsed.
+        """
+
+    @abstractmethod
+    async def probe_chassis(
+        self,
+        *,
+        force: bool = False,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> tuple[int, ...]:
+        """Find which chained chassis answer, reading one zone per unit.
+
+        Args:
+            force: Probe again even if already probed.
+
+        Returns:
+            Chassis numbers that responded.
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Save the zone snapshot and release the serial port."""
 
-def _command(amp_type: str, format_code: str, args: dict[str, Any] | None = None) -> bytes:
+    async def set_volume_db(self, zone: int, db: float, **kwargs: Any) -> None:
+        """Set zone volume to the step nearest a dB level (0 dB is maximum)."""
+        await self.set_volume(zone, self.level_table('volume').to_step(db), **kwargs)
+
+    async def set_bass_db(self, zone: int, db: float, **kwargs: Any) -> None:
+        """Set zone bass to the step nearest a dB boost or cut."""
+        await self.set_bass(zone, self.level_table('bass').to_step(db), **kwargs)
+
+    async def set_treble_db(self, zone: int, db: float, **kwargs: Any) -> None:
+        """Set zone treble to the step nearest a dB boost or cut."""
+        await self.set_treble(zone, self.level_table('treble').to_step(db), **kwargs)
+
+    async def set_balance_db(self, zone: int, db: float, **kwargs: Any) -> None:
+        """Set zone balance to the step nearest a dB offset (positive is right)."""
+        await self.set_balance(zone, self.level_table('balance').to_step(db), **kwargs)
+
+
+def _command(
+    amp_type: str, format_code: str, args: dict[str, Any] | None = None
+) -> bytes:
     """Build a command string for the amplifier.
 
     Args:
@@ -341,108 +1100,459 @@ def _command(amp_type: str, format_code: str, args: dict[str, Any] | None = None
     return command.format(**args).encode('ascii')
 
 
+def _check_zone(amp_type: str, zone: int) -> None:
+    """Raise ValueError unless the series can address the zone.
+
+    Accepts the series zones and any alternative (chassis-encoded) zone ids.
+    """
+    if zone not in get_chassis_layout(amp_type):
+        raise ValueError(f'Invalid zone {zone} for amp type {amp_type}')
+
+
 def _zone_status_cmd(amp_type: str, zone: int) -> bytes:
     """Build zone status query command."""
-    zones = get_device_config(amp_type, 'zones')
-    if zone not in zones:
-        raise ValueError(f'Invalid zone {zone} for amp type {amp_type}')
+    _check_zone(amp_type, zone)
     return _command(amp_type, 'zone_status', args={'zone': zone})
 
 
 def _set_power_cmd(amp_type: str, zone: int, power: bool) -> bytes:
     """Build power control command."""
-    zones = get_device_config(amp_type, 'zones')
-    if zone not in zones:
-        raise ValueError(f'Invalid zone {zone} for amp type {amp_type}')
+    _check_zone(amp_type, zone)
 
     if power:
-        LOG.info('Powering on zone: amp_type=%s, zone=%s', amp_type, zone)
         return _command(amp_type, 'power_on', {'zone': zone})
-    else:
-        LOG.info('Powering off zone: amp_type=%s, zone=%s', amp_type, zone)
-        return _command(amp_type, 'power_off', {'zone': zone})
+    return _command(amp_type, 'power_off', {'zone': zone})
 
 
 def _set_mute_cmd(amp_type: str, zone: int, mute: bool) -> bytes:
     """Build mute control command."""
-    zones = get_device_config(amp_type, 'zones')
-    if zone not in zones:
-        raise ValueError(f'Invalid zone {zone} for amp type {amp_type}')
+    _check_zone(amp_type, zone)
 
     if mute:
-        LOG.info('Muting zone: amp_type=%s, zone=%s', amp_type, zone)
         return _command(amp_type, 'mute_on', {'zone': zone})
-    else:
-        LOG.info('Unmuting zone: amp_type=%s, zone=%s', amp_type, zone)
-        return _command(amp_type, 'mute_off', {'zone': zone})
+    return _command(amp_type, 'mute_off', {'zone': zone})
+
+
+# upper limits of the level fields for series that do not set max_<field>
+_LEVEL_MAXIMUMS = {'volume': 38, 'treble': 14, 'bass': 14, 'balance': 20}
+
+
+def _clamp_level(amp_type: str, name: str, value: int) -> int:
+    """Clamp a level to the series range, as the set_* commands send it."""
+    maximum = get_device_config(amp_type, f'max_{name}') or _LEVEL_MAXIMUMS[name]
+    return int(max(0, min(value, maximum)))
+
+
+def _sent_value(amp_type: str, name: str, value: Any) -> Any:
+    """Return the value a set_* write of a ZoneStatus field puts on the wire."""
+    if name in _LEVEL_MAXIMUMS:
+        return _clamp_level(amp_type, name, value)
+    if name in _BOOL_FIELDS:
+        return bool(value)
+    return value
 
 
 def _set_volume_cmd(amp_type: str, zone: int, volume: int) -> bytes:
     """Build volume control command."""
-    zones = get_device_config(amp_type, 'zones')
-    if zone not in zones:
-        raise ValueError(f'Invalid zone {zone} for amp type {amp_type}')
+    _check_zone(amp_type, zone)
 
-    max_volume = get_device_config(amp_type, 'max_volume') or 38
-    volume = int(max(0, min(volume, max_volume)))
-    LOG.info('Setting volume: amp_type=%s, zone=%s, volume=%s', amp_type, zone, volume)
+    volume = _clamp_level(amp_type, 'volume', volume)
     return _command(amp_type, 'set_volume', args={'zone': zone, 'volume': volume})
 
 
 def _set_treble_cmd(amp_type: str, zone: int, treble: int) -> bytes:
     """Build treble control command."""
-    zones = get_device_config(amp_type, 'zones')
-    if zone not in zones:
-        raise ValueError(f'Invalid zone {zone} for amp type {amp_type}')
+    _check_zone(amp_type, zone)
 
-    max_treble = get_device_config(amp_type, 'max_treble') or 14
-    treble = int(max(0, min(treble, max_treble)))
-    LOG.info('Setting treble: amp_type=%s, zone=%s, treble=%s', amp_type, zone, treble)
+    treble = _clamp_level(amp_type, 'treble', treble)
     return _command(amp_type, 'set_treble', args={'zone': zone, 'treble': treble})
 
 
 def _set_bass_cmd(amp_type: str, zone: int, bass: int) -> bytes:
     """Build bass control command."""
-    zones = get_device_config(amp_type, 'zones')
-    if zone not in zones:
-        raise ValueError(f'Invalid zone {zone} for amp type {amp_type}')
+    _check_zone(amp_type, zone)
 
-    max_bass = get_device_config(amp_type, 'max_bass') or 14
-    bass = int(max(0, min(bass, max_bass)))
-    LOG.info('Setting bass: amp_type=%s, zone=%s, bass=%s', amp_type, zone, bass)
+    bass = _clamp_level(amp_type, 'bass', bass)
     return _command(amp_type, 'set_bass', args={'zone': zone, 'bass': bass})
 
 
 def _set_balance_cmd(amp_type: str, zone: int, balance: int) -> bytes:
     """Build balance control command."""
-    zones = get_device_config(amp_type, 'zones')
-    if zone not in zones:
-        raise ValueError(f'Invalid zone {zone} for amp type {amp_type}')
+    _check_zone(amp_type, zone)
 
-    max_balance = get_device_config(amp_type, 'max_balance') or 20
-    balance = max(0, min(balance, max_balance))
-    LOG.info('Setting balance: amp_type=%s, zone=%s, balance=%s', amp_type, zone, balance)
+    balance = _clamp_level(amp_type, 'balance', balance)
     return _command(amp_type, 'set_balance', args={'zone': zone, 'balance': balance})
 
 
 def _set_source_cmd(amp_type: str, zone: int, source: int) -> bytes:
     """Build source selection command."""
-    zones = get_device_config(amp_type, 'zones')
+    _check_zone(amp_type, zone)
     sources = get_device_config(amp_type, 'sources')
-
-    if zone not in zones:
-        raise ValueError(f'Invalid zone {zone} for amp type {amp_type}')
     if source not in sources:
         raise ValueError(f'Invalid source {source} for amp type {amp_type}')
 
-    LOG.info('Setting source: amp_type=%s, zone=%s, source=%s', amp_type, zone, source)
     return _command(amp_type, 'set_source', args={'zone': zone, 'source': source})
 
 
+# update_zone() send order: power first so later settings take, volume last
+# so the new source and tone are in place before the level changes
+_UPDATE_COMMANDS: dict[str, Callable[[str, int, Any], bytes]] = {
+    'power': _set_power_cmd,
+    'source': _set_source_cmd,
+    'treble': _set_treble_cmd,
+    'bass': _set_bass_cmd,
+    'balance': _set_balance_cmd,
+    'mute': _set_mute_cmd,
+    'volume': _set_volume_cmd,
+}
+
+
+def _broadcast_cmd(amp_type: str, name: str, value: Any) -> bytes | None:
+    """Build the protocol's all-zones command for a field, if it has one.
+
+    The value is clamped and validated as for the per-zone commands.
+
+    Raises:
+        ValueError: If the source is invalid.
+    """
+    args: dict[str, Any] = {}
+    if name == 'power':
+        format_code = 'all_zones_on' if value else 'all_zones_off'
+    elif name == 'mute':
+        format_code = 'mute_all_on' if value else 'mute_all_off'
+    elif name == 'volume':
+        format_code = 'set_volume_all'
+        args['volume'] = _clamp_level(amp_type, 'volume', value)
+    elif name == 'source':
+        if value not in get_device_config(amp_type, 'sources'):
+            raise ValueError(f'Invalid source {value} for amp type {amp_type}')
+        format_code = 'set_source_all'
+        args['source'] = value
+    else:
+        return None
+    if format_code not in (get_protocol_config(amp_type, 'commands') or {}):
+        return None
+    return _command(amp_type, format_code, args)
+
+
+def _combine_commands(amp_type: str, commands: list[bytes]) -> list[bytes]:
+    """Join commands into one write when the protocol separates commands.
+
+    Protocols with a command separator (e.g. '+' or '#') accept several
+    commands on one line, terminated once by the command EOL.
+    """
+    separator = get_protocol_config(amp_type, CONF_COMMAND_SEPARATOR) or ''
+    if not separator or len(commands) < 2:
+        return commands
+    eol = (get_protocol_config(amp_type, CONF_COMMAND_EOL) or '').encode('ascii')
+    if eol:
+        commands = [command.removesuffix(eol) for command in commands]
+    return [b''.join(commands) + eol]
+
+
+def _volume_step_cmd(
+    amp_type: str, zone: int, current: int | None, volume: int
+) -> bytes:
+    """Build the cheapest command moving a zone from current to volume.
+
+    Uses the native volume_up/volume_down commands for single steps where the
+    protocol defines them, otherwise an absolute set_volume.
+    """
+    commands = get_protocol_config(amp_type, 'commands') or {}
+    if current is not None:
+        delta = volume - current
+        if delta == 1 and 'volume_up' in commands:
+            return _command(amp_type, 'volume_up', {'zone': zone})
+        if delta == -1 and 'volume_down' in commands:
+            return _command(amp_type, 'volume_down', {'zone': zone})
+    return _set_volume_cmd(amp_type, zone, volume)
+
+
+# single-attribute replies spell a true boolean differently per protocol
+_TRUE_VALUES = frozenset({'1', '01', 'Y', 'ON'})
+_REFRESH_FIELDS = ('power', 'mute', 'volume', 'source', 'treble', 'bass', 'balance')
+
+
+@cache
+def _field_status_commands(amp_type: str) -> frozenset[str]:
+    """Fields with both a '<field>_status' query and a response pattern."""
+    protocol = get_device_config(amp_type, 'protocol')
+    commands = get_protocol_config(amp_type, 'commands') or {}
+    patterns = RS232_RESPONSE_PATTERNS.get(protocol, {})
+    return frozenset(
+        field
+        for field in _REFRESH_FIELDS
+        if f'{field}_status' in commands and f'{field}_status' in patterns
+    )
+
+
+def _refresh_queries(
+    amp_type: str, zone: int, fields: Iterable[str] | None
+) -> tuple[tuple[str, ...], list[bytes] | None]:
+    """Plan a partial refresh of a zone.
+
+    Args:
+        amp_type: Amplifier type identifier.
+        zone: Zone number.
+        fields: ZoneStatus fields to read (None for every refreshable field).
+
+    Returns:
+        Tuple of the fields to read and one query per field, or None instead
+        of the queries when a field has no single-attribute query and the
+        full zone status must be read.
+
+    Raises:
+        ValueError: If the zone or a field is invalid.
+    """
+    _check_zone(amp_type, zone)
+    available = _field_status_commands(amp_type)
+    if fields is None:
+        fields = tuple(available) if available else _REFRESH_FIELDS
+    else:
+        fields = tuple(dict.fromkeys(fields))
+        for name in fields:
+            if name not in _REFRESH_FIELDS:
+                raise ValueError(f'Cannot refresh zone field {name!r}')
+
+    if not fields or not available.issuperset(fields):
+        return fields, None
+    return fields, [
+        _command(amp_type, f'{name}_status', {'zone': zone}) for name in fields
+    ]
+
+
+def _parse_field_status(amp_type: str, name: str, reply: str | None) -> Any:
+    """Parse a single-attribute status reply (None if it does not match)."""
+    protocol = get_device_config(amp_type, 'protocol')
+    pattern = RS232_RESPONSE_PATTERNS[protocol][f'{name}_status']
+    match = pattern.search(reply) if reply else None
+    if match is None:
+        LOG.debug('Could not match %s status: string=%s', name, reply)
+        return None
+
+    value = match.group(name)
+    translation = (get_protocol_config(amp_type, 'status_translation') or {}).get(name)
+    if translation and value in translation:
+        value = translation[value]
+    if name in _BOOL_FIELDS:
+        return str(value).strip().upper() in _TRUE_VALUES
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _merge_refresh(
+    amp_type: str,
+    tracker: ZoneStateTracker,
+    zone: int,
+    fields: tuple[str, ...],
+    replies: list[str],
+) -> dict[str, Any]:
+    """Parse partial refresh replies and merge them into the cached status."""
+    values = {}
+    for name, reply in zip(fields, replies, strict=True):
+        value = _parse_field_status(amp_type, name, reply)
+        if value is not None:
+            values[name] = value
+    tracker.merge(zone, values)
+    return values
+
+
+def _composite_status_queries(amp_type: str, zone: int) -> list[bytes] | None:
+    """Build the per-attribute queries that assemble a zone status.
+
+    Returns:
+        One query per 'zone_status_commands' entry, or None when the protocol
+        reports zone status in a single frame.
+
+    Raises:
+        ValueError: If the zone is invalid.
+    """
+    names = get_protocol_config(amp_type, 'zone_status_commands')
+    if not names:
+        return None
+    _check_zone(amp_type, zone)
+    return [_command(amp_type, name, {'zone': zone}) for name in names]
+
+
+def _composite_status(
+    amp_type: str, zone: int, replies: list[str]
+) -> dict[str, Any] | None:
+    """Assemble a zone status from the replies to _composite_status_queries().
+
+    Fields the protocol has no query for (zpr68: balance) and fields whose
+    reply could not be parsed are left out rather than reported as 0.
+
+    Returns:
+        Status dictionary with the zone and every parsed field, or None if
+        no reply could be parsed.
+    """
+    status: dict[str, Any] = {'zone': zone}
+    for name, reply in zip(
+        get_protocol_config(amp_type, 'zone_status_commands'), replies, strict=True
+    ):
+        field_name = name.removesuffix('_status')
+        value = _parse_field_status(amp_type, field_name, reply)
+        if value is not None:
+            status[field_name] = value
+    return status if len(status) > 1 else None
+
+
+def _track_composite_status(
+    amp_type: str, tracker: ZoneStateTracker, status: dict[str, Any]
+) -> None:
+    """Cache a status from _composite_status().
+
+    A complete read replaces the zone's cached status; a partial one is only
+    merged into it, so unparsed fields keep their last known values.
+    """
+    values = {name: value for name, value in status.items() if name != 'zone'}
+    if len(values) == len(get_protocol_config(amp_type, 'zone_status_commands')):
+        tracker.update(ZoneStatus(**status))
+    else:
+        tracker.merge(status['zone'], values)
+
+
+def zone_status_queries(
+    amp_type: str, zone: int, *, composite: bool = False
+) -> tuple[list[bytes], int]:
+    """Build the queries that read one zone's status, for custom transports.
+
+    Args:
+        amp_type: Amplifier type (e.g., 'zpr68-10').
+        zone: Zone number.
+        composite: Use per-attribute queries where the protocol has them
+            (see AmpControlBase.enable_composite_status()).
+
+    Returns:
+        Tuple of the queries to send back to back, each awaiting one reply,
+        and the reply bytes to skip when looking for each reply's EOL.
+
+    Raises:
+        ValueError: If the zone is invalid.
+    """
+    queries = _composite_status_queries(amp_type, zone) if composite else None
+    if queries is not None:
+        return queries, 0
+    skip = get_device_config(amp_type, 'zone_status_skip', log_missing=False) or 0
+    return [_zone_status_cmd(amp_type, zone)], skip
+
+
+def parse_zone_status(
+    amp_type: str, zone: int, replies: list[str]
+) -> dict[str, Any] | None:
+    """Parse the replies to zone_status_queries() into a status dictionary.
+
+    Args:
+        amp_type: Amplifier type (e.g., 'zpr68-10').
+        zone: Zone number the queries were built for.
+        replies: One reply per query.
+
+    Returns:
+        Zone status dictionary (see AmpControlBase.zone_status()), or None
+        if the replies could not be parsed.
+    """
+    if len(replies) > 1:
+        return _composite_status(amp_type, zone, replies)
+    status = ZoneStatus.from_string(amp_type, replies[0] if replies else None)
+    return status.dict if status else None
+
+
+# dispatch entries whose reply is a full zone status (parsed and tracked)
+_ZONE_STATUS_DISPATCH = frozenset(
+    {('zone', 'status'), ('zone', 'details'), (FLAT_FEATURE, 'zone_status')}
+)
+
+
+def _dispatch_request(
+    amp_type: str, feature: str, action: str, values: dict[str, Any]
+) -> tuple[CompiledCommand, bytes, int]:
+    """Look up and encode a dispatch table command.
+
+    Returns:
+        Tuple of compiled command, encoded request and response skip bytes.
+
+    Raises:
+        ValueError: If the protocol lacks the command or a variable is invalid.
+    """
+    command = lookup(get_device_config(amp_type, 'protocol'), feature, action)
+    skip = 0
+    if (feature, action) in _ZONE_STATUS_DISPATCH:
+        skip = get_device_config(amp_type, 'zone_status_skip', log_missing=False) or 0
+    return command, command.encode(**values), skip
+
+
+def _dispatch_zones(tracker: ZoneStateTracker, values: dict[str, Any]) -> list[int]:
+    """Zones a dispatch table command may have changed.
+
+    Commands without a zone variable (e.g. all-zones commands) may have changed
+    every zone.
+    """
+    if 'zone' in values:
+        return [values['zone']]
+    return list(tracker.zones)
+
+
+def _dispatch_result(
+    amp_type: str,
+    command: CompiledCommand,
+    reply: str,
+    tracker: ZoneStateTracker,
+) -> dict[str, Any] | None:
+    """Decode the reply to a dispatch table command.
+
+    Zone status replies are parsed into ZoneStatus and fed to the tracker;
+    other replies return their named regex groups with numbers as ints.
+    """
+    if (command.feature, command.action) in _ZONE_STATUS_DISPATCH:
+        status = ZoneStatus.from_string(amp_type, reply)
+        if status is None:
+            return None
+        tracker.update(status)
+        return status.dict
+
+    groups = command.decode(reply)
+    if groups is None:
+        return None
+    return {
+        key: int(value) if value is not None and value.isdigit() else value
+        for key, value in groups.items()
+    }
+
+
+def _create_tracker(
+    amp_type: str,
+    snapshot_path: str | Path | None,
+    snapshot_interval: float,
+) -> ZoneStateTracker:
+    """Create a zone state tracker, warm-started from a snapshot if given."""
+    tracker = ZoneStateTracker()
+    if snapshot_path:
+        snapshot = load_snapshot(snapshot_path, amp_type)
+        tracker.load_provisional(
+            ZoneStatus.from_dict(data) for data in snapshot.values()
+        )
+        tracker.enable_persistence(snapshot_path, amp_type, snapshot_interval)
+        LOG.debug(
+            'Loaded zone snapshot: path=%s, zones=%d', snapshot_path, len(snapshot)
+        )
+    return tracker
+
+
 def get_amp_controller(
     amp_type: str,
     port_url: str,
     serial_config_overrides: dict[str, Any] | None = None,
+    *,
+    use_engine: bool = False,
+    capture_path: str | Path | None = None,
+    snapshot_path: str | Path | None = None,
+    snapshot_interval: float = DEFAULT_SNAPSHOT_INTERVAL,
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+    reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+    auto_baud: bool = False,
+    baud_cache_path: str | Path | None = None,
 ) -> AmpControlBase | None:
     """Create a synchronous amplifier controller.
 
@@ -450,6 +1560,21 @@ def get_amp_controller(
         amp_type: Amplifier type (e.g., 'xantech8', 'monoprice6').
         port_url: Serial port path or URL (e.g., '/dev/ttyUSB0').
         serial_config_overrides: Optional serial port configuration overrides.
+        use_engine: Run the async controller on the shared engine thread and
+            return thread-safe blocking wrappers around it.
+        capture_path: Append all serial traffic to this capture file
+            (see pyxantech.capture).
+        snapshot_path: Load provisional zone state from this file at startup
+            and persist the state table to it periodically and on close().
+        snapshot_interval: Minimum seconds between periodic snapshot saves.
+        failure_threshold: Consecutive reply timeouts after which calls fail
+            immediately with AmpUnavailableError (see pyxantech.health).
+        reset_timeout: Seconds before a trial request checks whether the amp
+            is reachable again.
+        auto_baud: Open the port at the fastest rate the amp answers at (see
+            negotiate_baud()); an explicit 'baudrate' override takes priority.
+        baud_cache_path: Negotiated rate cache (defaults to
+            $XDG_CACHE_HOME/pyxantech/baud.json).
 
     Returns:
         Synchronous amplifier control interface or None if amp_type unsupported.
@@ -458,16 +1583,50 @@ def get_amp_controller(
         serial_config_overrides = {}
 
     if amp_type not in SUPPORTED_AMP_TYPES:
-        LOG.error("Unsupported amplifier type: amp_type=%s", amp_type)
+        LOG.error('Unsupported amplifier type: amp_type=%s', amp_type)
         return None
 
+    if auto_baud:
+        serial_config_overrides = _with_negotiated_baud(
+            amp_type, port_url, serial_config_overrides, baud_cache_path
+        )
+
+    if use_engine:
+        return _get_engine_amp_controller(
+            amp_type,
+            port_url,
+            serial_config_overrides,
+            capture_path=capture_path,
+            snapshot_path=snapshot_path,
+            snapshot_interval=snapshot_interval,
+            failure_threshold=failure_threshold,
+            reset_timeout=reset_timeout,
+        )
+
     lock = RLock()
 
     def synchronized(func: Callable[..., Any]) -> Callable[..., Any]:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            with lock:
+            if 'timeout' not in kwargs and 'deadline' not in kwargs:
+                with lock:
+                    return func(*args, **kwargs)
+
+            # resolve once so time spent waiting for the lock counts too
+            deadline = resolve_deadline(
+                kwargs.pop('timeout', None), kwargs.get('deadline')
+            )
+            kwargs['deadline'] = deadline
+            wait = -1 if deadline is None else max(0.0, deadline - time.monotonic())
+            if not lock.acquire(timeout=wait):
+                raise serial.SerialTimeoutException(
+                    'Deadline passed waiting for serial port'
+                )
+            try:
                 return func(*args, **kwargs)
+            finally:
+                lock.release()
+
         return wrapper
 
     class AmpControlSync(AmpControlBase):
@@ -480,8 +1639,10 @@ def get_amp_controller(
             serial_config_overrides: dict[str, Any],
         ) -> None:
             self._amp_type = amp_type
+            self._tracker = _create_tracker(amp_type, snapshot_path, snapshot_interval)
 
-            serial_config = get_device_config(amp_type, CONF_SERIAL_CONFIG)
+            # copy so overrides never leak into the shared series config
+            serial_config = dict(get_device_config(amp_type, CONF_SERIAL_CONFIG))
             if serial_config_overrides:
                 LOG.debug(
                     'Overriding serial config: port=%s, overrides=%s',
@@ -491,108 +1652,821 @@ def get_amp_controller(
                 serial_config.update(serial_config_overrides)
 
             self._port = serial.serial_for_url(port_url, **serial_config)
-
-        def _send_request(self, request: bytes, skip: int = 0) -> str:
+            self._capture = CaptureWriter(capture_path) if capture_path else None
+            self._trace = CommandTrace()
+            self._breaker = CircuitBreaker(failure_threshold, reset_timeout)
+            self._layout = get_chassis_layout(amp_type)
+
+        def _send_request(
+            self, request: bytes, skip: int = 0, deadline: float | None = None
+        ) -> str:
             """Send request and read response.
 
             Args:
                 request: Command bytes to send.
                 skip: Bytes to skip for EOL detection.
+                deadline: Give up at this time.monotonic() value.
 
             Returns:
                 Response string.
 
             Raises:
-                serial.SerialTimeoutException: If no response received.
+                serial.SerialTimeoutException: If no response received or the
+                    deadline passed.
+                AmpUnavailableError: If the circuit breaker is open.
             """
+            if deadline is not None and time.monotonic() >= deadline:
+                raise serial.SerialTimeoutException(
+                    f'Deadline passed before sending {request!r}'
+                )
+            self._breaker.before_request()
+
             self._port.reset_output_buffer()
             self._port.reset_input_buffer()
 
-            LOG.debug('Sending request: request=%s', request)
+            self._trace.record(TRACE_SEND, request)
+            if self._capture is not None:
+                self._capture.write(request)
             self._port.write(request)
             self._port.flush()
 
-            response_eol = get_protocol_config(amp_type, CONF_RESPONSE_EOL) or '\r'
+            response_eol = (
+                get_protocol_config(amp_type, CONF_RESPONSE_EOL) or '\r'
+            ).encode('ascii')
             len_eol = len(response_eol)
 
+            port_timeout = self._port.timeout
             result = bytearray()
-            while True:
-                c = self._port.read(1)
-                if not c:
-                    LOG.info('Connection timed out: last_bytes=%s', [hex(a) for a in result])
-                    raise serial.SerialTimeoutException(
-                        f'Connection timed out! Last received: {[hex(a) for a in result]}'
-                    )
-                result += c
-                if len(result) > skip and result[-len_eol:] == response_eol.encode('ascii'):
-                    break
+            try:
+                while True:
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            # the late remainder is discarded by the next
+                            # request's input reset
+                            raise serial.SerialTimeoutException(
+                                f'Deadline passed! Last received: {[hex(a) for a in result]}'
+                            )
+                        if port_timeout is None or remaining < port_timeout:
+                            # never block in read() past the deadline
+                            self._port.timeout = remaining
+                    c = self._port.read(1)
+                    if not c:
+                        if deadline is not None and time.monotonic() >= deadline:
+                            raise serial.SerialTimeoutException(
+                                f'Deadline passed! Last received: {[hex(a) for a in result]}'
+                            )
+                        self._trace.record(TRACE_TIMEOUT, bytes(result))
+                        self._breaker.record_failure()
+                        log_timeout(port_url, bytes(result), port_timeout, self._trace)
+                        raise serial.SerialTimeoutException(
+                            f'Connection timed out! Last received: {[hex(a) for a in result]}'
+                        )
+                    result += c
+                    if len(result) > skip and result[-len_eol:] == response_eol:
+                        break
+            finally:
+                if self._port.timeout != port_timeout:
+                    self._port.timeout = port_timeout
 
             ret = bytes(result)
-            LOG.debug('Received response: response=%s', ret)
+            if self._capture is not None:
+                self._capture.read(ret)
+            self._trace.record(TRACE_RECEIVE, ret)
+            self._breaker.record_success()
             return ret.decode('ascii')
 
         @synchronized
-        def zone_status(self, zone: int) -> dict[str, Any] | None:
-            skip = get_device_config(amp_type, 'zone_status_skip', log_missing=False) or 0
-            response = self._send_request(_zone_status_cmd(self._amp_type, zone), skip)
+        def zone_status(
+            self,
+            zone: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> dict[str, Any] | None:
+            queries = self._composite_status_queries(zone)
+            if queries is not None:
+                replies = [self._send_request(query, 0, deadline) for query in queries]
+                composite = _composite_status(self._amp_type, zone, replies)
+                LOG.debug('Zone status: status=%s, raw=%s', composite, replies)
+                if composite is not None:
+                    _track_composite_status(self._amp_type, self._tracker, composite)
+                return composite
+
+            skip = (
+                get_device_config(amp_type, 'zone_status_skip', log_missing=False) or 0
+            )
+            response = self._send_request(
+                _zone_status_cmd(self._amp_type, zone), skip, deadline
+            )
             status = ZoneStatus.from_string(self._amp_type, response)
             LOG.debug('Zone status: status=%s, raw=%s', status, response)
-            return status.dict if status else None
+            if status is None:
+                return None
+            self._tracker.update(status)
+            return status.dict
+
+        def probe_chassis(
+            self,
+            *,
+            force: bool = False,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> tuple[int, ...]:
+            """Find which chained chassis answer (see AmpControlAsync.probe_chassis).
+
+            Raises:
+                serial.SerialTimeoutException: If the deadline passed.
+            """
+            if self._present_units is not None and not force:
+                return self.present_units
+
+            present = set()
+            for unit in self._layout.units:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise serial.SerialTimeoutException(
+                        'Deadline passed while probing chassis'
+                    )
+                try:
+                    status = self.zone_status(
+                        self._layout.zones_of(unit)[0],
+                        timeout=timeout,
+                        deadline=deadline,
+                    )
+                except serial.SerialTimeoutException:
+                    status = None
+                if status is not None:
+                    present.add(unit)
+            if deadline is not None and time.monotonic() >= deadline:
+                # the last unit may have timed out on the deadline, not the amp
+                raise serial.SerialTimeoutException(
+                    'Deadline passed while probing chassis'
+                )
+            LOG.debug(
+                'Probed chassis: amp_type=%s, present=%s', self._amp_type, present
+            )
+            self._present_units = present
+            return self.present_units
+
+        @synchronized
+        def zone_statuses(
+            self,
+            zones: Iterable[int] | None = None,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> dict[int, dict[str, Any]]:
+            """Read several zones, skipping chassis found absent.
+
+            Zones are read one query at a time; see AmpControlAsync.zone_statuses.
+
+            Returns:
+                Zone status dictionaries keyed by zone (zones that could not be
+                parsed are omitted).
+            """
+            wanted = self._layout.zones if zones is None else list(zones)
+            present = set(self.present_units)
+            statuses: dict[int, dict[str, Any]] = {}
+            for unit, unit_zones in self._layout.group_by_unit(wanted).items():
+                if unit not in present:
+                    continue
+                for zone in unit_zones:
+                    status = self.zone_status(zone, deadline=deadline)
+                    if status is not None:
+                        statuses[zone] = status
+            return statuses
+
+        @synchronized
+        def refresh(
+            self,
+            zone: int,
+            fields: Iterable[str] | None = None,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> dict[str, Any]:
+            """Read selected zone attributes (see AmpControlAsync.refresh)."""
+            fields, queries = _refresh_queries(self._amp_type, zone, fields)
+            if queries is None:
+                status = self.zone_status(zone, deadline=deadline)
+                return {name: status[name] for name in fields} if status else {}
+            replies = [self._send_request(query, 0, deadline) for query in queries]
+            return _merge_refresh(self._amp_type, self._tracker, zone, fields, replies)
+
+        def get_power(self, zone: int, **kwargs: Any) -> bool | None:
+            """Read a zone's power state with a single-attribute query."""
+            values: dict[str, bool | None] = self.refresh(zone, ('power',), **kwargs)
+            return values.get('power')
+
+        def get_mute(self, zone: int, **kwargs: Any) -> bool | None:
+            """Read a zone's mute state with a single-attribute query."""
+            values: dict[str, bool | None] = self.refresh(zone, ('mute',), **kwargs)
+            return values.get('mute')
+
+        def get_volume(self, zone: int, **kwargs: Any) -> int | None:
+            """Read a zone's volume with a single-attribute query."""
+            values: dict[str, int | None] = self.refresh(zone, ('volume',), **kwargs)
+            return values.get('volume')
+
+        def get_source(self, zone: int, **kwargs: Any) -> int | None:
+            """Read a zone's source with a single-attribute query."""
+            values: dict[str, int | None] = self.refresh(zone, ('source',), **kwargs)
+            return values.get('source')
+
+        @synchronized
+        def set_power(
+            self,
+            zone: int,
+            power: bool,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            if self._write_redundant(zone, 'power', power):
+                return
+            self._send_request(
+                _set_power_cmd(self._amp_type, zone, power), deadline=deadline
+            )
+            self._record_write(zone, 'power', power)
+
+        @synchronized
+        def set_mute(
+            self,
+            zone: int,
+            mute: bool,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            if self._write_redundant(zone, 'mute', mute):
+                return
+            self._send_request(
+                _set_mute_cmd(self._amp_type, zone, mute), deadline=deadline
+            )
+            self._record_write(zone, 'mute', mute)
 
         @synchronized
-        def set_power(self, zone: int, power: bool) -> None:
-            self._send_request(_set_power_cmd(self._amp_type, zone, power))
+        def set_volume(
+            self,
+            zone: int,
+            volume: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            if self._write_redundant(zone, 'volume', volume):
+                return
+            self._send_request(
+                _set_volume_cmd(self._amp_type, zone, volume), deadline=deadline
+            )
+            self._record_write(zone, 'volume', volume)
 
         @synchronized
-        def set_mute(self, zone: int, mute: bool) -> None:
-            self._send_request(_set_mute_cmd(self._amp_type, zone, mute))
+        def set_treble(
+            self,
+            zone: int,
+            treble: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            if self._write_redundant(zone, 'treble', treble):
+                return
+            self._send_request(
+                _set_treble_cmd(self._amp_type, zone, treble), deadline=deadline
+            )
+            self._record_write(zone, 'treble', treble)
 
         @synchronized
-        def set_volume(self, zone: int, volume: int) -> None:
-            self._send_request(_set_volume_cmd(self._amp_type, zone, volume))
+        def set_bass(
+            self,
+            zone: int,
+            bass: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            if self._write_redundant(zone, 'bass', bass):
+                return
+            self._send_request(
+                _set_bass_cmd(self._amp_type, zone, bass), deadline=deadline
+            )
+            self._record_write(zone, 'bass', bass)
 
         @synchronized
-        def set_treble(self, zone: int, treble: int) -> None:
-            self._send_request(_set_treble_cmd(self._amp_type, zone, treble))
+        def set_balance(
+            self,
+            zone: int,
+            balance: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            if self._write_redundant(zone, 'balance', balance):
+                return
+            self._send_request(
+                _set_balance_cmd(self._amp_type, zone, balance), deadline=deadline
+            )
+            self._record_write(zone, 'balance', balance)
 
         @synchronized
-        def set_bass(self, zone: int, bass: int) -> None:
-            self._send_request(_set_bass_cmd(self._amp_type, zone, bass))
+        def set_source(
+            self,
+            zone: int,
+            source: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            if self._write_redundant(zone, 'source', source):
+                return
+            self._send_request(
+                _set_source_cmd(self._amp_type, zone, source), deadline=deadline
+            )
+            self._record_write(zone, 'source', source)
+
+        def _write_many(
+            self, name: str, zones: Iterable[int], value: Any, deadline: float | None
+        ) -> None:
+            written, commands = self._plan_many(name, zones, value)
+            for command in commands:
+                self._send_request(command, deadline=deadline)
+            for zone in written:
+                self._record_write(zone, name, value)
 
         @synchronized
-        def set_balance(self, zone: int, balance: int) -> None:
-            self._send_request(_set_balance_cmd(self._amp_type, zone, balance))
+        def set_power_many(
+            self,
+            zones: Iterable[int],
+            power: bool,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            """Set the power of several zones (see AmpControlAsync.set_power_many)."""
+            self._write_many('power', zones, power, deadline)
 
         @synchronized
-        def set_source(self, zone: int, source: int) -> None:
-            self._send_request(_set_source_cmd(self._amp_type, zone, source))
+        def set_mute_many(
+            self,
+            zones: Iterable[int],
+            mute: bool,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            """Set the mute state of several zones in one locked call."""
+            self._write_many('mute', zones, mute, deadline)
 
         @synchronized
-        def all_off(self) -> None:
+        def set_volume_many(
+            self,
+            zones: Iterable[int],
+            volume: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            """Set the volume of several zones in one locked call."""
+            self._write_many('volume', zones, volume, deadline)
+
+        @synchronized
+        def set_source_many(
+            self,
+            zones: Iterable[int],
+            source: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            """Set the source of several zones in one locked call."""
+            self._write_many('source', zones, source, deadline)
+
+        @synchronized
+        def update_zone(
+            self,
+            zone: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+            **values: Any,
+        ) -> dict[str, Any]:
+            """Apply several zone settings as one uninterrupted group.
+
+            See AmpControlAsync.update_zone(); the port lock is held for the
+            whole group.
+            """
+            changes, commands = self._plan_update(zone, values)
+            for command in commands:
+                self._send_request(command, deadline=deadline)
+            self._record_writes(zone, changes)
+            return changes
+
+        @synchronized
+        def all_off(
+            self,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
             """Turn off all zones."""
-            self._send_request(_command(amp_type, 'all_zones_off'))
+            self._send_request(_command(amp_type, 'all_zones_off'), deadline=deadline)
+            self._record_all_off()
+
+        @synchronized
+        def execute(
+            self,
+            feature: str,
+            action: str,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+            **values: Any,
+        ) -> dict[str, Any] | None:
+            """Run any protocol command from the dispatch table.
+
+            See AmpControlAsync.execute.
+            """
+            command, request, skip = _dispatch_request(
+                amp_type, feature, action, values
+            )
+            reply = self._send_request(request, skip, deadline)
+            self._forget_writes(_dispatch_zones(self._tracker, values))
+            return _dispatch_result(amp_type, command, reply, self._tracker)
 
         @synchronized
-        def restore_zone(self, status: dict[str, Any]) -> None:
+        def close(self) -> None:
+            """Save the zone snapshot and close the serial port."""
+            self._tracker.save()
+            if self._capture is not None:
+                self._capture.close()
+            self._port.close()
+
+        @synchronized
+        def restore_zone(
+            self,
+            status: dict[str, Any],
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
             zone = status['zone']
             extras = get_protocol_config(amp_type, 'extras') or {}
             success = extras.get('restore_success')
-            LOG.debug('Restoring zone: amp_type=%s, zone=%s, status=%s', amp_type, zone, status)
+            LOG.debug(
+                'Restoring zone: amp_type=%s, zone=%s, status=%s',
+                amp_type,
+                zone,
+                status,
+            )
 
             restore_commands = extras.get('restore_zone', [])
-            for command in restore_commands:
-                result = self._send_request(command(amp_type, zone, status))
-                if result != success:
-                    LOG.warning('Failed restoring zone command: zone=%s, command=%s', zone, command)
+            for name in restore_commands:
+                if name not in _UPDATE_COMMANDS:
+                    continue
+                try:
+                    result = self._send_request(
+                        _UPDATE_COMMANDS[name](amp_type, zone, status[name]),
+                        deadline=deadline,
+                    )
+                except BaseException:
+                    self._forget_writes([zone])
+                    raise
+                if result == success:
+                    self._record_write(zone, name, status[name])
+                else:
+                    self._forget_writes([zone])
+                    LOG.warning(
+                        'Failed restoring zone command: zone=%s, command=%s',
+                        zone,
+                        name,
+                    )
                 time.sleep(0.1)
 
     return AmpControlSync(amp_type, port_url, serial_config_overrides)
 
 
+def negotiate_baud(
+    amp_type: str,
+    port_url: str,
+    serial_config_overrides: dict[str, Any] | None = None,
+    *,
+    cache_path: str | Path | None = None,
+    probe_timeout: float = DEFAULT_BAUD_PROBE_TIMEOUT,
+    force: bool = False,
+) -> int | None:
+    """Find the fastest baud rate at which the amp answers correctly.
+
+    Candidate rates (see pyxantech.baud.candidate_baud_rates) are probed from
+    fastest to slowest with a short-timeout status read of the first zone;
+    the first rate returning a parseable reply wins and is cached per port.
+
+    Args:
+        amp_type: Amplifier type (e.g., 'xantech8', 'monoprice6').
+        port_url: Serial port path or URL.
+        serial_config_overrides: Other serial settings to probe with.
+        cache_path: Negotiated rate cache (defaults to
+            $XDG_CACHE_HOME/pyxantech/baud.json).
+        probe_timeout: Read timeout per probe, in seconds.
+        force: Probe even if a rate is cached for the port.
+
+    Returns:
+        Negotiated baud rate, or None if no candidate rate answered.
+    """
+    cache_path = cache_path or default_baud_cache_path()
+    if not force:
+        cached = load_cached_baud(cache_path, port_url, amp_type)
+        if cached is not None:
+            return cached
+
+    zone = next(iter(get_device_config(amp_type, 'zones')))
+    for baudrate in candidate_baud_rates(amp_type):
+        overrides = {
+            **(serial_config_overrides or {}),
+            'baudrate': baudrate,
+            'timeout': probe_timeout,
+        }
+        try:
+            amp = get_amp_controller(amp_type, port_url, overrides)
+            try:
+                answered = amp.get_power(zone) is not None  # type: ignore[union-attr]
+            finally:
+                amp.close()  # type: ignore[union-attr]
+        except (serial.SerialException, UnicodeDecodeError, ValueError) as exc:
+            LOG.debug(
+                'Baud probe failed: port=%s, baud=%s, error=%s', port_url, baudrate, exc
+            )
+            continue
+        if answered:
+            LOG.info('Negotiated baud rate: port=%s, baud=%s', port_url, baudrate)
+            try:
+                save_cached_baud(cache_path, port_url, amp_type, baudrate)
+            except OSError:
+                LOG.warning('Failed saving baud cache: path=%s', cache_path)
+            return baudrate
+
+    LOG.warning('No baud rate answered, using series default: port=%s', port_url)
+    return None
+
+
+def _with_negotiated_baud(
+    amp_type: str,
+    port_url: str,
+    serial_config_overrides: dict[str, Any],
+    cache_path: str | Path | None,
+) -> dict[str, Any]:
+    """Add the negotiated baud rate to serial overrides (explicit rates win)."""
+    if 'baudrate' in serial_config_overrides:
+        return serial_config_overrides
+    baudrate = negotiate_baud(
+        amp_type, port_url, serial_config_overrides, cache_path=cache_path
+    )
+    if baudrate is None:
+        return serial_config_overrides
+    return {**serial_config_overrides, 'baudrate': baudrate}
+
+
+def _get_engine_amp_controller(
+    amp_type: str,
+    port_url: str,
+    serial_config_overrides: dict[str, Any] | None,
+    **kwargs: Any,
+) -> AmpControlBase | None:
+    """Create a blocking controller backed by the shared async engine.
+
+    Args:
+        amp_type: Amplifier type (e.g., 'xantech8', 'monoprice6').
+        port_url: Serial port path or URL.
+        serial_config_overrides: Optional serial port configuration overrides.
+        **kwargs: Options passed through to async_get_amp_controller.
+
+    Returns:
+        Synchronous amplifier control interface or None if creation failed.
+    """
+    engine = get_engine()
+
+    class AmpControlEngine(AmpControlBase):
+        """Thread-safe blocking wrappers around an engine-owned async controller.
+
+        Any additional coroutine method of the async controller is exposed as a
+        blocking method as well.
+        """
+
+        def __init__(self, engine: AsyncEngine, amp: Any) -> None:
+            self._engine = engine
+            self._amp = amp
+            self._amp_type = amp.amp_type
+            self._tracker = amp.tracker
+            self._trace = amp.trace
+            self._breaker = amp.breaker
+            self._layout = amp.layout
+
+        @property
+        def present_units(self) -> tuple[int, ...]:
+            return self._amp.present_units  # type: ignore[no-any-return]
+
+        def _run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+            return self._engine.run(coro)
+
+        def __getattr__(self, name: str) -> Any:
+            attr = getattr(self._amp, name)
+            if not asyncio.iscoroutinefunction(attr):
+                return attr
+
+            @wraps(attr)
+            def blocking(*args: Any, **kwargs: Any) -> Any:
+                return self._run(attr(*args, **kwargs))
+
+            return blocking
+
+        def enable_idempotent_writes(
+            self, max_age: float = DEFAULT_IDEMPOTENT_MAX_AGE
+        ) -> None:
+            self._amp.enable_idempotent_writes(max_age)
+
+        def disable_idempotent_writes(self) -> None:
+            self._amp.disable_idempotent_writes()
+
+        def enable_composite_status(self) -> None:
+            self._amp.enable_composite_status()
+
+        def disable_composite_status(self) -> None:
+            self._amp.disable_composite_status()
+
+        @property
+        def suppressed_writes(self) -> dict[str, int]:
+            return self._amp.suppressed_writes  # type: ignore[no-any-return]
+
+        def zone_status(
+            self,
+            zone: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> dict[str, Any] | None:
+            return self._run(  # type: ignore[no-any-return]
+                self._amp.zone_status(zone, timeout=timeout, deadline=deadline)
+            )
+
+        def set_power(
+            self,
+            zone: int,
+            power: bool,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            self._run(
+                self._amp.set_power(zone, power, timeout=timeout, deadline=deadline)
+            )
+
+        def set_mute(
+            self,
+            zone: int,
+            mute: bool,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            self._run(
+                self._amp.set_mute(zone, mute, timeout=timeout, deadline=deadline)
+            )
+
+        def set_volume(
+            self,
+            zone: int,
+            volume: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            self._run(
+                self._amp.set_volume(zone, volume, timeout=timeout, deadline=deadline)
+            )
+
+        def set_treble(
+            self,
+            zone: int,
+            treble: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            self._run(
+                self._amp.set_treble(zone, treble, timeout=timeout, deadline=deadline)
+            )
+
+        def set_bass(
+            self,
+            zone: int,
+            bass: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            self._run(
+                self._amp.set_bass(zone, bass, timeout=timeout, deadline=deadline)
+            )
+
+        def set_balance(
+            self,
+            zone: int,
+            balance: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            self._run(
+                self._amp.set_balance(zone, balance, timeout=timeout, deadline=deadline)
+            )
+
+        def set_source(
+            self,
+            zone: int,
+            source: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            self._run(
+                self._amp.set_source(zone, source, timeout=timeout, deadline=deadline)
+            )
+
+        def all_off(
+            self,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            """Turn off all zones."""
+            self._run(self._amp.all_off(timeout=timeout, deadline=deadline))
+
+        def execute(
+            self,
+            feature: str,
+            action: str,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+            **values: Any,
+        ) -> dict[str, Any] | None:
+            return self._run(  # type: ignore[no-any-return]
+                self._amp.execute(
+                    feature, action, timeout=timeout, deadline=deadline, **values
+                )
+            )
+
+        def get_power(
+            self,
+            zone: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> bool | None:
+            return self._run(  # type: ignore[no-any-return]
+                self._amp.get_power(zone, timeout=timeout, deadline=deadline)
+            )
+
+        def probe_chassis(
+            self,
+            *,
+            force: bool = False,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> tuple[int, ...]:
+            return self._run(  # type: ignore[no-any-return]
+                self._amp.probe_chassis(force=force, timeout=timeout, deadline=deadline)
+            )
+
+        def close(self) -> None:
+            """Save the zone snapshot and close the serial connection."""
+            self._run(self._amp.close())
+
+        def restore_zone(
+            self,
+            status: dict[str, Any],
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            self._run(
+                self._amp.restore_zone(status, timeout=timeout, deadline=deadline)
+            )
+
+    amp = engine.run(
+        async_get_amp_controller(
+            amp_type, port_url, engine.loop, serial_config_overrides, **kwargs
+        )
+    )
+    if amp is None:
+        return None
+    return AmpControlEngine(engine, amp)
+
+
 async def get_async_monoprice(
     port_url: str,
     loop: AbstractEventLoop,
-) -> AmpControlBase | None:
+) -> AmpControlAsyncBase | None:
     """Create async controller for Monoprice 6-zone amp.
 
     DEPRECATED: Use async_get_amp_controller('monoprice6', ...) instead.
@@ -612,14 +2486,42 @@ async def async_get_amp_controller(
     port_url: str,
     loop: AbstractEventLoop,
     serial_config_overrides: dict[str, Any] | None = None,
-) -> AmpControlBase | None:
+    *,
+    capture_path: str | Path | None = None,
+    snapshot_path: str | Path | None = None,
+    snapshot_interval: float = DEFAULT_SNAPSHOT_INTERVAL,
+    max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+    backpressure: str = BACKPRESSURE_WAIT,
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+    reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+    auto_baud: bool = False,
+    baud_cache_path: str | Path | None = None,
+) -> AmpControlAsyncBase | None:
     """Create an asynchronous amplifier controller.
 
     Args:
         amp_type: Amplifier type (e.g., 'xantech8', 'monoprice6').
-        port_url: Serial port path or URL.
+        port_url: Serial port path or URL; replay://<capture>?speed=<factor>
+            replays a traffic capture (see pyxantech.capture).
         loop: Event loop for async operations.
         serial_config_overrides: Optional serial port configuration overrides.
+        capture_path: Append all serial traffic to this capture file.
+        snapshot_path: Load provisional zone state from this file at startup
+            and persist the state table to it periodically and on close().
+        snapshot_interval: Minimum seconds between periodic snapshot saves.
+        max_queue_size: Maximum number of requests queued for the serial port.
+        backpressure: What callers get when the queue is full: 'wait' for
+            space, 'reject' (QueueFullError) or 'drop_oldest' background
+            request.
+        failure_threshold: Consecutive reply timeouts after which calls fail
+            immediately with AmpUnavailableError (see pyxantech.health).
+        reset_timeout: Seconds before a trial request checks whether the amp
+            is reachable again.
+        auto_baud: Open the port at the fastest rate the amp answers at (see
+            negotiate_baud(), run in an executor); an explicit 'baudrate'
+            override takes priority.
+        baud_cache_path: Negotiated rate cache (defaults to
+            $XDG_CACHE_HOME/pyxantech/baud.json).
 
     Returns:
         Async amplifier control interface or None if amp_type unsupported.
@@ -628,20 +2530,25 @@ async def async_get_amp_controller(
         serial_config_overrides = {}
 
     if amp_type not in SUPPORTED_AMP_TYPES:
-        LOG.error("Unsupported amplifier type: amp_type=%s", amp_type)
+        LOG.error('Unsupported amplifier type: amp_type=%s', amp_type)
         return None
 
-    lock = asyncio.Lock()
+    if auto_baud:
+        serial_config_overrides = await loop.run_in_executor(
+            None,
+            _with_negotiated_baud,
+            amp_type,
+            port_url,
+            serial_config_overrides,
+            baud_cache_path,
+        )
 
-    def locked_coro(coro: Callable[..., Any]) -> Callable[..., Any]:
-        @wraps(coro)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            async with lock:
-                return await coro(*args, **kwargs)
-        return wrapper
+    class AmpControlAsync(AmpControlAsyncBase):
+        """Asynchronous amplifier control implementation.
 
-    class AmpControlAsync(AmpControlBase):
-        """Asynchronous amplifier control implementation."""
+        Requests are queued to the protocol's single writer task; methods that
+        send several commands submit them as one atomic batch.
+        """
 
         def __init__(
             self,
@@ -652,52 +2559,713 @@ async def async_get_amp_controller(
             self._amp_type = amp_type
             self._serial_config = serial_config
             self._protocol = protocol
+            self._tracker = _create_tracker(amp_type, snapshot_path, snapshot_interval)
+            self._trace = protocol.trace
+            self._breaker = protocol.breaker
+            self._health_monitor: asyncio.Task[None] | None = None
+            self._layout = get_chassis_layout(amp_type)
+            self._present_units: set[int] | None = None
+
+        @property
+        def queue_metrics(self) -> QueueMetrics:
+            """Request queue counters for this controller's serial port."""
+            return self._protocol.metrics
+
+        async def probe_chassis(
+            self,
+            *,
+            force: bool = False,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> tuple[int, ...]:
+            """Find which chained chassis answer, reading one zone per unit.
 
-        @locked_coro
-        async def zone_status(self, zone: int) -> dict[str, Any] | None:
-            cmd = _zone_status_cmd(self._amp_type, zone)
-            skip = get_device_config(amp_type, 'zone_status_skip', log_missing=False) or 0
-            status_string = await self._protocol.send(cmd, skip=skip)
+            The result is remembered, so an absent chassis costs one timeout
+            here instead of one per zone in every later bulk operation.
+
+            Args:
+                force: Probe again even if already probed.
+                timeout: Per-unit timeout (defaults to the device timeout).
+                deadline: Give up on the whole probe at this time.monotonic()
+                    value; the result is then not remembered.
+
+            Returns:
+                Chassis numbers that responded.
+
+            Raises:
+                TimeoutError: If the deadline passed.
+            """
+            if self._present_units is not None and not force:
+                return self.present_units
+
+            present = set()
+            for unit in self._layout.units:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError('Deadline passed while probing chassis')
+                try:
+                    status = await self.zone_status(
+                        self._layout.zones_of(unit)[0],
+                        timeout=timeout,
+                        deadline=deadline,
+                    )
+                except TimeoutError:
+                    status = None
+                if status is not None:
+                    present.add(unit)
+            if deadline is not None and time.monotonic() >= deadline:
+                # the last unit may have timed out on the deadline, not the amp
+                raise TimeoutError('Deadline passed while probing chassis')
+            LOG.debug(
+                'Probed chassis: amp_type=%s, present=%s', self._amp_type, present
+            )
+            self._present_units = present
+            return self.present_units
+
+        async def zone_statuses(
+            self,
+            zones: Iterable[int] | None = None,
+            *,
+            background: bool = False,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> dict[int, dict[str, Any]]:
+            """Read several zones, grouped per chassis.
+
+            Zones on chassis that probe_chassis() found absent are skipped. A
+            chassis is read with one unit query when the protocol has one and
+            more than one of its zones is requested; otherwise its zone queries
+            are sent as one batch. Protocols that assemble zone status from
+            per-attribute queries send every zone's queries in a single batch.
+
+            Args:
+                zones: Zones to read (defaults to every zone).
+                background: Mark as background requests (see zone_status()).
+                timeout: Give up after this many seconds, including queue time.
+                deadline: Give up at this time.monotonic() value.
+
+            Returns:
+                Zone status dictionaries keyed by zone (zones that could not be
+                parsed are omitted).
+            """
+            deadline = resolve_deadline(timeout, deadline)
+            wanted = self._layout.zones if zones is None else list(zones)
+            present = set(self.present_units)
+            commands = get_protocol_config(self._amp_type, 'commands') or {}
+            unit_query = 'unit_status' in commands
+            response_eol = get_protocol_config(amp_type, CONF_RESPONSE_EOL) or '\r'
+            skip = (
+                get_device_config(amp_type, 'zone_status_skip', log_missing=False) or 0
+            )
 
+            statuses: dict[int, dict[str, Any]] = {}
+            if self._composite_reads and get_protocol_config(
+                self._amp_type, 'zone_status_commands'
+            ):
+                # assembled per attribute: every zone's queries in one batch
+                wanted = [
+                    zone for zone in wanted if self._layout.unit_of(zone) in present
+                ]
+                batches = [
+                    self._composite_status_queries(zone) or [] for zone in wanted
+                ]
+                replies = await self._protocol.send_many(
+                    [query for batch in batches for query in batch],
+                    background=background,
+                    deadline=deadline,
+                )
+                offset = 0
+                for zone, batch in zip(wanted, batches, strict=True):
+                    composite = _composite_status(
+                        self._amp_type, zone, replies[offset : offset + len(batch)]
+                    )
+                    offset += len(batch)
+                    if composite is not None:
+                        _track_composite_status(
+                            self._amp_type, self._tracker, composite
+                        )
+                        statuses[zone] = composite
+                return statuses
+
+            for unit, unit_zones in self._layout.group_by_unit(wanted).items():
+                if unit not in present:
+                    continue
+                if unit_query and len(unit_zones) > 1:
+                    reply = await self._protocol.send(
+                        _command(self._amp_type, 'unit_status', {'unit': unit}),
+                        skip=skip,
+                        background=background,
+                        deadline=deadline,
+                        lines=len(self._layout.zones_of(unit)),
+                    )
+                    replies = reply.split(response_eol)
+                else:
+                    replies = await self._protocol.send_many(
+                        [_zone_status_cmd(self._amp_type, zone) for zone in unit_zones],
+                        skip=skip,
+                        background=background,
+                        deadline=deadline,
+                    )
+
+                for reply in replies:
+                    status = ZoneStatus.from_string(self._amp_type, reply)
+                    if status is None or status.zone not in unit_zones:
+                        continue
+                    self._tracker.update(status)
+                    statuses[status.zone] = status.dict
+            return statuses
+
+        async def zone_status(
+            self,
+            zone: int,
+            *,
+            background: bool = False,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> dict[str, Any] | None:
+            """Get the current status of a zone.
+
+            Args:
+                zone: Zone number.
+                background: Mark as a background (polling) request that may be
+                    dropped when the queue is full under 'drop_oldest'.
+                timeout: Give up after this many seconds, including queue time.
+                deadline: Give up at this time.monotonic() value.
+
+            Returns:
+                Dictionary with zone status or None if unavailable.
+            """
+            queries = self._composite_status_queries(zone)
+            if queries is not None:
+                replies = await self._protocol.send_many(
+                    queries, background=background, timeout=timeout, deadline=deadline
+                )
+                composite = _composite_status(self._amp_type, zone, replies)
+                LOG.debug('Zone status: status=%s, raw=%s', composite, replies)
+                if composite is not None:
+                    _track_composite_status(self._amp_type, self._tracker, composite)
+                return composite
+
+            cmd = _zone_status_cmd(self._amp_type, zone)
+            skip = (
+                get_device_config(amp_type, 'zone_status_skip', log_missing=False) or 0
+            )
+            status_string = await self._protocol.send(
+                cmd,
+                skip=skip,
+                background=background,
+                timeout=timeout,
+                deadline=deadline,
+            )
             status = ZoneStatus.from_string(self._amp_type, status_string)
             LOG.debug('Zone status: status=%s, raw=%s', status, status_string)
-            return status.dict if status else None
+            if status is None:
+                return None
+            self._tracker.update(status)
+            return status.dict
 
-        @locked_coro
-        async def set_power(self, zone: int, power: bool) -> None:
-            await self._protocol.send(_set_power_cmd(self._amp_type, zone, power))
+        async def refresh(
+            self,
+            zone: int,
+            fields: Iterable[str] | None = None,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> dict[str, Any]:
+            """Read selected zone attributes with single-attribute queries.
+
+            Each field costs one short query (sent as one batch) instead of a
+            full status frame; the values are merged into the cached status.
+            If the protocol lacks a query for any requested field, the full
+            zone status is read instead.
 
-        @locked_coro
-        async def set_mute(self, zone: int, mute: bool) -> None:
-            await self._protocol.send(_set_mute_cmd(self._amp_type, zone, mute))
+            Args:
+                zone: Zone number.
+                fields: ZoneStatus fields to read (e.g. ['volume', 'mute']);
+                    None reads every field the protocol can query singly.
+                timeout: Give up after this many seconds, including queue time.
+                deadline: Give up at this time.monotonic() value.
 
-        @locked_coro
-        async def set_volume(self, zone: int, volume: int) -> None:
-            await self._protocol.send(_set_volume_cmd(self._amp_type, zone, volume))
+            Returns:
+                Values by field name; fields whose reply did not parse are
+                omitted.
 
-        @locked_coro
-        async def set_treble(self, zone: int, treble: int) -> None:
-            await self._protocol.send(_set_treble_cmd(self._amp_type, zone, treble))
+            Raises:
+                ValueError: If the zone or a field name is invalid.
+            """
+            fields, queries = _refresh_queries(self._amp_type, zone, fields)
+            if queries is None:
+                status = await self.zone_status(
+                    zone, timeout=timeout, deadline=deadline
+                )
+                return {name: status[name] for name in fields} if status else {}
+            replies = await self._protocol.send_many(
+                queries, timeout=timeout, deadline=deadline
+            )
+            return _merge_refresh(self._amp_type, self._tracker, zone, fields, replies)
+
+        async def get_power(self, zone: int, **kwargs: Any) -> bool | None:
+            """Read a zone's power state with a single-attribute query."""
+            return (await self.refresh(zone, ('power',), **kwargs)).get('power')
+
+        async def get_mute(self, zone: int, **kwargs: Any) -> bool | None:
+            """Read a zone's mute state with a single-attribute query."""
+            return (await self.refresh(zone, ('mute',), **kwargs)).get('mute')
+
+        async def get_volume(self, zone: int, **kwargs: Any) -> int | None:
+            """Read a zone's volume with a single-attribute query."""
+            return (await self.refresh(zone, ('volume',), **kwargs)).get('volume')
+
+        async def get_source(self, zone: int, **kwargs: Any) -> int | None:
+            """Read a zone's source with a single-attribute query."""
+            return (await self.refresh(zone, ('source',), **kwargs)).get('source')
+
+        async def set_power(
+            self,
+            zone: int,
+            power: bool,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            if self._write_redundant(zone, 'power', power):
+                return
+            await self._protocol.send(
+                _set_power_cmd(self._amp_type, zone, power),
+                timeout=timeout,
+                deadline=deadline,
+            )
+            self._record_write(zone, 'power', power)
+
+        async def set_mute(
+            self,
+            zone: int,
+            mute: bool,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            if self._write_redundant(zone, 'mute', mute):
+                return
+            await self._protocol.send(
+                _set_mute_cmd(self._amp_type, zone, mute),
+                timeout=timeout,
+                deadline=deadline,
+            )
+            self._record_write(zone, 'mute', mute)
+
+        async def set_volume(
+            self,
+            zone: int,
+            volume: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            if self._write_redundant(zone, 'volume', volume):
+                return
+            await self._protocol.send(
+                _set_volume_cmd(self._amp_type, zone, volume),
+                timeout=timeout,
+                deadline=deadline,
+            )
+            self._record_write(zone, 'volume', volume)
+
+        async def set_treble(
+            self,
+            zone: int,
+            treble: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            if self._write_redundant(zone, 'treble', treble):
+                return
+            await self._protocol.send(
+                _set_treble_cmd(self._amp_type, zone, treble),
+                timeout=timeout,
+                deadline=deadline,
+            )
+            self._record_write(zone, 'treble', treble)
+
+        async def set_bass(
+            self,
+            zone: int,
+            bass: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            if self._write_redundant(zone, 'bass', bass):
+                return
+            await self._protocol.send(
+                _set_bass_cmd(self._amp_type, zone, bass),
+                timeout=timeout,
+                deadline=deadline,
+            )
+            self._record_write(zone, 'bass', bass)
 
-        @locked_coro
-        async def set_bass(self, zone: int, bass: int) -> None:
-            await self._protocol.send(_set_bass_cmd(self._amp_type, zone, bass))
+        async def set_balance(
+            self,
+            zone: int,
+            balance: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            if self._write_redundant(zone, 'balance', balance):
+                return
+            await self._protocol.send(
+                _set_balance_cmd(self._amp_type, zone, balance),
+                timeout=timeout,
+                deadline=deadline,
+            )
+            self._record_write(zone, 'balance', balance)
+
+        async def set_source(
+            self,
+            zone: int,
+            source: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            if self._write_redundant(zone, 'source', source):
+                return
+            await self._protocol.send(
+                _set_source_cmd(self._amp_type, zone, source),
+                timeout=timeout,
+                deadline=deadline,
+            )
+            self._record_write(zone, 'source', source)
+
+        async def _write_many(
+            self,
+            name: str,
+            zones: Iterable[int],
+            value: Any,
+            timeout: float | None,
+            deadline: float | None,
+        ) -> None:
+            written, commands = self._plan_many(name, zones, value)
+            if commands:
+                await self._protocol.send_many(
+                    commands, timeout=timeout, deadline=deadline
+                )
+            for zone in written:
+                self._record_write(zone, name, value)
+
+        async def set_power_many(
+            self,
+            zones: Iterable[int],
+            power: bool,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            """Set the power of several zones with one queued request.
 
-        @locked_coro
-        async def set_balance(self, zone: int, balance: int) -> None:
-            await self._protocol.send(_set_balance_cmd(self._amp_type, zone, balance))
+            When the zones cover the whole amp and the protocol has an
+            all-zones command (e.g. all_zones_off), that single command is
+            sent. Otherwise the per-zone commands go out as one uninterrupted
+            batch, joined into a single line on protocols with a command
+            separator. In idempotent write mode zones already in the
+            requested state are skipped.
 
-        @locked_coro
-        async def set_source(self, zone: int, source: int) -> None:
-            await self._protocol.send(_set_source_cmd(self._amp_type, zone, source))
+            Args:
+                zones: Zone numbers.
+                power: True to turn on, False to turn off.
+                timeout: Give up after this many seconds, including queue time.
+                deadline: Give up at this time.monotonic() value.
+
+            Raises:
+                ValueError: If a zone is invalid.
+            """
+            await self._write_many('power', zones, power, timeout, deadline)
+
+        async def set_mute_many(
+            self,
+            zones: Iterable[int],
+            mute: bool,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            """Set the mute state of several zones (see set_power_many())."""
+            await self._write_many('mute', zones, mute, timeout, deadline)
+
+        async def set_volume_many(
+            self,
+            zones: Iterable[int],
+            volume: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            """Set the volume of several zones (see set_power_many())."""
+            await self._write_many('volume', zones, volume, timeout, deadline)
+
+        async def set_source_many(
+            self,
+            zones: Iterable[int],
+            source: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            """Set the source of several zones (see set_power_many())."""
+            await self._write_many('source', zones, source, timeout, deadline)
+
+        async def update_zone(
+            self,
+            zone: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+            **values: Any,
+        ) -> dict[str, Any]:
+            """Apply several zone settings as one uninterrupted group.
+
+            The writes are queued as one request, so no other command is
+            interleaved. They are sent power first and volume last, in
+            idempotent write mode fields whose fresh cached value already
+            matches are skipped, and on protocols with a command separator all
+            writes go out as a single line (one throttled round trip).
 
-        @locked_coro
-        async def all_off(self) -> None:
+            Args:
+                zone: Zone number.
+                timeout: Give up after this many seconds, including queue time.
+                deadline: Give up at this time.monotonic() value.
+                **values: New values by ZoneStatus field: power, source,
+                    treble, bass, balance, mute or volume (None is ignored).
+
+            Returns:
+                The values actually sent, in send order.
+
+            Raises:
+                ValueError: If the zone, a field or a value is invalid.
+            """
+            changes, commands = self._plan_update(zone, values)
+            if commands:
+                await self._protocol.send_many(
+                    commands, timeout=timeout, deadline=deadline
+                )
+            self._record_writes(zone, changes)
+            return changes
+
+        async def all_off(
+            self,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
             """Turn off all zones."""
-            await self._protocol.send(_command(self._amp_type, 'all_zones_off'))
+            await self._protocol.send(
+                _command(self._amp_type, 'all_zones_off'),
+                timeout=timeout,
+                deadline=deadline,
+            )
+            self._record_all_off()
+
+        async def execute(
+            self,
+            feature: str,
+            action: str,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+            **values: Any,
+        ) -> dict[str, Any] | None:
+            """Run any protocol command from the dispatch table.
+
+            Commands come from the protocol's api_v2 section as (feature,
+            action), or from its flat command map as ('command', name):
+
+                await amp.execute('volume', 'up', zone=1)
+                await amp.execute('command', 'mute_toggle', zone=2)
+
+            Args:
+                feature: Feature name (e.g. 'volume', 'mute').
+                action: Action name or alias (e.g. 'up', 'toggle').
+                timeout: Give up after this many seconds, including queue time.
+                deadline: Give up at this time.monotonic() value.
+                **values: Command variables (e.g. zone=1, volume=20).
+
+            Returns:
+                Zone status dict for zone status commands, the reply's named
+                fields for other commands with a response pattern, else None.
+
+            Raises:
+                ValueError: If the protocol lacks the command or a variable is
+                    missing or invalid.
+            """
+            command, request, skip = _dispatch_request(
+                self._amp_type, feature, action, values
+            )
+            reply = await self._protocol.send(
+                request, skip=skip, timeout=timeout, deadline=deadline
+            )
+            self._forget_writes(_dispatch_zones(self._tracker, values))
+            return _dispatch_result(self._amp_type, command, reply, self._tracker)
+
+        def start_health_monitor(
+            self, interval: float = DEFAULT_HEALTH_INTERVAL, zone: int | None = None
+        ) -> None:
+            """Probe the amp periodically to notice link failures and recovery.
+
+            Failures are then detected without waiting for a user request. Each
+            probe is the cheapest read the protocol offers (a single
+            power query where available). While the breaker is open, probes
+            are skipped until it turns half-open, when a probe is the trial.
+
+            Args:
+                interval: Seconds between probes.
+                zone: Zone to probe (defaults to the first present zone).
+            """
+            self.stop_health_monitor()
+            probe_zone = zone if zone is not None else self.present_zones[0]
+            self._health_monitor = asyncio.get_running_loop().create_task(
+                self._run_health_monitor(interval, probe_zone)
+            )
 
-        @locked_coro
-        async def restore_zone(self, status: dict[str, Any]) -> None:
+        def stop_health_monitor(self) -> None:
+            """Stop the task started by start_health_monitor()."""
+            if self._health_monitor is not None:
+                self._health_monitor.cancel()
+                self._health_monitor = None
+
+        async def _run_health_monitor(self, interval: float, zone: int) -> None:
+            while True:
+                await asyncio.sleep(interval)
+                if self._breaker.state == BREAKER_OPEN:
+                    continue
+                try:
+                    await self.refresh(zone, ('power',))
+                except (TimeoutError, ConnectionError, QueueFullError) as exc:
+                    LOG.debug('Health probe failed: zone=%s, error=%r', zone, exc)
+
+        async def close(self) -> None:
+            """Save the zone snapshot and close the serial connection."""
+            self.stop_health_monitor()
+            await self._tracker.async_save()
+            self._protocol.close()
+
+        async def revalidate_stale(
+            self,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            """Re-read every zone whose state was loaded from a snapshot.
+
+            Zones not reached before the timeout or deadline stay stale.
+            """
+            deadline = resolve_deadline(timeout, deadline)
+            present = set(self.present_units)
+            for zone in self._tracker.stale_zones:
+                if deadline is not None and time.monotonic() >= deadline:
+                    return
+                try:
+                    if self._layout.unit_of(zone) not in present:
+                        continue
+                    await self.zone_status(zone, deadline=deadline)
+                except (TimeoutError, ValueError) as exc:
+                    LOG.debug('Failed revalidating zone: zone=%s, error=%s', zone, exc)
+
+        async def ramp_volume(
+            self,
+            zones: Iterable[int],
+            target: int,
+            duration: float,
+            curve: str | Callable[[float], float] = 'linear',
+            *,
+            start: int | Mapping[int, int] | None = None,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            """Fade the volume of several zones to a target level.
+
+            Steps for all zones are interleaved round-robin within the device
+            pacing budget. Cancelling the awaiting task, or the timeout or
+            deadline passing, stops the ramp with each zone left at the last
+            level sent.
+
+            Args:
+                zones: Zones to ramp.
+                target: Final volume level.
+                duration: Ramp duration in seconds.
+                curve: Curve name (see pyxantech.ramp.CURVES) or callable.
+                start: Current volume (for all zones or per zone); queried from
+                    the amp when omitted.
+                timeout: Give up after this many seconds.
+                deadline: Give up at this time.monotonic() value.
+
+            Raises:
+                TimeoutError: If the timeout or deadline passed.
+            """
+            deadline = resolve_deadline(timeout, deadline)
+            zones = list(dict.fromkeys(zones))
+            max_volume = get_device_config(self._amp_type, 'max_volume') or 38
+            target = int(max(0, min(target, max_volume)))
+
+            if start is None:
+                start_levels: dict[int, int] = {}
+                for zone in zones:
+                    status = await self.zone_status(zone, deadline=deadline)
+                    if status is None:
+                        raise ValueError(f'Unknown volume for zone {zone}')
+                    start_levels[zone] = status['volume']
+            elif isinstance(start, int):
+                start_levels = dict.fromkeys(zones, start)
+            else:
+                start_levels = {zone: start[zone] for zone in zones}
+
+            min_interval = (
+                get_device_config(
+                    self._amp_type, 'min_time_between_commands', log_missing=False
+                )
+                or 0.05
+            )
+            plan = plan_ramp(start_levels, target, duration, min_interval, curve)
+
+            current: dict[int, int | None] = dict(start_levels)
+            clock = asyncio.get_running_loop().time
+            began = clock()
+            last_round = len(plan.rounds) - 1
+
+            # every zone's final level is in the last round, so skipping late
+            # intermediate rounds keeps the ramp within the requested duration
+            for index, steps in enumerate(plan.rounds):
+                next_round_at = began + plan.interval * (index + 1)
+                if index < last_round and clock() >= next_round_at:
+                    continue
+
+                commands = []
+                for step in steps:
+                    commands.append(
+                        _volume_step_cmd(
+                            self._amp_type, step.zone, current[step.zone], step.volume
+                        )
+                    )
+                    current[step.zone] = step.volume
+                try:
+                    await self._protocol.send_many(commands, deadline=deadline)
+                except BaseException:
+                    self._forget_writes(step.zone for step in steps)
+                    raise
+                for step in steps:
+                    self._record_write(step.zone, 'volume', step.volume)
+
+                delay = next_round_at - clock()
+                if delay > 0 and index < last_round:
+                    await asyncio.sleep(delay)
+
+        async def restore_zone(
+            self,
+            status: dict[str, Any],
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
             set_commands: dict[str, Callable[[str, int, Any], bytes]] = {
                 'power': _set_power_cmd,
                 'mute': _set_mute_cmd,
@@ -720,23 +3288,33 @@ async def async_get_amp_controller(
                 )
                 return
 
-            for command in restore_commands:
-                if command in set_commands:
+            deadline = resolve_deadline(timeout, deadline)
+            for name in restore_commands:
+                if name not in set_commands:
+                    continue
+                try:
                     result = await self._protocol.send(
-                        set_commands[command](amp_type, zone, status[command])
+                        set_commands[name](amp_type, zone, status[name]),
+                        deadline=deadline,
                     )
-                    if result != success:
-                        LOG.warning(
-                            'Failed restore command: zone=%s, command=%s',
-                            zone,
-                            command,
-                        )
-                    await asyncio.sleep(0.1)
+                except BaseException:
+                    self._forget_writes([zone])
+                    raise
+                if result == success:
+                    self._record_write(zone, name, status[name])
+                else:
+                    self._forget_writes([zone])
+                    LOG.warning(
+                        'Failed restore command: zone=%s, command=%s',
+                        zone,
+                        name,
+                    )
+                await asyncio.sleep(0.1)
 
     protocol_name = get_device_config(amp_type, 'protocol')
     protocol_config = PROTOCOL_CONFIG[protocol_name]
 
-    serial_config = get_device_config(amp_type, CONF_SERIAL_CONFIG)
+    serial_config = dict(get_device_config(amp_type, CONF_SERIAL_CONFIG))
     if serial_config_overrides:
         LOG.debug(
             'Overriding serial config: port=%s, overrides=%s',
@@ -752,6 +3330,15 @@ async def async_get_amp_controller(
         serial_config,
     )
     protocol = await async_get_rs232_protocol(
-        port_url, DEVICE_CONFIG[amp_type], serial_config, protocol_config, loop
+        port_url,
+        DEVICE_CONFIG[amp_type],
+        serial_config,
+        protocol_config,
+        loop,
+        capture_path=capture_path,
+        max_queue_size=max_queue_size,
+        backpressure=backpressure,
+        failure_threshold=failure_threshold,
+        reset_timeout=reset_timeout,
     )
     return AmpControlAsync(amp_type, serial_config, protocol)
@@ -0,0 +1,104 @@
+"""Baud rate candidates and the per-port negotiated rate cache.
+
+Auto-baud (see pyxantech.negotiate_baud) probes candidate rates from fastest
+to slowest and remembers the winner per port in a small JSON file, so later
+startups open the port at the right rate without probing again.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+import tempfile
+from typing import Any
+
+from .config import DEVICE_CONFIG
+
+LOG = logging.getLogger(__name__)
+
+BAUD_RATES = [9600, 14400, 19200, 38400, 57600, 115200]
+BAUD_CACHE_VERSION = 1
+
+
+def default_baud_cache_path() -> Path:
+    """Return the default cache file ($XDG_CACHE_HOME/pyxantech/baud.json)."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(cache_home) / 'pyxantech' / 'baud.json'
+
+
+def candidate_baud_rates(amp_type: str) -> list[int]:
+    """Return the rates worth probing for a series, fastest first.
+
+    Includes the common BAUD_RATES, the series default and any rate a
+    supported model overrides it with (e.g. 57600 for the MX88 family).
+    """
+    config = DEVICE_CONFIG[amp_type]
+    rates = set(BAUD_RATES)
+    default = (config.get('rs232') or {}).get('baudrate')
+    if default:
+        rates.add(int(default))
+    for model in config.get('supported') or ():
+        baud = ((model.get('overrides') or {}).get('rs232') or {}).get('baud')
+        if baud:
+            rates.add(int(baud))
+    return sorted(rates, reverse=True)
+
+
+def _read_cache(path: Path) -> dict[str, Any]:
+    try:
+        with path.open(encoding='utf-8') as stream:
+            payload = json.load(stream)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError):
+        LOG.warning('Failed reading baud cache: path=%s', path)
+        return {}
+    if payload.get('version') != BAUD_CACHE_VERSION:
+        return {}
+    return payload.get('ports') or {}
+
+
+def load_cached_baud(path: str | Path, port_url: str, amp_type: str) -> int | None:
+    """Return the cached rate for a port, if one was negotiated for this series.
+
+    Args:
+        path: Cache file path.
+        port_url: Serial port path or URL.
+        amp_type: Amplifier type the rate must have been negotiated for.
+
+    Returns:
+        Baud rate or None if not cached.
+    """
+    entry = _read_cache(Path(path)).get(port_url)
+    if not entry or entry.get('amp_type') != amp_type:
+        return None
+    return int(entry['baudrate'])
+
+
+def save_cached_baud(
+    path: str | Path, port_url: str, amp_type: str, baudrate: int
+) -> None:
+    """Atomically record the negotiated rate for a port.
+
+    Args:
+        path: Cache file path (parent directories are created).
+        port_url: Serial port path or URL.
+        amp_type: Amplifier type the rate was negotiated for.
+        baudrate: Negotiated baud rate.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ports = _read_cache(path)
+    ports[port_url] = {'amp_type': amp_type, 'baudrate': baudrate}
+    payload = {'version': BAUD_CACHE_VERSION, 'ports': ports}
+
+    fd, tmp_name = tempfile.mkstemp(prefix=f'.{path.name}.', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as stream:
+            json.dump(payload, stream, separators=(',', ':'))
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
@@ -0,0 +1,936 @@
+"""Serial port broker so several processes can share one amplifier.
+
+A serial port can only be opened by one process. The broker owns the
+amplifier's async controller and serves any number of local clients over a
+Unix domain socket:
+
+    pyxantech-broker monoprice6 /dev/ttyUSB0 --socket /run/pyxantech/amp.sock
+
+    amp = await async_get_broker_controller('/run/pyxantech/amp.sock')
+    await amp.set_volume(11, 20)
+
+The wire protocol is newline-delimited JSON. Clients send requests
+``{"id": 1, "op": "set_volume", "args": [11, 20], "kwargs": {}}`` and may
+pipeline them; the broker answers ``{"id": 1, "result": ...}`` or
+``{"id": 1, "error": "<type>", "message": "..."}`` in completion order. A
+client that stops waiting sends ``{"cancel": 1}`` to abandon the request. The
+broker also pushes ``{"event": "status", "status": {...}}`` whenever a zone
+changes, so every client mirrors the broker's zone state cache, and
+``{"event": "link", "state": "open", "failures": 3}`` on every circuit
+breaker transition, so link_state and link listeners follow the serial link. Identical
+concurrent zone_status reads are coalesced into one serial request, and
+zone_status(max_age=...) is answered from the shared cache when fresh enough.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import itertools
+import json
+import logging
+import os
+from pathlib import Path
+import socket
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any
+
+from . import (
+    SUPPORTED_AMP_TYPES,
+    AmpControlAsyncBase,
+    AmpUnavailableError,
+    QueueFullError,
+    RequestDroppedError,
+    ZoneStatus,
+    async_get_amp_controller,
+)
+from .chassis import get_chassis_layout
+from .events import ZoneChangeEvent, ZoneStateTracker
+from .health import BREAKER_CLOSED, CircuitBreaker, LinkStateEvent
+from .protocol import resolve_deadline
+from .trace import CommandTrace
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+LOG = logging.getLogger(__name__)
+
+BROKER_PROTOCOL_VERSION = 1
+
+# seconds a client waits for a reply when the call has no timeout or deadline
+DEFAULT_CALL_TIMEOUT = 60.0
+# extra seconds a client waits past a call's deadline for the broker's answer
+REPLY_GRACE = 1.0
+# bytes of pushed events a client may leave unread before it is disconnected
+MAX_CLIENT_BACKLOG = 1024 * 1024
+
+
+def default_socket_path() -> Path:
+    """Return the default socket path in a per-user directory.
+
+    Uses $XDG_RUNTIME_DIR when set, else a pyxantech-<uid> directory under the
+    system temporary directory (created with mode 0700 by the broker).
+    """
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return Path(runtime_dir) / 'pyxantech.sock'
+    return Path(tempfile.gettempdir()) / f'pyxantech-{os.getuid()}' / 'pyxantech.sock'
+
+
+DEFAULT_SOCKET_PATH = str(default_socket_path())
+
+# controller methods clients may invoke
+BROKER_OPS = frozenset(
+    {
+        'zone_status',
+        'zone_statuses',
+        'refresh',
+        'probe_chassis',
+        'execute',
+        'set_power',
+        'set_mute',
+        'set_volume',
+        'set_treble',
+        'set_bass',
+        'set_balance',
+        'set_source',
+        'update_zone',
+        'set_power_many',
+        'set_mute_many',
+        'set_volume_many',
+        'set_source_many',
+        'all_off',
+        'restore_zone',
+        'ramp_volume',
+        'revalidate_stale',
+    }
+)
+
+# exceptions re-raised by name on the client side
+_ERRORS: dict[str, type[Exception]] = {
+    'TimeoutError': asyncio.TimeoutError,
+    'QueueFullError': QueueFullError,
+    'RequestDroppedError': RequestDroppedError,
+    'AmpUnavailableError': AmpUnavailableError,
+    'ValueError': ValueError,
+    'KeyError': KeyError,
+    'ConnectionError': ConnectionError,
+}
+
+
+class BrokerError(Exception):
+    """Raised for broker failures that have no local exception type."""
+
+
+def _forget(tasks: dict[Any, asyncio.Task[None]], key: Any, _: object) -> None:
+    tasks.pop(key, None)
+
+
+def _encode(message: dict[str, Any]) -> bytes:
+    return json.dumps(message, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+class _RelayedBreaker(CircuitBreaker):
+    """Client-side copy of the broker's circuit breaker.
+
+    The client never trips it; it only follows the states the broker relays,
+    firing the usual listeners on every change.
+    """
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def relay(self, state: str, failures: int) -> None:
+        """Apply a state reported by the broker."""
+        self._failures = failures
+        if state != self._state:
+            self._transition(state)
+
+
+class AmpBroker:
+    """Unix socket server sharing one async amplifier controller.
+
+    Args:
+        amp: Async controller that owns the serial port.
+        amp_type: Amplifier type, reported to clients.
+        socket_path: Path of the Unix domain socket to listen on.
+    """
+
+    def __init__(self, amp: Any, amp_type: str, socket_path: str | Path) -> None:
+        self._amp = amp
+        self._amp_type = amp_type
+        self._socket_path = Path(socket_path)
+        self._server: asyncio.AbstractServer | None = None
+        self._clients: set[asyncio.StreamWriter] = set()
+        self._status_reads: dict[int, asyncio.Future[Any]] = {}
+        self._status_waiters: dict[int, int] = {}
+        self._dirty: set[int] = set()
+        self._flush_scheduled = False
+        self._remove_listener = amp.add_change_listener(self._on_change)
+        self._remove_link_listener = amp.add_link_listener(self._on_link_change)
+
+    @property
+    def socket_path(self) -> Path:
+        """Path of the listening socket."""
+        return self._socket_path
+
+    @property
+    def client_count(self) -> int:
+        """Number of connected clients."""
+        return len(self._clients)
+
+    async def start(self) -> None:
+        """Start listening, replacing a stale socket file if present.
+
+        The socket is created with mode 0660 (never wider, whatever the
+        umask); a missing parent directory is created with mode 0700.
+        """
+        self._socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with contextlib.suppress(FileNotFoundError):
+            self._socket_path.unlink()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o117)
+        try:
+            sock.bind(str(self._socket_path))
+        except OSError:
+            sock.close()
+            raise
+        finally:
+            os.umask(umask)
+        self._server = await asyncio.start_unix_server(self._handle_client, sock=sock)
+        LOG.info(
+            'Broker listening: socket=%s, amp_type=%s',
+            self._socket_path,
+            self._amp_type,
+        )
+
+    async def serve_forever(self) -> None:
+        """Serve clients until cancelled."""
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Disconnect all clients, stop listening and close the amp."""
+        self._remove_listener()
+        self._remove_link_listener()
+        if self._server is not None:
+            self._server.close()
+        for writer in list(self._clients):
+            writer.close()
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+        with contextlib.suppress(FileNotFoundError):
+            self._socket_path.unlink()
+        await self._amp.close()
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._clients.add(writer)
+        tasks: dict[Any, asyncio.Task[None]] = {}
+        try:
+            writer.write(
+                _encode(
+                    {
+                        'event': 'hello',
+                        'version': BROKER_PROTOCOL_VERSION,
+                        'amp_type': self._amp_type,
+                        'link_state': self._amp.link_state,
+                        'failures': self._amp.breaker.failures,
+                    }
+                )
+            )
+            # bring the new client's cache up to date
+            for status in self._amp.tracker.zones.values():
+                writer.write(_encode({'event': 'status', 'status': status.dict}))
+            await writer.drain()
+
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    LOG.debug('Ignoring malformed broker request: line=%s', line)
+                    continue
+                if 'cancel' in request:
+                    cancelled = tasks.get(request['cancel'])
+                    if cancelled is not None:
+                        cancelled.cancel()
+                    continue
+                request_id = request.get('id')
+                task = asyncio.create_task(self._serve_request(request, writer))
+                tasks[request_id] = task
+                task.add_done_callback(functools.partial(_forget, tasks, request_id))
+        except ConnectionError:
+            pass
+        finally:
+            self._clients.discard(writer)
+            for task in list(tasks.values()):
+                task.cancel()
+            writer.close()
+
+    async def _serve_request(
+        self, request: dict[str, Any], writer: asyncio.StreamWriter
+    ) -> None:
+        request_id = request.get('id')
+        try:
+            result = await self._dispatch(
+                request.get('op', ''),
+                request.get('args', []),
+                request.get('kwargs', {}),
+            )
+            response: dict[str, Any] = {'id': request_id, 'result': result}
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            error = (
+                'TimeoutError' if isinstance(exc, TimeoutError) else type(exc).__name__
+            )
+            response = {'id': request_id, 'error': error, 'message': str(exc)}
+
+        if not writer.is_closing():
+            writer.write(_encode(response))
+            with contextlib.suppress(ConnectionError):
+                await writer.drain()
+
+    async def _dispatch(self, op: str, args: list[Any], kwargs: dict[str, Any]) -> Any:
+        if op == 'cached_status':
+            return self._amp.cached_status(*args)
+        if op not in BROKER_OPS:
+            raise ValueError(f'Unsupported broker operation {op!r}')
+        if op == 'zone_status':
+            return await self._zone_status(*args, **kwargs)
+        return await getattr(self._amp, op)(*args, **kwargs)
+
+    async def _zone_status(
+        self,
+        zone: int,
+        *,
+        max_age: float | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any] | None:
+        """Read a zone, sharing the cache and any read already in flight.
+
+        The shared read is bounded only by the device timeout; each caller
+        waits for it within its own timeout or deadline. A read every caller
+        has given up on is cancelled, so it is not sent if still queued.
+        """
+        tracker: ZoneStateTracker = self._amp.tracker
+        if max_age is not None and not tracker.is_stale(zone):
+            age = tracker.age(zone)
+            if age is not None and age <= max_age:
+                return self._amp.cached_status(zone)  # type: ignore[no-any-return]
+
+        deadline = resolve_deadline(timeout, deadline)
+        remaining = None
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError('Deadline passed before sending')
+
+        pending = self._status_reads.get(zone)
+        if pending is None:
+            pending = asyncio.ensure_future(self._amp.zone_status(zone, **kwargs))
+            self._status_reads[zone] = pending
+            pending.add_done_callback(lambda _: self._status_reads.pop(zone, None))
+        self._status_waiters[zone] = self._status_waiters.get(zone, 0) + 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(pending), remaining)
+        finally:
+            waiters = self._status_waiters.pop(zone) - 1
+            if waiters:
+                self._status_waiters[zone] = waiters
+            elif not pending.done():
+                pending.cancel()
+
+    def _on_change(self, event: ZoneChangeEvent) -> None:
+        # one status push per changed zone, however many fields changed
+        self._dirty.add(event.zone)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush_changes)
+
+    def _flush_changes(self) -> None:
+        self._flush_scheduled = False
+        zones, self._dirty = self._dirty, set()
+        tracker: ZoneStateTracker = self._amp.tracker
+        payload = b''.join(
+            _encode({'event': 'status', 'status': status.dict})
+            for zone in sorted(zones)
+            if (status := tracker.get(zone)) is not None
+        )
+        self._push(payload)
+
+    def _on_link_change(self, event: LinkStateEvent) -> None:
+        self._push(
+            _encode({'event': 'link', 'state': event.new, 'failures': event.failures})
+        )
+
+    def _push(self, payload: bytes) -> None:
+        """Send an event to every client, dropping clients too slow to read."""
+        for writer in list(self._clients):
+            if writer.is_closing():
+                continue
+            if writer.transport.get_write_buffer_size() > MAX_CLIENT_BACKLOG:
+                LOG.warning('Disconnecting broker client not reading events')
+                self._clients.discard(writer)
+                writer.close()
+                continue
+            writer.write(payload)
+
+
+async def serve_broker(
+    amp_type: str,
+    port_url: str,
+    socket_path: str | Path = DEFAULT_SOCKET_PATH,
+    serial_config_overrides: dict[str, Any] | None = None,
+    **kwargs: Any,
+) -> AmpBroker | None:
+    """Open an amplifier and start a broker for it.
+
+    Args:
+        amp_type: Amplifier type (e.g., 'xantech8', 'monoprice6').
+        port_url: Serial port path or URL.
+        socket_path: Unix domain socket path to listen on.
+        serial_config_overrides: Optional serial port configuration overrides.
+        **kwargs: Options passed through to async_get_amp_controller.
+
+    Returns:
+        Started AmpBroker or None if amp_type is unsupported.
+    """
+    amp = await async_get_amp_controller(
+        amp_type,
+        port_url,
+        asyncio.get_running_loop(),
+        serial_config_overrides,
+        **kwargs,
+    )
+    if amp is None:
+        return None
+    broker = AmpBroker(amp, amp_type, socket_path)
+    await broker.start()
+    return broker
+
+
+async def async_get_broker_controller(
+    socket_path: str | Path = DEFAULT_SOCKET_PATH,
+    *,
+    call_timeout: float = DEFAULT_CALL_TIMEOUT,
+) -> AmpControlAsyncBase:
+    """Connect to a broker and return an async controller backed by it.
+
+    Args:
+        socket_path: Unix domain socket path of the broker.
+        call_timeout: Seconds to wait for the reply to a call made without
+            a timeout or deadline.
+
+    Returns:
+        Async amplifier control interface.
+
+    Raises:
+        ConnectionError: If the broker cannot be reached or is incompatible.
+    """
+
+    class AmpControlBroker(AmpControlAsyncBase):
+        """Async controller that forwards every request to a broker.
+
+        The zone state cache mirrors the broker's, so cached_status() and
+        change listeners see updates caused by any client.
+        """
+
+        def __init__(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter,
+            amp_type: str,
+            call_timeout: float,
+            link_state: str = BREAKER_CLOSED,
+            failures: int = 0,
+        ) -> None:
+            self._amp_type = amp_type
+            self._call_timeout = call_timeout
+            self._reader = reader
+            self._writer = writer
+            self._tracker = ZoneStateTracker()
+            self._layout = get_chassis_layout(amp_type)
+            # the serial link is traced and guarded by the broker process,
+            # which relays its breaker state
+            self._trace = CommandTrace()
+            self._link = _RelayedBreaker()
+            self._link.relay(link_state, failures)
+            self._breaker = self._link
+            self._ids = itertools.count(1)
+            self._pending: dict[int, asyncio.Future[Any]] = {}
+            self._receiver = asyncio.create_task(self._receive())
+
+        async def _receive(self) -> None:
+            try:
+                while line := await self._reader.readline():
+                    message = json.loads(line)
+                    if 'id' in message:
+                        self._resolve(message)
+                    elif message.get('event') == 'status':
+                        self._tracker.update(ZoneStatus.from_dict(message['status']))
+                    elif message.get('event') == 'link':
+                        self._link.relay(message['state'], message['failures'])
+            except (ConnectionError, ValueError) as exc:
+                LOG.debug('Broker connection failed: error=%s', exc)
+            finally:
+                for future in self._pending.values():
+                    if not future.done():
+                        future.set_exception(
+                            ConnectionError('Broker connection closed')
+                        )
+                self._pending.clear()
+
+        def _resolve(self, message: dict[str, Any]) -> None:
+            future = self._pending.pop(message['id'], None)
+            if future is None or future.done():
+                return
+            if 'error' in message:
+                error = _ERRORS.get(message['error'])
+                if error is None:
+                    future.set_exception(
+                        BrokerError(f'{message["error"]}: {message.get("message", "")}')
+                    )
+                else:
+                    future.set_exception(error(message.get('message', '')))
+            else:
+                future.set_result(message.get('result'))
+
+        async def call(self, op: str, *args: Any, **kwargs: Any) -> Any:
+            """Invoke a controller method on the broker.
+
+            The reply is awaited until the call's own timeout or deadline (plus
+            REPLY_GRACE), else for the client's call timeout. A call that
+            times out or is cancelled is abandoned on the broker too.
+
+            Args:
+                op: Method name (see BROKER_OPS).
+                *args: Positional arguments.
+                **kwargs: Keyword arguments.
+
+            Returns:
+                The method's result.
+
+            Raises:
+                asyncio.TimeoutError: If no reply arrived in time.
+                ConnectionError: If the broker connection is closed.
+            """
+            return await self._call(op, args, kwargs, self._call_timeout)
+
+        async def _call(
+            self,
+            op: str,
+            args: Sequence[Any],
+            kwargs: dict[str, Any],
+            wait: float,
+        ) -> Any:
+            if self._receiver.done():
+                raise ConnectionError('Broker connection closed')
+            kwargs = {key: value for key, value in kwargs.items() if value is not None}
+            deadline = resolve_deadline(kwargs.get('timeout'), kwargs.get('deadline'))
+            if deadline is not None:
+                wait = max(0.0, deadline - time.monotonic()) + REPLY_GRACE
+
+            request_id = next(self._ids)
+            future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+            self._pending[request_id] = future
+            self._writer.write(
+                _encode(
+                    {'id': request_id, 'op': op, 'args': list(args), 'kwargs': kwargs}
+                )
+            )
+            try:
+                await self._writer.drain()
+                return await asyncio.wait_for(future, wait)
+            except (TimeoutError, asyncio.CancelledError):
+                if not self._writer.is_closing():
+                    self._writer.write(_encode({'cancel': request_id}))
+                raise
+            finally:
+                self._pending.pop(request_id, None)
+
+        async def zone_status(
+            self,
+            zone: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+            max_age: float | None = None,
+        ) -> dict[str, Any] | None:
+            """Get the current status of a zone.
+
+            Args:
+                zone: Zone number.
+                timeout: Give up after this many seconds, including queue time.
+                deadline: Give up at this time.monotonic() value.
+                max_age: Accept the broker's cached status if it was read from
+                    the amp at most this many seconds ago.
+
+            Returns:
+                Dictionary with zone status or None if unavailable.
+            """
+            result = await self.call(
+                'zone_status', zone, timeout=timeout, deadline=deadline, max_age=max_age
+            )
+            if result is not None:
+                self._tracker.update(ZoneStatus.from_dict(result))
+            return result  # type: ignore[no-any-return]
+
+        async def zone_statuses(
+            self,
+            zones: list[int] | None = None,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> dict[int, dict[str, Any]]:
+            """Read several zones, grouped per chassis on the broker."""
+            result = await self.call(
+                'zone_statuses', zones, timeout=timeout, deadline=deadline
+            )
+            statuses = {int(zone): status for zone, status in result.items()}
+            for status in statuses.values():
+                self._tracker.update(ZoneStatus.from_dict(status))
+            return statuses
+
+        async def refresh(
+            self,
+            zone: int,
+            fields: Iterable[str] | None = None,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> dict[str, Any]:
+            """Read selected zone attributes on the broker (see AmpControlAsync)."""
+            result = await self.call(
+                'refresh',
+                zone,
+                None if fields is None else list(fields),
+                timeout=timeout,
+                deadline=deadline,
+            )
+            self._tracker.merge(zone, result)
+            return result  # type: ignore[no-any-return]
+
+        async def probe_chassis(
+            self,
+            *,
+            force: bool = False,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> tuple[int, ...]:
+            """Find which chained chassis answer (see AmpControlAsync)."""
+            units = tuple(
+                await self.call(
+                    'probe_chassis', force=force, timeout=timeout, deadline=deadline
+                )
+            )
+            self._present_units = set(units)
+            return units
+
+        async def get_power(self, zone: int, **kwargs: Any) -> bool | None:
+            """Read a zone's power state with a single-attribute query."""
+            return (await self.refresh(zone, ('power',), **kwargs)).get('power')
+
+        async def get_mute(self, zone: int, **kwargs: Any) -> bool | None:
+            """Read a zone's mute state with a single-attribute query."""
+            return (await self.refresh(zone, ('mute',), **kwargs)).get('mute')
+
+        async def get_volume(self, zone: int, **kwargs: Any) -> int | None:
+            """Read a zone's volume with a single-attribute query."""
+            return (await self.refresh(zone, ('volume',), **kwargs)).get('volume')
+
+        async def get_source(self, zone: int, **kwargs: Any) -> int | None:
+            """Read a zone's source with a single-attribute query."""
+            return (await self.refresh(zone, ('source',), **kwargs)).get('source')
+
+        async def revalidate_stale(
+            self,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            """Re-read stale zones on the broker."""
+            await self.call('revalidate_stale', timeout=timeout, deadline=deadline)
+
+        async def execute(
+            self,
+            feature: str,
+            action: str,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+            **values: Any,
+        ) -> dict[str, Any] | None:
+            """Run any protocol command on the broker (see AmpControlAsync)."""
+            return await self.call(  # type: ignore[no-any-return]
+                'execute', feature, action, timeout=timeout, deadline=deadline, **values
+            )
+
+        async def set_power(
+            self,
+            zone: int,
+            power: bool,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            await self.call(
+                'set_power', zone, power, timeout=timeout, deadline=deadline
+            )
+
+        async def set_mute(
+            self,
+            zone: int,
+            mute: bool,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            await self.call('set_mute', zone, mute, timeout=timeout, deadline=deadline)
+
+        async def set_volume(
+            self,
+            zone: int,
+            volume: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            await self.call(
+                'set_volume', zone, volume, timeout=timeout, deadline=deadline
+            )
+
+        async def set_treble(
+            self,
+            zone: int,
+            treble: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            await self.call(
+                'set_treble', zone, treble, timeout=timeout, deadline=deadline
+            )
+
+        async def set_bass(
+            self,
+            zone: int,
+            bass: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            await self.call('set_bass', zone, bass, timeout=timeout, deadline=deadline)
+
+        async def set_balance(
+            self,
+            zone: int,
+            balance: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            await self.call(
+                'set_balance', zone, balance, timeout=timeout, deadline=deadline
+            )
+
+        async def set_source(
+            self,
+            zone: int,
+            source: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            await self.call(
+                'set_source', zone, source, timeout=timeout, deadline=deadline
+            )
+
+        async def update_zone(
+            self,
+            zone: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+            **values: Any,
+        ) -> dict[str, Any]:
+            """Apply several zone settings as one group on the broker."""
+            return await self.call(  # type: ignore[no-any-return]
+                'update_zone', zone, timeout=timeout, deadline=deadline, **values
+            )
+
+        async def set_power_many(
+            self,
+            zones: Iterable[int],
+            power: bool,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            await self.call(
+                'set_power_many', list(zones), power, timeout=timeout, deadline=deadline
+            )
+
+        async def set_mute_many(
+            self,
+            zones: Iterable[int],
+            mute: bool,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            await self.call(
+                'set_mute_many', list(zones), mute, timeout=timeout, deadline=deadline
+            )
+
+        async def set_volume_many(
+            self,
+            zones: Iterable[int],
+            volume: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            await self.call(
+                'set_volume_many',
+                list(zones),
+                volume,
+                timeout=timeout,
+                deadline=deadline,
+            )
+
+        async def set_source_many(
+            self,
+            zones: Iterable[int],
+            source: int,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            await self.call(
+                'set_source_many',
+                list(zones),
+                source,
+                timeout=timeout,
+                deadline=deadline,
+            )
+
+        async def all_off(
+            self,
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            """Turn off all zones."""
+            await self.call('all_off', timeout=timeout, deadline=deadline)
+
+        async def restore_zone(
+            self,
+            status: dict[str, Any],
+            *,
+            timeout: float | None = None,
+            deadline: float | None = None,
+        ) -> None:
+            await self.call('restore_zone', status, timeout=timeout, deadline=deadline)
+
+        async def ramp_volume(
+            self,
+            zones: Iterable[int],
+            target: int,
+            duration: float,
+            curve: str = 'linear',
+            **kwargs: Any,
+        ) -> None:
+            """Fade zone volumes on the broker (see AmpControlAsync.ramp_volume)."""
+            await self._call(
+                'ramp_volume',
+                [list(zones), target, duration, curve],
+                kwargs,
+                duration + self._call_timeout,
+            )
+
+        async def close(self) -> None:
+            """Disconnect from the broker (the broker keeps the port open)."""
+            self._writer.close()
+            with contextlib.suppress(ConnectionError):
+                await self._writer.wait_closed()
+            await self._receiver
+
+    try:
+        reader, writer = await asyncio.open_unix_connection(str(socket_path))
+        hello = json.loads(await reader.readline())
+    except (OSError, ValueError) as exc:
+        raise ConnectionError(
+            f'Cannot connect to broker at {socket_path}: {exc}'
+        ) from exc
+
+    if hello.get('event') != 'hello' or hello.get('version') != BROKER_PROTOCOL_VERSION:
+        writer.close()
+        raise ConnectionError(f'Incompatible broker at {socket_path}: {hello}')
+    return AmpControlBroker(
+        reader,
+        writer,
+        hello.get('amp_type', ''),
+        call_timeout,
+        hello.get('link_state', BREAKER_CLOSED),
+        hello.get('failures', 0),
+    )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='pyxantech-broker',
+        description='Share one amplifier serial port between several processes',
+    )
+    parser.add_argument('amp_type', choices=sorted(SUPPORTED_AMP_TYPES))
+    parser.add_argument('port_url', help='serial port or URL (e.g. /dev/ttyUSB0)')
+    parser.add_argument(
+        '--socket',
+        default=DEFAULT_SOCKET_PATH,
+        help=f'Unix domain socket to listen on (default {DEFAULT_SOCKET_PATH})',
+    )
+    parser.add_argument('--baud', type=int, help='override the series baud rate')
+    parser.add_argument('--snapshot', help='persist zone state to this file')
+    return parser
+
+
+async def _async_main(args: argparse.Namespace) -> int:
+    overrides = {'baudrate': args.baud} if args.baud else None
+    broker = await serve_broker(
+        args.amp_type,
+        args.port_url,
+        args.socket,
+        overrides,
+        snapshot_path=args.snapshot,
+    )
+    if broker is None:
+        return 2
+    try:
+        await broker.serve_forever()
+    finally:
+        await broker.close()
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Console entry point."""
+    logging.basicConfig(level=logging.INFO)
+    args = _build_parser().parse_args(argv)
+    try:
+        return asyncio.run(_async_main(args))
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
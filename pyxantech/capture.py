@@ -0,0 +1,265 @@
+"""Serial traffic capture and replay.
+
+Captures are compact append-only binary files: a magic header followed by
+records of ``<timestamp:f64><direction:u8><length:u32><data>`` (little endian),
+with monotonic timestamps. A ReplayTransport feeds a capture back into an
+RS232ControlProtocol at the original or an accelerated speed, so parser and
+pacing changes can be benchmarked against real site traffic. Use a
+``replay://<path>?speed=<factor>`` port URL with async_get_amp_controller.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from pathlib import Path
+import struct
+import time
+from typing import IO, TYPE_CHECKING, Any, NamedTuple
+from urllib.parse import parse_qs, urlsplit
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+LOG = logging.getLogger(__name__)
+
+CAPTURE_MAGIC = b'PYXCAP1\n'
+REPLAY_URL_SCHEME = 'replay'
+
+DIRECTION_WRITE = 0
+DIRECTION_READ = 1
+
+_RECORD_HEADER = struct.Struct('<dBI')
+
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+
+class CaptureRecord(NamedTuple):
+    """A single captured write or read chunk.
+
+    Attributes:
+        timestamp: time.monotonic() when the chunk was written or received.
+        direction: DIRECTION_WRITE or DIRECTION_READ.
+        data: Raw bytes.
+    """
+
+    timestamp: float
+    direction: int
+    data: bytes
+
+
+class CaptureWriter:
+    """Append-only writer for serial traffic captures.
+
+    Records are buffered and flushed at most every flush_interval seconds, so
+    capture can stay enabled in production.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ) -> None:
+        self._path = Path(path)
+        self._file: IO[bytes] = self._path.open('ab')
+        if self._file.tell() == 0:
+            self._file.write(CAPTURE_MAGIC)
+        self._flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+
+    @property
+    def path(self) -> Path:
+        """Path of the capture file."""
+        return self._path
+
+    def record(self, direction: int, data: bytes) -> None:
+        """Append a record for a chunk of serial traffic."""
+        now = time.monotonic()
+        self._file.write(_RECORD_HEADER.pack(now, direction, len(data)))
+        self._file.write(data)
+        if now - self._last_flush >= self._flush_interval:
+            self._file.flush()
+            self._last_flush = now
+
+    def write(self, data: bytes) -> None:
+        """Record bytes written to the amp."""
+        self.record(DIRECTION_WRITE, data)
+
+    def read(self, data: bytes) -> None:
+        """Record bytes received from the amp."""
+        self.record(DIRECTION_READ, data)
+
+    def flush(self) -> None:
+        """Flush buffered records to disk."""
+        if not self._file.closed:
+            self._file.flush()
+            self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Flush and close the capture file."""
+        if not self._file.closed:
+            self._file.close()
+
+
+def read_capture(path: str | Path) -> Iterator[CaptureRecord]:
+    """Iterate over the records of a capture file.
+
+    Args:
+        path: Capture file path.
+
+    Yields:
+        CaptureRecord for every complete record in the file.
+
+    Raises:
+        ValueError: If the file is not a capture file.
+    """
+    with Path(path).open('rb') as stream:
+        if stream.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+            raise ValueError(f'Not a pyxantech capture file: {path}')
+
+        header_size = _RECORD_HEADER.size
+        while True:
+            header = stream.read(header_size)
+            if len(header) < header_size:
+                return
+            timestamp, direction, length = _RECORD_HEADER.unpack(header)
+            data = stream.read(length)
+            if len(data) < length:
+                LOG.debug('Truncated capture record: path=%s', path)
+                return
+            yield CaptureRecord(timestamp, direction, data)
+
+
+def parse_replay_url(url: str) -> tuple[Path, float]:
+    """Split a replay:// URL into capture path and speed factor.
+
+    Args:
+        url: URL such as 'replay:///var/tmp/site.cap?speed=10'.
+
+    Returns:
+        Tuple of (capture path, speed); speed 0 replays without delays.
+    """
+    parts = urlsplit(url)
+    if parts.scheme != REPLAY_URL_SCHEME:
+        raise ValueError(f'Not a replay URL: {url}')
+    speed = float(parse_qs(parts.query).get('speed', ['1.0'])[0])
+    return Path(parts.netloc + parts.path), speed
+
+
+class ReplayTransport(asyncio.Transport):
+    """Transport that answers writes with the replies from a capture.
+
+    Each write advances to the next captured write and schedules the read
+    chunks that followed it, using the captured delays divided by speed.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        protocol: asyncio.Protocol,
+        records: list[CaptureRecord],
+        speed: float = 1.0,
+    ) -> None:
+        super().__init__()
+        self._loop = loop
+        self._protocol = protocol
+        self._records = records
+        self._speed = speed
+        self._cursor = 0
+        self._closing = False
+        self._handles: list[asyncio.TimerHandle | asyncio.Handle] = []
+        self.mismatched_writes = 0
+
+        loop.call_soon(protocol.connection_made, self)
+        # deliver any traffic captured before the first write
+        self._schedule_reads(records[0].timestamp if records else 0.0)
+
+    @property
+    def serial(self) -> None:
+        """Replay has no underlying serial port."""
+        return None
+
+    @property
+    def finished(self) -> bool:
+        """Whether every captured record has been replayed."""
+        return self._cursor >= len(self._records)
+
+    def get_extra_info(self, name: str, default: Any = None) -> Any:
+        return default
+
+    def is_closing(self) -> bool:
+        return self._closing
+
+    def write(self, data: bytes | bytearray | memoryview) -> None:
+        if self._closing:
+            return
+
+        records = self._records
+        while (
+            self._cursor < len(records)
+            and records[self._cursor].direction != DIRECTION_WRITE
+        ):
+            self._cursor += 1
+        if self._cursor >= len(records):
+            LOG.debug('Replay exhausted, ignoring write: data=%s', bytes(data))
+            return
+
+        expected = records[self._cursor]
+        if expected.data != bytes(data):
+            self.mismatched_writes += 1
+        self._cursor += 1
+        self._schedule_reads(expected.timestamp)
+
+    def _schedule_reads(self, origin: float) -> None:
+        records = self._records
+        while (
+            self._cursor < len(records)
+            and records[self._cursor].direction == DIRECTION_READ
+        ):
+            record = records[self._cursor]
+            self._cursor += 1
+            if self._speed > 0:
+                delay = max(0.0, record.timestamp - origin) / self._speed
+                handle: asyncio.TimerHandle | asyncio.Handle = self._loop.call_later(
+                    delay, self._deliver, record.data
+                )
+            else:
+                handle = self._loop.call_soon(self._deliver, record.data)
+            self._handles.append(handle)
+
+    def _deliver(self, data: bytes) -> None:
+        if not self._closing:
+            self._protocol.data_received(data)
+
+    def close(self) -> None:
+        if self._closing:
+            return
+        self._closing = True
+        for handle in self._handles:
+            handle.cancel()
+        self._loop.call_soon(self._protocol.connection_lost, None)
+
+    def abort(self) -> None:
+        self.close()
+
+
+async def create_replay_connection(
+    loop: asyncio.AbstractEventLoop,
+    protocol_factory: Any,
+    url: str,
+) -> tuple[asyncio.Transport, asyncio.Protocol]:
+    """Connect a protocol to a ReplayTransport for a replay:// URL.
+
+    Args:
+        loop: Event loop to schedule replies on.
+        protocol_factory: Callable returning the protocol instance.
+        url: Replay URL (see parse_replay_url).
+
+    Returns:
+        Tuple of (transport, protocol).
+    """
+    path, speed = parse_replay_url(url)
+    records = await loop.run_in_executor(None, lambda: list(read_capture(path)))
+    protocol = protocol_factory()
+    return ReplayTransport(loop, protocol, records, speed), protocol
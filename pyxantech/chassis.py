@@ -0,0 +1,136 @@
+"""Multi-chassis zone addressing.
+
+Several series address chained amps with two-digit zone ids, where the tens
+digit is the unit (chassis) and the ones digit the zone within it: 11-16 are
+the main amp, 21-26 the first expansion, 31-36 the second. Single-unit series
+use plain zone numbers. Series with plain numbering may also list two-digit
+'alternative_zones' for expansion amps (xantech8: 21-28), capped by
+'features.max_expansion_amps'; their unit-1 ids (11-18) alias the plain zones.
+A ChassisLayout decodes zone ids once per series into a precomputed index so
+bulk operations can group and skip zones per unit.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, NamedTuple
+
+from .config import DEVICE_CONFIG
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class ZoneAddress(NamedTuple):
+    """A zone id decoded into its chassis and position.
+
+    Attributes:
+        unit: Chassis number (1 for the main amp).
+        zone: Zone number within the chassis.
+    """
+
+    unit: int
+    zone: int
+
+
+class ChassisLayout:
+    """Precomputed zone-to-chassis index for one series.
+
+    Args:
+        zones: Every zone id the series supports.
+        alternative_zones: Two-digit ids of a plain-numbered series; unit-1 ids
+            alias the plain zones, higher units are expansion chassis.
+        max_units: Ignore alternative ids beyond this many chassis.
+    """
+
+    def __init__(
+        self,
+        zones: Iterable[int],
+        alternative_zones: Iterable[int] = (),
+        max_units: int | None = None,
+    ) -> None:
+        zone_ids = sorted(zones)
+        # two-digit ids encode the unit; plain numbering is a single chassis
+        multi_unit = bool(zone_ids) and all(10 < zone < 100 for zone in zone_ids)
+
+        self._index: dict[int, ZoneAddress] = {
+            zone: ZoneAddress(*divmod(zone, 10)) if multi_unit else ZoneAddress(1, zone)
+            for zone in zone_ids
+        }
+        units: dict[int, list[int]] = {}
+        for zone, address in self._index.items():
+            units.setdefault(address.unit, []).append(zone)
+
+        for zone in sorted(alternative_zones):
+            if zone in self._index or not 10 < zone < 100:
+                continue
+            address = ZoneAddress(*divmod(zone, 10))
+            if max_units is not None and address.unit > max_units:
+                continue
+            self._index[zone] = address
+            if address.unit != 1 or multi_unit:
+                units.setdefault(address.unit, []).append(zone)
+            # else: an alias of a plain zone, addressable but not listed twice
+
+        self._units = {unit: tuple(unit_zones) for unit, unit_zones in units.items()}
+        self._zones = tuple(
+            zone for unit_zones in units.values() for zone in unit_zones
+        )
+
+    def __contains__(self, zone: object) -> bool:
+        return zone in self._index
+
+    @property
+    def units(self) -> tuple[int, ...]:
+        """All chassis numbers the series can address."""
+        return tuple(self._units)
+
+    @property
+    def zones(self) -> tuple[int, ...]:
+        """All zone ids (without aliases), in ascending order."""
+        return self._zones
+
+    def address(self, zone: int) -> ZoneAddress:
+        """Decode a zone id.
+
+        Raises:
+            ValueError: If the zone is not valid for the series.
+        """
+        try:
+            return self._index[zone]
+        except KeyError:
+            raise ValueError(f'Invalid zone {zone}') from None
+
+    def unit_of(self, zone: int) -> int:
+        """Return the chassis number of a zone id."""
+        return self.address(zone).unit
+
+    def zones_of(self, unit: int) -> tuple[int, ...]:
+        """Return the zone ids of one chassis (empty for unknown units)."""
+        return self._units.get(unit, ())
+
+    def group_by_unit(self, zones: Iterable[int]) -> dict[int, list[int]]:
+        """Group zone ids by chassis, preserving order within each unit."""
+        grouped: dict[int, list[int]] = {}
+        for zone in zones:
+            grouped.setdefault(self.unit_of(zone), []).append(zone)
+        return grouped
+
+
+@functools.cache
+def get_chassis_layout(amp_type: str) -> ChassisLayout:
+    """Return the (cached) chassis layout of a series.
+
+    Args:
+        amp_type: Amplifier type (e.g., 'monoprice6').
+
+    Returns:
+        ChassisLayout built from the series 'zones' and 'alternative_zones'.
+    """
+    config = DEVICE_CONFIG[amp_type]
+    max_expansion = (config.get('features') or {}).get('max_expansion_amps')
+    return ChassisLayout(
+        config.get('zones') or {},
+        config.get('alternative_zones') or {},
+        None if max_expansion is None else 1 + max_expansion,
+    )
@@ -0,0 +1,226 @@
+"""Command-line batch runner for multi-zone amplifiers.
+
+Runs a script of commands against an amp and prints one JSON result per
+command, optionally with per-command timing:
+
+    pyxantech monoprice6 /dev/ttyUSB0 -c '11 volume 20' -c 'status *' --timing
+    pyxantech xantech8 socket://ip2sl.local:4999 script.txt
+
+Script syntax (one command per line, '#' starts a comment):
+
+    <zone> power|mute on|off
+    <zone> volume|source|bass|treble|balance <value>
+    <zone> status
+    status *|<zone>
+    all off
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from . import SUPPORTED_AMP_TYPES, async_get_amp_controller, get_device_config
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+BOOL_VALUES = {
+    'on': True,
+    'off': False,
+    '1': True,
+    '0': False,
+    'true': True,
+    'false': False,
+}
+BOOL_ATTRIBUTES = ('power', 'mute')
+INT_ATTRIBUTES = ('volume', 'source', 'bass', 'treble', 'balance')
+
+
+class ScriptCommand(NamedTuple):
+    """A parsed script command.
+
+    Attributes:
+        line: Original script line.
+        action: 'set', 'status' or 'all_off'.
+        zone: Target zone (None for amp-wide commands).
+        attribute: Attribute to set (for 'set').
+        value: Value to set (for 'set').
+    """
+
+    line: str
+    action: str
+    zone: int | None = None
+    attribute: str | None = None
+    value: Any = None
+
+
+def parse_command(line: str, zones: Iterable[int]) -> list[ScriptCommand]:
+    """Parse a script line into one or more commands.
+
+    Args:
+        line: Script line such as '11 volume 20' or 'status *'.
+        zones: Valid zones for the amp ('*' expands to all of them).
+
+    Returns:
+        Parsed commands (empty for blank lines and comments).
+
+    Raises:
+        ValueError: If the line cannot be parsed.
+    """
+    text = line.split('#', 1)[0].strip()
+    if not text:
+        return []
+    words = text.lower().split()
+
+    if words == ['all', 'off']:
+        return [ScriptCommand(line, 'all_off')]
+
+    if words[0] == 'status' and len(words) == 2:
+        words = [words[1], 'status']
+
+    if len(words) == 2 and words[1] == 'status':
+        targets = list(zones) if words[0] == '*' else [int(words[0])]
+        return [ScriptCommand(line, 'status', zone) for zone in targets]
+
+    if len(words) == 3:
+        zone, attribute, raw = int(words[0]), words[1], words[2]
+        if attribute in BOOL_ATTRIBUTES:
+            if raw not in BOOL_VALUES:
+                raise ValueError(f'Invalid {attribute} value {raw!r}: {line}')
+            return [ScriptCommand(line, 'set', zone, attribute, BOOL_VALUES[raw])]
+        if attribute in INT_ATTRIBUTES:
+            return [ScriptCommand(line, 'set', zone, attribute, int(raw))]
+
+    raise ValueError(f'Unrecognized command: {line}')
+
+
+def parse_script(lines: Iterable[str], zones: Iterable[int]) -> list[ScriptCommand]:
+    """Parse every line of a script (see parse_command)."""
+    zones = list(zones)
+    return [command for line in lines for command in parse_command(line, zones)]
+
+
+async def _execute(amp: Any, command: ScriptCommand) -> Any:
+    if command.action == 'status':
+        return await amp.zone_status(command.zone)
+    if command.action == 'all_off':
+        return await amp.all_off()
+    setter = getattr(amp, f'set_{command.attribute}')
+    return await setter(command.zone, command.value)
+
+
+async def run_script(
+    amp: Any,
+    commands: Sequence[ScriptCommand],
+) -> list[dict[str, Any]]:
+    """Run commands and collect JSON-serializable results.
+
+    All commands are submitted together so the controller can pipeline them
+    on the line; results are returned in script order.
+
+    Args:
+        amp: Async amplifier controller.
+        commands: Parsed script commands.
+
+    Returns:
+        One result dict per command with 'ok', 'result'/'error' and 'elapsed'.
+    """
+    clock = time.perf_counter
+    began = clock()
+
+    async def timed(command: ScriptCommand) -> dict[str, Any]:
+        start = clock()
+        entry: dict[str, Any] = {'command': command.line.strip()}
+        if command.zone is not None:
+            entry['zone'] = command.zone
+        try:
+            entry['result'] = await _execute(amp, command)
+            entry['ok'] = True
+        except Exception as exc:
+            entry['ok'] = False
+            entry['error'] = f'{type(exc).__name__}: {exc}'
+        end = clock()
+        entry['started'] = round(start - began, 6)
+        entry['elapsed'] = round(end - start, 6)
+        return entry
+
+    return list(await asyncio.gather(*(timed(command) for command in commands)))
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='pyxantech',
+        description='Run a batch of commands against a multi-zone amplifier',
+    )
+    parser.add_argument('amp_type', choices=sorted(SUPPORTED_AMP_TYPES))
+    parser.add_argument('port_url', help='serial port or URL (e.g. /dev/ttyUSB0)')
+    parser.add_argument(
+        'script',
+        nargs='?',
+        help="script file ('-' for stdin); one command per line",
+    )
+    parser.add_argument(
+        '-c',
+        '--command',
+        action='append',
+        default=[],
+        help="command to run (repeatable), e.g. '11 volume 20'",
+    )
+    parser.add_argument('--baud', type=int, help='override the series baud rate')
+    parser.add_argument(
+        '--timing',
+        action='store_true',
+        help='include per-command start offset and elapsed seconds',
+    )
+    return parser
+
+
+async def _async_main(args: argparse.Namespace, lines: list[str]) -> int:
+    zones = list(get_device_config(args.amp_type, 'zones') or [])
+    try:
+        commands = parse_script(lines, zones)
+    except ValueError as exc:
+        print(json.dumps({'ok': False, 'error': str(exc)}), file=sys.stderr)
+        return 2
+
+    overrides = {'baudrate': args.baud} if args.baud else None
+    amp = await async_get_amp_controller(
+        args.amp_type, args.port_url, asyncio.get_running_loop(), overrides
+    )
+    if amp is None:
+        return 2
+
+    try:
+        results = await run_script(amp, commands)
+    finally:
+        await amp.close()
+
+    for entry in results:
+        if not args.timing:
+            entry.pop('started')
+            entry.pop('elapsed')
+        print(json.dumps(entry, default=str))
+    return 0 if all(entry['ok'] for entry in results) else 1
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Console entry point."""
+    args = _build_parser().parse_args(argv)
+
+    lines = list(args.command)
+    if args.script == '-':
+        lines.extend(sys.stdin.read().splitlines())
+    elif args.script:
+        with open(args.script, encoding='utf-8') as stream:
+            lines.extend(stream.read().splitlines())
+
+    return asyncio.run(_async_main(args, lines))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
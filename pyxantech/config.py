@@ -8,18 +8,21 @@ This module handles loading YAML configuration files that define:
 from __future__ import annotations
 
 import logging
-import re
 from pathlib import Path
+import re
 from typing import Any
 
 import yaml
 
+from .levels import LevelTable, build_level_tables
+
 LOG = logging.getLogger(__name__)
 
 # global configuration dictionaries populated at module load
 DEVICE_CONFIG: dict[str, dict[str, Any]] = {}
 PROTOCOL_CONFIG: dict[str, dict[str, Any]] = {}
 RS232_RESPONSE_PATTERNS: dict[str, dict[str, re.Pattern[str]]] = {}
+LEVEL_TABLES: dict[str, dict[str, LevelTable]] = {}
 
 
 def _load_config(config_file: Path) -> dict[str, Any] | None:
@@ -138,14 +141,32 @@ def _precompile_response_patterns() -> dict[str, dict[str, re.Pattern[str]]]:
     return precompiled
 
 
+def _expand_level_tables() -> dict[str, dict[str, LevelTable]]:
+    """Expand every series' step-to-dB tables into array lookups.
+
+    Returns:
+        Nested dictionary mapping series to field name to LevelTable.
+    """
+    tables: dict[str, dict[str, LevelTable]] = {}
+    for series, config in DEVICE_CONFIG.items():
+        protocol = PROTOCOL_CONFIG.get(config.get('protocol', ''))
+        try:
+            tables[series] = build_level_tables(config, protocol)
+        except (TypeError, ValueError, AttributeError):
+            LOG.exception('Failed expanding level tables: series=%s', series)
+            tables[series] = {}
+    return tables
+
+
 def _initialize_config() -> None:
     """Initialize global configuration by loading all config files."""
-    global DEVICE_CONFIG, PROTOCOL_CONFIG, RS232_RESPONSE_PATTERNS
+    global DEVICE_CONFIG, PROTOCOL_CONFIG, RS232_RESPONSE_PATTERNS, LEVEL_TABLES
 
     config_dir = Path(__file__).parent
     DEVICE_CONFIG = _load_config_dir(config_dir / 'series')
     PROTOCOL_CONFIG = _load_config_dir(config_dir / 'protocols')
     RS232_RESPONSE_PATTERNS = _precompile_response_patterns()
+    LEVEL_TABLES = _expand_level_tables()
 
 
 # initialize configuration on module import
@@ -0,0 +1,194 @@
+"""Find which amplifier is attached to which serial port.
+
+Every port is scanned concurrently, one task per port, so scanning a rack of
+adapters takes about as long as probing a single one. On each port, every
+series is tried in turn with its cheapest identifying query (a power read of
+the first zone, which falls back to a full zone status where the protocol has
+no power query); the first reply matching the series' response patterns
+identifies the amp, and the remaining units are then probed to find the
+chained chassis:
+
+    amps = await discover_amps(['/dev/ttyUSB0', '/dev/ttyUSB1'])
+    for amp in amps:
+        print(amp.port_url, amp.amp_type, amp.baudrate, amp.chassis)
+
+or from the command line:
+
+    pyxantech-discover /dev/ttyUSB0 /dev/ttyUSB1 --scan-baud
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from typing import TYPE_CHECKING, NamedTuple
+
+import serial
+
+from . import SUPPORTED_AMP_TYPES, async_get_amp_controller, get_device_config
+from .baud import candidate_baud_rates
+from .health import AmpUnavailableError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_PROBE_TIMEOUT = 0.3
+
+
+class DiscoveredAmp(NamedTuple):
+    """An amplifier found on a serial port.
+
+    Attributes:
+        port_url: Serial port path or URL.
+        amp_type: Series that answered (e.g. 'xantech8').
+        baudrate: Baud rate it answered at.
+        chassis: Chained chassis that answered (1 is the main amp).
+    """
+
+    port_url: str
+    amp_type: str
+    baudrate: int
+    chassis: tuple[int, ...]
+
+
+async def _probe(
+    port_url: str, amp_type: str, baudrate: int, timeout: float
+) -> DiscoveredAmp | None:
+    """Probe one series at one baud rate on a port."""
+    overrides = {'baudrate': baudrate, 'timeout': timeout}
+    amp = await async_get_amp_controller(
+        amp_type, port_url, asyncio.get_running_loop(), overrides
+    )
+    if amp is None:
+        return None
+    try:
+        zone = next(iter(get_device_config(amp_type, 'zones')))
+        if await amp.get_power(zone, timeout=timeout) is None:
+            return None
+        chassis = await amp.probe_chassis(timeout=timeout)
+        return DiscoveredAmp(port_url, amp_type, baudrate, chassis or (1,))
+    except (TimeoutError, AmpUnavailableError, UnicodeDecodeError, ValueError):
+        return None
+    finally:
+        await amp.close()
+
+
+async def discover_port(
+    port_url: str,
+    *,
+    amp_types: Iterable[str] | None = None,
+    scan_baud: bool = False,
+    probe_timeout: float = DEFAULT_PROBE_TIMEOUT,
+) -> DiscoveredAmp | None:
+    """Identify the amplifier attached to one port.
+
+    Args:
+        port_url: Serial port path or URL.
+        amp_types: Series to try, in order (defaults to every supported series).
+        scan_baud: Try every candidate baud rate of each series, fastest first,
+            instead of only the series default.
+        probe_timeout: Reply timeout per query, in seconds.
+
+    Returns:
+        The amplifier found, or None if nothing answered.
+    """
+    for amp_type in amp_types or list(SUPPORTED_AMP_TYPES):
+        if scan_baud:
+            rates = candidate_baud_rates(amp_type)
+        else:
+            rates = [get_device_config(amp_type, 'rs232')['baudrate']]
+        for baudrate in rates:
+            try:
+                found = await _probe(port_url, amp_type, baudrate, probe_timeout)
+            except (serial.SerialException, OSError) as exc:
+                LOG.debug(
+                    'Cannot open port for discovery: port=%s, error=%s', port_url, exc
+                )
+                return None
+            if found is not None:
+                LOG.info('Discovered amp: %s', found)
+                return found
+    return None
+
+
+async def discover_amps(
+    port_urls: Iterable[str],
+    *,
+    amp_types: Iterable[str] | None = None,
+    scan_baud: bool = False,
+    probe_timeout: float = DEFAULT_PROBE_TIMEOUT,
+) -> list[DiscoveredAmp]:
+    """Identify the amplifiers attached to several ports concurrently.
+
+    Args:
+        port_urls: Serial port paths or URLs to scan.
+        amp_types: Series to try on each port, in order (defaults to every
+            supported series).
+        scan_baud: Try every candidate baud rate of each series.
+        probe_timeout: Reply timeout per query, in seconds.
+
+    Returns:
+        Amplifiers found, in port order; ports where nothing answered are
+        omitted.
+    """
+    amp_types = list(amp_types) if amp_types is not None else None
+    results = await asyncio.gather(
+        *(
+            discover_port(
+                port_url,
+                amp_types=amp_types,
+                scan_baud=scan_baud,
+                probe_timeout=probe_timeout,
+            )
+            for port_url in dict.fromkeys(port_urls)
+        )
+    )
+    return [result for result in results if result is not None]
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='pyxantech-discover',
+        description='Find which amplifier is attached to which serial port',
+    )
+    parser.add_argument('port_urls', nargs='+', help='serial ports or URLs to scan')
+    parser.add_argument(
+        '--amp-type',
+        action='append',
+        choices=sorted(SUPPORTED_AMP_TYPES),
+        help='only try this series (repeatable)',
+    )
+    parser.add_argument(
+        '--scan-baud', action='store_true', help='try every candidate baud rate'
+    )
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=DEFAULT_PROBE_TIMEOUT,
+        help=f'reply timeout per query in seconds (default {DEFAULT_PROBE_TIMEOUT})',
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Console entry point; prints one JSON object per amp found."""
+    args = _build_parser().parse_args(argv)
+    amps = asyncio.run(
+        discover_amps(
+            args.port_urls,
+            amp_types=args.amp_type,
+            scan_baud=args.scan_baud,
+            probe_timeout=args.timeout,
+        )
+    )
+    for amp in amps:
+        print(json.dumps(amp._asdict()))
+    return 0 if amps else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
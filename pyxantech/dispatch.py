@@ -0,0 +1,241 @@
+"""Compiled command dispatch tables built from protocol YAML.
+
+Protocols with a structured ``api_v2`` section (feature -> action -> cmd/msg)
+are compiled once into CompiledCommand objects, each with its encoder,
+variable validator and compiled response regex. Every command in the flat
+``commands`` map is compiled as well, under the pseudo-feature 'command', so
+any command a protocol defines is reachable with one dictionary lookup:
+
+    table = get_dispatch_table('xantech')
+    table['volume', 'up'].encode(zone=1)              # b'!1VI+'
+    table['command', 'mute_toggle'].encode(zone=2)    # b'!2MT+'
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import functools
+import re
+import string
+from typing import Any
+
+from .config import PROTOCOL_CONFIG
+
+# pseudo-feature under which the flat 'commands' map is compiled
+FLAT_FEATURE = 'command'
+
+_FORMATTER = string.Formatter()
+
+# [[fill]align][sign][z][#][0][width][grouping][.precision][type]
+_FORMAT_SPEC = re.compile(
+    r'(?:.?(?P<align>[<>=^]))?(?P<sign>[-+ ])?z?(?P<alt>#)?(?P<zero>0)?\d*'
+    r'(?P<grouping>[,_])?(?:\.\d+)?(?P<type>[a-zA-Z%])?'
+)
+
+
+@dataclass(frozen=True, slots=True)
+class VariableSpec:
+    """Validation rules for one command variable (from 'api_vars').
+
+    Attributes:
+        name: Variable name.
+        type: Python type values are converted to (without api_vars, int when
+            the command formats the variable as a number, e.g. '{zone:02}').
+        min: Minimum allowed value.
+        max: Maximum allowed value.
+        pattern: Regex the formatted value must fully match.
+    """
+
+    name: str
+    type: type = str
+    min: int | None = None
+    max: int | None = None
+    pattern: re.Pattern[str] | None = None
+
+    def convert(self, value: Any) -> Any:
+        """Convert and validate a value.
+
+        Raises:
+            ValueError: If the value has the wrong type or is out of range.
+        """
+        try:
+            converted = self.type(value)
+        except (TypeError, ValueError):
+            raise ValueError(f'Invalid {self.name} {value!r}') from None
+        if self.min is not None and converted < self.min:
+            raise ValueError(f'{self.name} {converted} below minimum {self.min}')
+        if self.max is not None and converted > self.max:
+            raise ValueError(f'{self.name} {converted} above maximum {self.max}')
+        if self.pattern is not None and not self.pattern.fullmatch(str(converted)):
+            raise ValueError(f'Invalid {self.name} {converted!r}')
+        return converted
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledCommand:
+    """A protocol command ready to encode and whose reply can be decoded.
+
+    Attributes:
+        feature: Feature name (e.g. 'volume').
+        action: Action name (e.g. 'up').
+        template: Full command format string including separator and EOL.
+        variables: Specs for the variables the template uses.
+        response: Compiled reply regex, or None for commands without one.
+    """
+
+    feature: str
+    action: str
+    template: str
+    variables: tuple[VariableSpec, ...]
+    response: re.Pattern[str] | None = None
+
+    def encode(self, **values: Any) -> bytes:
+        """Validate variables and build the command bytes.
+
+        Raises:
+            ValueError: If a variable is missing or invalid.
+        """
+        args = {}
+        for spec in self.variables:
+            if spec.name not in values:
+                raise ValueError(f'{self.feature}.{self.action} requires {spec.name!r}')
+            args[spec.name] = spec.convert(values[spec.name])
+        return self.template.format_map(args).encode('ascii')
+
+    def decode(self, reply: str | None) -> dict[str, str] | None:
+        """Match a reply against the response regex.
+
+        Returns:
+            Named groups of the match, or None if there is no response regex
+            or the reply does not match.
+        """
+        if self.response is None or not reply:
+            return None
+        match = self.response.search(reply)
+        return match.groupdict() if match else None
+
+
+def _variable_specs(protocol_config: dict[str, Any]) -> dict[str, VariableSpec]:
+    types = {'int': int, 'str': str}
+    specs = {}
+    for name, rules in (protocol_config.get('api_vars') or {}).items():
+        rules = rules or {}
+        pattern = rules.get('pattern')
+        specs[name] = VariableSpec(
+            name=name,
+            type=types.get(rules.get('type', 'str'), str),
+            min=rules.get('min'),
+            max=rules.get('max'),
+            pattern=re.compile(pattern) if pattern else None,
+        )
+    return specs
+
+
+def _is_numeric_spec(format_spec: str) -> bool:
+    """Whether a format spec formats numbers (zero padding, sign or int type).
+
+    Formatting a str with such a spec either fails or, for zero padding,
+    silently pads on the right ('5' with '02' gives '50').
+    """
+    match = _FORMAT_SPEC.fullmatch(format_spec)
+    if match is None:
+        return False
+    return bool(
+        match['align'] == '='
+        or match['sign']
+        or match['alt']
+        or match['zero']
+        or match['grouping']
+        or (match['type'] and match['type'] in 'bcdoxXn')
+    )
+
+
+def _compile(
+    feature: str,
+    action: str,
+    cmd: str,
+    msg: str | None,
+    suffix: str,
+    specs: dict[str, VariableSpec],
+) -> CompiledCommand:
+    variables: dict[str, VariableSpec] = {}
+    for _, name, format_spec, _ in _FORMATTER.parse(cmd):
+        if not name or name in variables:
+            continue
+        numeric = _is_numeric_spec(format_spec or '')
+        spec = specs.get(name)
+        if spec is None:
+            spec = VariableSpec(name, int if numeric else str)
+        elif numeric and spec.type is not int:
+            raise ValueError(
+                f'{feature}.{action} formats {name!r} as a number but api_vars '
+                f'declares it {spec.type.__name__}'
+            )
+        variables[name] = spec
+    return CompiledCommand(
+        feature=feature,
+        action=action,
+        template=cmd + suffix,
+        variables=tuple(variables.values()),
+        response=re.compile(msg) if msg else None,
+    )
+
+
+def compile_protocol(
+    protocol_config: dict[str, Any],
+) -> dict[tuple[str, str], CompiledCommand]:
+    """Compile a protocol definition into a dispatch table.
+
+    Args:
+        protocol_config: Protocol configuration (a PROTOCOL_CONFIG entry).
+
+    Returns:
+        Mapping of (feature, action) to CompiledCommand. api_v2 actions are
+        also registered under their aliases; flat commands are registered as
+        (FLAT_FEATURE, name) with the matching 'responses' regex, if any.
+    """
+    specs = _variable_specs(protocol_config)
+    suffix = (protocol_config.get('command_separator') or '') + (
+        protocol_config.get('command_eol') or ''
+    )
+    table: dict[tuple[str, str], CompiledCommand] = {}
+
+    responses = protocol_config.get('responses') or {}
+    for name, cmd in (protocol_config.get('commands') or {}).items():
+        if isinstance(cmd, str):
+            table[FLAT_FEATURE, name] = _compile(
+                FLAT_FEATURE, name, cmd, responses.get(name), suffix, specs
+            )
+
+    for feature, definition in (protocol_config.get('api_v2') or {}).items():
+        for action, entry in ((definition or {}).get('api') or {}).items():
+            if not isinstance(entry, dict) or 'cmd' not in entry:
+                continue
+            command = _compile(
+                feature, str(action), entry['cmd'], entry.get('msg'), suffix, specs
+            )
+            table[feature, command.action] = command
+            for alias in entry.get('aliases') or ():
+                table[feature, str(alias)] = command
+
+    return table
+
+
+@functools.cache
+def get_dispatch_table(protocol_name: str) -> dict[tuple[str, str], CompiledCommand]:
+    """Return the (cached) compiled dispatch table for a protocol."""
+    return compile_protocol(PROTOCOL_CONFIG.get(protocol_name) or {})
+
+
+def lookup(protocol_name: str, feature: str, action: str) -> CompiledCommand:
+    """Look up a compiled command.
+
+    Raises:
+        ValueError: If the protocol does not define the command.
+    """
+    try:
+        return get_dispatch_table(protocol_name)[feature, action]
+    except KeyError:
+        raise ValueError(
+            f'Protocol {protocol_name} has no command {feature}.{action}'
+        ) from None
@@ -0,0 +1,128 @@
+"""Shared background event loop for synchronous amplifier controllers.
+
+A single daemon thread per process runs an asyncio event loop that owns all
+RS232ControlProtocol instances created through it. Synchronous callers from
+any thread submit coroutines to that loop and block on the result, so they
+get the async engine's pacing and frame assembly without a per-call RLock.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+LOG = logging.getLogger(__name__)
+
+ENGINE_THREAD_NAME = 'pyxantech-engine'
+
+
+class AsyncEngine:
+    """Event loop running in a dedicated daemon thread.
+
+    The loop is started lazily on first use and restarted automatically in a
+    forked child process (threads do not survive fork).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._pid = 0
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Return the engine event loop, starting the thread if needed."""
+        loop = self._loop
+        if loop is not None and self._pid == os.getpid():
+            return loop
+
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                self._start()
+            assert self._loop is not None
+            return self._loop
+
+    @property
+    def running(self) -> bool:
+        """Whether the engine thread is alive in this process."""
+        return (
+            self._thread is not None
+            and self._thread.is_alive()
+            and self._pid == os.getpid()
+        )
+
+    def _start(self) -> None:
+        """Create the event loop and its thread (caller holds the lock)."""
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def _run() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        thread = threading.Thread(target=_run, name=ENGINE_THREAD_NAME, daemon=True)
+        thread.start()
+        ready.wait()
+
+        self._loop = loop
+        self._thread = thread
+        self._pid = os.getpid()
+        LOG.debug('Started async engine thread: thread=%s', thread.name)
+
+    def in_engine_thread(self) -> bool:
+        """Whether the calling thread is the engine thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def run(self, coro: Coroutine[Any, Any, Any], timeout: float | None = None) -> Any:
+        """Run a coroutine on the engine loop and block until it completes.
+
+        Args:
+            coro: Coroutine to execute.
+            timeout: Maximum seconds to wait for the result (None waits forever).
+
+        Returns:
+            Result of the coroutine.
+
+        Raises:
+            RuntimeError: If called from the engine thread (would deadlock).
+        """
+        if self.in_engine_thread():
+            coro.close()
+            raise RuntimeError('AsyncEngine.run() called from the engine thread')
+
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def stop(self) -> None:
+        """Stop the event loop and join the engine thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+
+        if loop is None or thread is None:
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+        LOG.debug('Stopped async engine thread')
+
+
+_ENGINE = AsyncEngine()
+
+
+def get_engine() -> AsyncEngine:
+    """Return the process-wide async engine."""
+    return _ENGINE
@@ -0,0 +1,326 @@
+"""Zone state tracking and change events.
+
+The controllers keep the last known ZoneStatus per zone and emit one
+ZoneChangeEvent per attribute that actually changed, so downstream work scales
+with the rate of change rather than the polling rate.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+from pathlib import Path
+import threading
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .snapshot import DEFAULT_SNAPSHOT_INTERVAL, save_snapshot
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from . import ZoneStatus
+
+LOG = logging.getLogger(__name__)
+
+
+class ZoneChangeEvent(NamedTuple):
+    """A single attribute change for a zone.
+
+    Attributes:
+        zone: Zone number.
+        field: Name of the ZoneStatus attribute that changed.
+        old: Previous value (None when the zone was first seen).
+        new: New value.
+    """
+
+    zone: int
+    field: str
+    old: Any
+    new: Any
+
+
+_UNTRACKED_FIELDS = frozenset({'zone', '_raw'})
+_tracked_fields: tuple[str, ...] = ()
+
+
+def _fields_of(status: ZoneStatus) -> tuple[str, ...]:
+    """Return the tracked ZoneStatus attribute names (computed once)."""
+    global _tracked_fields
+    if not _tracked_fields:
+        _tracked_fields = tuple(
+            f.name
+            for f in dataclasses.fields(status)
+            if f.name not in _UNTRACKED_FIELDS
+        )
+    return _tracked_fields
+
+
+class ZoneStateTracker:
+    """Last known ZoneStatus per zone with change notification.
+
+    Listeners are called synchronously from the thread that updates the state.
+    Queues returned by subscribe() are asyncio queues bound to the loop that
+    created them; events are handed over thread-safely.
+
+    State loaded from a snapshot is provisional and reported as stale until
+    the zone is read from the amp again.
+    """
+
+    def __init__(self) -> None:
+        self._states: dict[int, ZoneStatus] = {}
+        self._updated: dict[int, float] = {}
+        self._stale: set[int] = set()
+        self._snapshot_path: Path | None = None
+        self._snapshot_amp_type = ''
+        self._snapshot_interval = DEFAULT_SNAPSHOT_INTERVAL
+        self._last_save = time.monotonic()
+        self._saving = False
+        self._listeners: list[Callable[[ZoneChangeEvent], None]] = []
+        self._queues: list[
+            tuple[asyncio.Queue[ZoneChangeEvent], asyncio.AbstractEventLoop]
+        ] = []
+        self._lock = threading.Lock()
+
+    def get(self, zone: int) -> ZoneStatus | None:
+        """Return the last known status for a zone."""
+        return self._states.get(zone)
+
+    @property
+    def zones(self) -> dict[int, ZoneStatus]:
+        """Snapshot of the last known status for every zone."""
+        return dict(self._states)
+
+    def is_stale(self, zone: int) -> bool:
+        """Whether a zone's state is provisional (loaded, not yet re-read)."""
+        return zone in self._stale
+
+    @property
+    def stale_zones(self) -> list[int]:
+        """Zones whose state is provisional."""
+        return sorted(self._stale)
+
+    def mark_stale(self, zones: Iterable[int]) -> None:
+        """Mark known zones' state provisional until they are next read."""
+        with self._lock:
+            self._stale.update(zone for zone in zones if zone in self._states)
+
+    def age(self, zone: int) -> float | None:
+        """Seconds since the zone was last read from the amp (None if never)."""
+        updated = self._updated.get(zone)
+        return None if updated is None else time.monotonic() - updated
+
+    def load_provisional(self, statuses: Iterable[ZoneStatus]) -> None:
+        """Seed state from a snapshot without emitting events; marked stale."""
+        with self._lock:
+            for status in statuses:
+                if status.zone not in self._states:
+                    self._states[status.zone] = status
+                    self._stale.add(status.zone)
+
+    def enable_persistence(
+        self,
+        path: str | Path,
+        amp_type: str,
+        interval: float = DEFAULT_SNAPSHOT_INTERVAL,
+    ) -> None:
+        """Periodically save the state table to a snapshot file.
+
+        Args:
+            path: Snapshot file path.
+            amp_type: Amplifier type recorded in the snapshot.
+            interval: Minimum seconds between saves triggered by changes.
+        """
+        self._snapshot_path = Path(path)
+        self._snapshot_amp_type = amp_type
+        self._snapshot_interval = interval
+
+    def save(self) -> None:
+        """Write the current state table to the snapshot file, if enabled."""
+        if self._snapshot_path is None:
+            return
+        self._last_save = time.monotonic()
+        self._write(self._snapshot_path, self._table())
+
+    async def async_save(self) -> None:
+        """Write the snapshot file in the default executor, if enabled."""
+        if self._snapshot_path is None:
+            return
+        self._last_save = time.monotonic()
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._write, self._snapshot_path, self._table()
+        )
+
+    def _table(self) -> dict[int, dict[str, Any]]:
+        return {zone: status.dict for zone, status in self.zones.items()}
+
+    def _write(self, path: Path, zones: dict[int, dict[str, Any]]) -> None:
+        try:
+            save_snapshot(path, self._snapshot_amp_type, zones)
+        except OSError:
+            LOG.warning('Failed saving zone snapshot: path=%s', path)
+
+    def _save_due(self, now: float) -> None:
+        """Save after a change; off the event loop when called from one.
+
+        While a background save is in flight further changes are not queued;
+        the first change after it completes saves again.
+        """
+        assert self._snapshot_path is not None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.save()
+            return
+        if self._saving:
+            return
+        self._saving = True
+        self._last_save = now
+        future = loop.run_in_executor(
+            None, self._write, self._snapshot_path, self._table()
+        )
+        future.add_done_callback(self._save_done)
+
+    def _save_done(self, future: asyncio.Future[None]) -> None:
+        self._saving = False
+
+    def update(self, status: ZoneStatus) -> list[ZoneChangeEvent]:
+        """Store a new status and emit events for changed attributes.
+
+        Args:
+            status: Freshly read zone status.
+
+        Returns:
+            List of change events (empty when nothing changed).
+        """
+        now = time.monotonic()
+        with self._lock:
+            previous = self._states.get(status.zone)
+            self._states[status.zone] = status
+            self._updated[status.zone] = now
+            self._stale.discard(status.zone)
+
+        zone = status.zone
+        if previous is None:
+            events = [
+                ZoneChangeEvent(zone, name, None, getattr(status, name))
+                for name in _fields_of(status)
+            ]
+        else:
+            events = [
+                ZoneChangeEvent(zone, name, old, new)
+                for name in _fields_of(status)
+                if (old := getattr(previous, name)) != (new := getattr(status, name))
+            ]
+
+        self._emit(events, now)
+        return events
+
+    def merge(self, zone: int, values: dict[str, Any]) -> list[ZoneChangeEvent]:
+        """Merge individually read attributes into a zone's last known status.
+
+        The zone's age and staleness are left alone since the rest of the
+        record was not re-read. Zones with no known status are ignored.
+
+        Args:
+            zone: Zone number.
+            values: Freshly read attribute values by ZoneStatus field name.
+
+        Returns:
+            List of change events (empty when nothing changed).
+        """
+        with self._lock:
+            previous = self._states.get(zone)
+            if previous is None:
+                return []
+            self._states[zone] = dataclasses.replace(previous, **values)
+
+        events = [
+            ZoneChangeEvent(zone, name, old, new)
+            for name, new in values.items()
+            if (old := getattr(previous, name)) != new
+        ]
+        self._emit(events, time.monotonic())
+        return events
+
+    def add_listener(
+        self, listener: Callable[[ZoneChangeEvent], None]
+    ) -> Callable[[], None]:
+        """Register a callback for change events.
+
+        Args:
+            listener: Called once per change event.
+
+        Returns:
+            Callable that removes the listener.
+        """
+        self._listeners.append(listener)
+
+        def remove() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return remove
+
+    def subscribe(self, maxsize: int = 0) -> asyncio.Queue[ZoneChangeEvent]:
+        """Return an asyncio queue receiving change events.
+
+        Must be called from a running event loop. Events are dropped (and
+        logged at debug level) when a bounded queue is full.
+
+        Args:
+            maxsize: Maximum queue size (0 for unbounded).
+
+        Returns:
+            Queue of ZoneChangeEvent.
+        """
+        queue: asyncio.Queue[ZoneChangeEvent] = asyncio.Queue(maxsize)
+        self._queues.append((queue, asyncio.get_running_loop()))
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[ZoneChangeEvent]) -> None:
+        """Stop delivering events to a queue returned by subscribe()."""
+        self._queues = [(q, loop) for q, loop in self._queues if q is not queue]
+
+    def _emit(self, events: list[ZoneChangeEvent], now: float) -> None:
+        if not events:
+            return
+        self._publish(events)
+        if (
+            self._snapshot_path is not None
+            and now - self._last_save >= self._snapshot_interval
+        ):
+            self._save_due(now)
+
+    def _publish(self, events: list[ZoneChangeEvent]) -> None:
+        for listener in list(self._listeners):
+            for event in events:
+                try:
+                    listener(event)
+                except Exception:
+                    LOG.exception('Zone change listener failed: listener=%s', listener)
+
+        if not self._queues:
+            return
+
+        try:
+            current_loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+
+        for queue, loop in list(self._queues):
+            if loop is current_loop:
+                _put_all(queue, events)
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(_put_all, queue, events)
+
+
+def _put_all(
+    queue: asyncio.Queue[ZoneChangeEvent], events: list[ZoneChangeEvent]
+) -> None:
+    for event in events:
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            LOG.debug('Zone change queue full, dropping event: event=%s', event)
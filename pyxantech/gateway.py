@@ -0,0 +1,438 @@
+"""HTTP and WebSocket gateway serving cached zone state.
+
+A small stdlib-only asyncio server in front of an async controller. Reads are
+answered from the controller's in-memory zone state and writes are forwarded
+to its command queue, so amp traffic does not grow with the number of
+dashboards connected:
+
+    GET  /zones             all cached zone statuses
+    GET  /zones/<zone>      one cached zone status
+    POST /zones/<zone>      JSON body of attributes to set, e.g. {"volume": 20}
+    POST /all_off           turn off every zone
+    GET  /events            WebSocket pushing {"zone", "field", "old", "new"}
+
+The gateway can also keep the cache fresh itself by polling its zones at a
+fixed interval as background requests (see AmpControlAsync.zone_statuses).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import contextlib
+import hashlib
+import json
+import logging
+import struct
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .events import ZoneChangeEvent
+
+LOG = logging.getLogger(__name__)
+
+MAX_HEADER_SIZE = 16384
+MAX_BODY_SIZE = 65536
+DEFAULT_EVENT_QUEUE_SIZE = 256
+
+WEBSOCKET_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+WS_OP_TEXT = 0x1
+WS_OP_CLOSE = 0x8
+WS_OP_PING = 0x9
+WS_OP_PONG = 0xA
+
+_TRUE_STRINGS = frozenset({'1', 'true', 'on', 'yes'})
+_FALSE_STRINGS = frozenset({'0', 'false', 'off', 'no'})
+
+
+def _parse_bool(value: Any) -> bool:
+    """Parse a JSON boolean, 0/1 or a true/false, on/off, yes/no string."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in _TRUE_STRINGS:
+            return True
+        if text in _FALSE_STRINGS:
+            return False
+    raise ValueError(f'Not a boolean: {value!r}')
+
+
+def _parse_int(value: Any) -> int:
+    """Parse a JSON integer or a string of digits (booleans are rejected)."""
+    if isinstance(value, bool) or not isinstance(value, int | str):
+        raise ValueError(f'Not an integer: {value!r}')
+    return int(value)
+
+
+# attributes accepted by POST /zones/<zone>, mapped to their parsers
+SETTABLE_ATTRIBUTES = {
+    'power': _parse_bool,
+    'mute': _parse_bool,
+    'volume': _parse_int,
+    'treble': _parse_int,
+    'bass': _parse_int,
+    'balance': _parse_int,
+    'source': _parse_int,
+}
+
+_REASONS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    502: 'Bad Gateway',
+    504: 'Gateway Timeout',
+}
+
+
+class _HttpError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _ws_frame(opcode: int, payload: bytes) -> bytes:
+    """Encode a single unmasked server-to-client WebSocket frame."""
+    length = len(payload)
+    if length < 126:
+        header = struct.pack('!BB', 0x80 | opcode, length)
+    elif length < 65536:
+        header = struct.pack('!BBH', 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack('!BBQ', 0x80 | opcode, 127, length)
+    return header + payload
+
+
+async def _read_ws_frame(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    """Read one client-to-server WebSocket frame (fragments not supported)."""
+    first, second = await reader.readexactly(2)
+    opcode = first & 0x0F
+    length = second & 0x7F
+    if length == 126:
+        (length,) = struct.unpack('!H', await reader.readexactly(2))
+    elif length == 127:
+        (length,) = struct.unpack('!Q', await reader.readexactly(8))
+    if length > MAX_BODY_SIZE:
+        raise ConnectionError('WebSocket frame too large')
+    mask = await reader.readexactly(4) if second & 0x80 else b''
+    payload = await reader.readexactly(length)
+    if mask:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    return opcode, payload
+
+
+def _event_json(event: ZoneChangeEvent) -> bytes:
+    return json.dumps(event._asdict(), separators=(',', ':')).encode('utf-8')
+
+
+class AmpGateway:
+    """HTTP/WebSocket server exposing one async controller.
+
+    Args:
+        amp: Async amplifier controller.
+        zones: Zones to poll (and to accept commands for).
+        host: Interface to listen on.
+        port: TCP port (0 picks a free port).
+        poll_interval: Seconds between background polls of every zone; None
+            relies on other callers keeping the controller's state fresh.
+    """
+
+    def __init__(
+        self,
+        amp: Any,
+        zones: Iterable[int],
+        host: str = '127.0.0.1',
+        port: int = 8080,
+        poll_interval: float | None = None,
+    ) -> None:
+        self._amp = amp
+        self._zones = list(zones)
+        self._host = host
+        self._port = port
+        self._poll_interval = poll_interval
+        self._server: asyncio.Server | None = None
+        self._poller: asyncio.Task[None] | None = None
+        self._connections: set[asyncio.StreamWriter] = set()
+
+    @property
+    def port(self) -> int:
+        """TCP port the gateway is listening on."""
+        if self._server is not None and self._server.sockets:
+            return int(self._server.sockets[0].getsockname()[1])
+        return self._port
+
+    async def start(self) -> None:
+        """Start listening and, if configured, polling."""
+        self._server = await asyncio.start_server(
+            self._handle_connection, self._host, self._port, limit=MAX_HEADER_SIZE
+        )
+        if self._poll_interval:
+            self._poller = asyncio.create_task(self._poll())
+        LOG.info('Gateway listening: host=%s, port=%s', self._host, self.port)
+
+    async def close(self) -> None:
+        """Stop polling, close client connections and stop listening."""
+        if self._poller is not None:
+            self._poller.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._poller
+            self._poller = None
+        if self._server is not None:
+            self._server.close()
+        for writer in list(self._connections):
+            writer.close()
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _poll(self) -> None:
+        assert self._poll_interval is not None
+        while True:
+            try:
+                # grouped per chassis; absent chassis are skipped once probed
+                await self._amp.zone_statuses(self._zones, background=True)
+            except Exception as exc:
+                LOG.debug('Gateway poll failed: error=%s', exc)
+            await asyncio.sleep(self._poll_interval)
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._connections.add(writer)
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except asyncio.IncompleteReadError:
+                    return
+                except asyncio.LimitOverrunError:
+                    await self._respond(
+                        writer, 413, {'error': 'Headers too large'}, close=True
+                    )
+                    return
+
+                method, path, headers = self._parse_head(head)
+                if headers.get('upgrade', '').lower() == 'websocket':
+                    await self._serve_websocket(reader, writer, path, headers)
+                    return
+
+                length = self._parse_content_length(headers)
+                if length is None:
+                    await self._respond(
+                        writer, 400, {'error': 'Invalid Content-Length'}, close=True
+                    )
+                    return
+                if length > MAX_BODY_SIZE:
+                    await self._respond(
+                        writer, 413, {'error': 'Body too large'}, close=True
+                    )
+                    return
+                body = await reader.readexactly(length) if length else b''
+
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                try:
+                    status, payload = await self._route(method, path, body)
+                except _HttpError as exc:
+                    status, payload = exc.status, {'error': str(exc)}
+                await self._respond(writer, status, payload, close=not keep_alive)
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    @staticmethod
+    def _parse_content_length(headers: dict[str, str]) -> int | None:
+        """Return the body length, or None if the header is not a valid length."""
+        text = headers.get('content-length', '').strip()
+        if not text:
+            return 0
+        if not text.isdigit():
+            return None
+        return int(text)
+
+    @staticmethod
+    def _parse_head(head: bytes) -> tuple[str, str, dict[str, str]]:
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, path, _ = lines[0].split(' ', 2)
+        except ValueError:
+            raise ConnectionError(f'Malformed request line: {lines[0]!r}') from None
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+        return method.upper(), path.split('?', 1)[0], headers
+
+    async def _respond(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        payload: Any,
+        *,
+        close: bool = False,
+    ) -> None:
+        body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        head = (
+            f'HTTP/1.1 {status} {_REASONS.get(status, "")}\r\n'
+            'Content-Type: application/json\r\n'
+            f'Content-Length: {len(body)}\r\n'
+            f'Connection: {"close" if close else "keep-alive"}\r\n\r\n'
+        )
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+    async def _route(self, method: str, path: str, body: bytes) -> tuple[int, Any]:
+        parts = [part for part in path.split('/') if part]
+
+        if parts == ['zones']:
+            if method != 'GET':
+                raise _HttpError(405, f'{method} not allowed')
+            return 200, {
+                str(zone): status.dict
+                for zone, status in self._amp.tracker.zones.items()
+            }
+
+        if len(parts) == 2 and parts[0] == 'zones':
+            zone = self._parse_zone(parts[1])
+            if method == 'GET':
+                status = self._amp.cached_status(zone)
+                if status is None:
+                    raise _HttpError(404, f'No state for zone {zone}')
+                return 200, status
+            if method == 'POST':
+                await self._set_attributes(zone, self._parse_json(body))
+                return 200, {'ok': True}
+            raise _HttpError(405, f'{method} not allowed')
+
+        if parts == ['all_off']:
+            if method != 'POST':
+                raise _HttpError(405, f'{method} not allowed')
+            await self._forward(self._amp.all_off())
+            return 200, {'ok': True}
+
+        raise _HttpError(404, f'Unknown path {path}')
+
+    def _parse_zone(self, text: str) -> int:
+        try:
+            zone = int(text)
+        except ValueError:
+            raise _HttpError(400, f'Invalid zone {text!r}') from None
+        if self._zones and zone not in self._zones:
+            raise _HttpError(404, f'Unknown zone {zone}')
+        return zone
+
+    @staticmethod
+    def _parse_json(body: bytes) -> dict[str, Any]:
+        try:
+            data = json.loads(body or b'{}')
+        except ValueError:
+            raise _HttpError(400, 'Body is not valid JSON') from None
+        if not isinstance(data, dict):
+            raise _HttpError(400, 'Body must be a JSON object')
+        return data
+
+    async def _set_attributes(self, zone: int, attributes: dict[str, Any]) -> None:
+        """Apply the attributes as one group (see AmpControlAsync.update_zone)."""
+        unknown = set(attributes) - set(SETTABLE_ATTRIBUTES)
+        if unknown:
+            raise _HttpError(400, f'Unknown attributes: {", ".join(sorted(unknown))}')
+        values = {}
+        for name, value in attributes.items():
+            try:
+                values[name] = SETTABLE_ATTRIBUTES[name](value)
+            except (TypeError, ValueError):
+                raise _HttpError(400, f'Invalid {name} value {value!r}') from None
+        if values:
+            await self._forward(self._amp.update_zone(zone, **values))
+
+    @staticmethod
+    async def _forward(coro: Any) -> Any:
+        try:
+            return await coro
+        except TimeoutError as exc:
+            raise _HttpError(504, f'Amp did not respond: {exc}') from exc
+        except Exception as exc:
+            raise _HttpError(502, f'{type(exc).__name__}: {exc}') from exc
+
+    async def _serve_websocket(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        path: str,
+        headers: dict[str, str],
+    ) -> None:
+        key = headers.get('sec-websocket-key')
+        if path.rstrip('/') != '/events' or not key:
+            await self._respond(
+                writer, 404, {'error': 'Unknown WebSocket path'}, close=True
+            )
+            return
+
+        accept = base64.b64encode(
+            hashlib.sha1((key + WEBSOCKET_GUID).encode('ascii')).digest()
+        ).decode('ascii')
+        writer.write(
+            (
+                'HTTP/1.1 101 Switching Protocols\r\n'
+                'Upgrade: websocket\r\n'
+                'Connection: Upgrade\r\n'
+                f'Sec-WebSocket-Accept: {accept}\r\n\r\n'
+            ).encode('latin-1')
+        )
+
+        queue = self._amp.subscribe_changes(DEFAULT_EVENT_QUEUE_SIZE)
+        pump = asyncio.create_task(self._pump_events(queue, writer))
+        try:
+            while True:
+                opcode, payload = await _read_ws_frame(reader)
+                if opcode == WS_OP_CLOSE:
+                    writer.write(_ws_frame(WS_OP_CLOSE, payload[:2]))
+                    return
+                if opcode == WS_OP_PING:
+                    writer.write(_ws_frame(WS_OP_PONG, payload))
+        finally:
+            pump.cancel()
+            self._amp.unsubscribe_changes(queue)
+
+    async def _pump_events(
+        self, queue: asyncio.Queue[ZoneChangeEvent], writer: asyncio.StreamWriter
+    ) -> None:
+        # current state first, so a dashboard needs no separate GET
+        for zone, status in self._amp.tracker.zones.items():
+            for name, value in status.dict.items():
+                if name != 'zone':
+                    payload = {'zone': zone, 'field': name, 'old': None, 'new': value}
+                    writer.write(
+                        _ws_frame(WS_OP_TEXT, json.dumps(payload).encode('utf-8'))
+                    )
+        while True:
+            event = await queue.get()
+            writer.write(_ws_frame(WS_OP_TEXT, _event_json(event)))
+            await writer.drain()
+
+
+async def serve_gateway(
+    amp: Any,
+    zones: Iterable[int],
+    host: str = '127.0.0.1',
+    port: int = 8080,
+    poll_interval: float | None = None,
+) -> AmpGateway:
+    """Start an AmpGateway for an async controller (see AmpGateway).
+
+    Returns:
+        Started gateway.
+    """
+    gateway = AmpGateway(amp, zones, host, port, poll_interval)
+    await gateway.start()
+    return gateway
@@ -0,0 +1,152 @@
+"""Link health tracking with a circuit breaker.
+
+When an amp is powered down or unplugged every request would otherwise wait
+the full serial timeout. The breaker counts consecutive reply timeouts and,
+past a threshold, opens: requests then fail at once with AmpUnavailableError.
+After reset_timeout seconds it turns half-open and lets a single trial
+request through; a reply closes it again, another timeout re-opens it.
+
+    closed --(failure_threshold timeouts)--> open --(reset_timeout)--> half_open
+    half_open --(reply)--> closed            half_open --(timeout)--> open
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+LOG = logging.getLogger(__name__)
+
+BREAKER_CLOSED = 'closed'
+BREAKER_OPEN = 'open'
+BREAKER_HALF_OPEN = 'half_open'
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_RESET_TIMEOUT = 30.0
+DEFAULT_HEALTH_INTERVAL = 60.0
+
+
+class AmpUnavailableError(ConnectionError):
+    """Raised without touching the port while the circuit breaker is open."""
+
+
+class LinkStateEvent(NamedTuple):
+    """A circuit breaker state transition.
+
+    Attributes:
+        old: Previous state.
+        new: New state (BREAKER_CLOSED, BREAKER_OPEN or BREAKER_HALF_OPEN).
+        failures: Consecutive failures at the time of the transition.
+    """
+
+    old: str
+    new: str
+    failures: int
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one serial link.
+
+    Args:
+        failure_threshold: Consecutive timeouts that open the breaker.
+        reset_timeout: Seconds the breaker stays open before a trial request.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+    ) -> None:
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_timeout = reset_timeout
+        self._state = BREAKER_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_at: float | None = None
+        self._listeners: list[Callable[[LinkStateEvent], None]] = []
+
+    @property
+    def state(self) -> str:
+        """Current state (a half-open transition is reported once due)."""
+        if self._state == BREAKER_OPEN and self._reset_due():
+            return BREAKER_HALF_OPEN
+        return self._state
+
+    @property
+    def failures(self) -> int:
+        """Consecutive failures since the last successful reply."""
+        return self._failures
+
+    def _reset_due(self) -> bool:
+        return time.monotonic() - self._opened_at >= self._reset_timeout
+
+    def before_request(self) -> None:
+        """Admit a request or fail it immediately.
+
+        Raises:
+            AmpUnavailableError: If the breaker is open, or half-open with the
+                trial request still outstanding.
+        """
+        if self._state == BREAKER_CLOSED:
+            return
+        now = time.monotonic()
+        if self._state == BREAKER_OPEN:
+            if not self._reset_due():
+                raise AmpUnavailableError(
+                    f'Amp unreachable after {self._failures} consecutive timeouts'
+                )
+            self._transition(BREAKER_HALF_OPEN)
+        # half-open: one trial at a time (a lost trial is replaced after a while)
+        if self._trial_at is not None and now - self._trial_at < self._reset_timeout:
+            raise AmpUnavailableError('Amp unreachable, recovery probe in progress')
+        self._trial_at = now
+
+    def record_success(self) -> None:
+        """Record a reply from the amp."""
+        self._failures = 0
+        self._trial_at = None
+        if self._state != BREAKER_CLOSED:
+            self._transition(BREAKER_CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a reply timeout."""
+        self._failures += 1
+        self._trial_at = None
+        if self._state == BREAKER_HALF_OPEN or (
+            self._state == BREAKER_CLOSED and self._failures >= self._failure_threshold
+        ):
+            self._opened_at = time.monotonic()
+            self._transition(BREAKER_OPEN)
+
+    def add_listener(
+        self, listener: Callable[[LinkStateEvent], None]
+    ) -> Callable[[], None]:
+        """Register a callback for state transitions.
+
+        Args:
+            listener: Called with a LinkStateEvent on every transition.
+
+        Returns:
+            Callable that removes the listener.
+        """
+        self._listeners.append(listener)
+
+        def remove() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return remove
+
+    def _transition(self, state: str) -> None:
+        event = LinkStateEvent(self._state, state, self._failures)
+        self._state = state
+        LOG.info('Link state changed: old=%s, new=%s, failures=%d', *event)
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception:
+                LOG.exception('Link state listener failed: listener=%s', listener)
@@ -0,0 +1,277 @@
+"""Compact in-memory history of zone attribute changes.
+
+A ZoneHistory listens to a controller's change events and stores them per
+zone in fixed-size ring buffers of flat arrays (timestamp, field index,
+value) rather than dicts, so memory per zone is bounded and small (11 bytes
+per change). Changes that fall off a full buffer are folded into a per-zone
+baseline, so the state at any time since recording started stays exact for
+every attribute that has not changed since:
+
+    history = amp.record_history()
+    history.state_at(12, time.time() - 3600)     # zone 12 an hour ago
+    history.changes(since=time.time() - 3600)    # everything in the last hour
+    columns = history.export(12)                 # np.frombuffer(columns['value'], ...)
+
+Timestamps are time.time() seconds when the change was observed.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+import threading
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .events import ZoneChangeEvent
+
+DEFAULT_HISTORY_SIZE = 1024  # changes kept per zone
+
+# attributes recorded, in field index order (all small ints or bools)
+HISTORY_FIELDS = (
+    'power',
+    'mute',
+    'volume',
+    'treble',
+    'bass',
+    'balance',
+    'source',
+    'paged',
+    'linked',
+    'pa',
+    'do_not_disturb',
+    'keypad',
+)
+_FIELD_INDEX = {name: index for index, name in enumerate(HISTORY_FIELDS)}
+_BOOL_FIELDS = frozenset(
+    {'power', 'mute', 'paged', 'linked', 'pa', 'do_not_disturb', 'keypad'}
+)
+
+UNKNOWN = -32768  # baseline marker for an attribute never seen
+
+
+class HistoryEvent(NamedTuple):
+    """A recorded attribute change.
+
+    Attributes:
+        time: time.time() when the change was observed.
+        zone: Zone number.
+        field: ZoneStatus attribute name.
+        value: New value.
+    """
+
+    time: float
+    zone: int
+    field: str
+    value: Any
+
+
+def _decode(index: int, value: int) -> Any:
+    name = HISTORY_FIELDS[index]
+    return bool(value) if name in _BOOL_FIELDS else value
+
+
+class _ZoneBuffer:
+    """Ring buffer of one zone's changes plus the baseline before them."""
+
+    __slots__ = ('times', 'fields', 'values', 'baseline', 'start', 'count')
+
+    def __init__(self, size: int) -> None:
+        self.times = array('d', bytes(8 * size))
+        self.fields = array('B', bytes(size))
+        self.values = array('h', bytes(2 * size))
+        self.baseline = array('h', [UNKNOWN] * len(HISTORY_FIELDS))
+        self.start = 0
+        self.count = 0
+
+    def append(self, timestamp: float, field: int, value: int) -> None:
+        size = len(self.times)
+        if self.count < size:
+            slot = (self.start + self.count) % size
+            self.count += 1
+        else:
+            # fold the oldest change into the baseline before overwriting it
+            slot = self.start
+            self.baseline[self.fields[slot]] = self.values[slot]
+            self.start = (self.start + 1) % size
+        self.times[slot] = timestamp
+        self.fields[slot] = field
+        self.values[slot] = value
+
+    def slot(self, position: int) -> int:
+        return (self.start + position) % len(self.times)
+
+    def position_after(self, timestamp: float) -> int:
+        """Number of retained changes at or before timestamp."""
+        return bisect_right(
+            range(self.count),
+            timestamp,
+            key=lambda position: self.times[self.slot(position)],
+        )
+
+
+class ZoneHistory:
+    """Per-zone ring buffers of zone attribute changes.
+
+    Args:
+        size: Changes kept per zone; older changes fold into a baseline.
+    """
+
+    def __init__(self, size: int = DEFAULT_HISTORY_SIZE) -> None:
+        self._size = max(1, size)
+        self._zones: dict[int, _ZoneBuffer] = {}
+        self._lock = threading.Lock()
+        self._clock = time.time
+
+    @property
+    def zones(self) -> list[int]:
+        """Zones with recorded history."""
+        return sorted(self._zones)
+
+    def record(self, event: ZoneChangeEvent, timestamp: float | None = None) -> None:
+        """Record a change event (usable directly as a change listener).
+
+        Attributes that are not small ints or bools are ignored.
+
+        Args:
+            event: Change event.
+            timestamp: time.time() of the change (defaults to now).
+        """
+        index = _FIELD_INDEX.get(event.field)
+        value = event.new
+        if index is None or not isinstance(value, int) or not -32767 <= value <= 32767:
+            return
+        with self._lock:
+            buffer = self._zones.get(event.zone)
+            if buffer is None:
+                buffer = self._zones[event.zone] = _ZoneBuffer(self._size)
+            buffer.append(
+                self._clock() if timestamp is None else timestamp, index, int(value)
+            )
+
+    def state_at(self, zone: int, timestamp: float) -> dict[str, Any] | None:
+        """Return a zone's attributes as of a point in time.
+
+        Args:
+            zone: Zone number.
+            timestamp: time.time() value.
+
+        Returns:
+            Known attribute values by name, or None if none were known yet.
+        """
+        with self._lock:
+            buffer = self._zones.get(zone)
+            if buffer is None:
+                return None
+            state = array('h', buffer.baseline)
+            for position in range(buffer.position_after(timestamp)):
+                slot = buffer.slot(position)
+                state[buffer.fields[slot]] = buffer.values[slot]
+        result = {
+            name: _decode(index, value)
+            for index, (name, value) in enumerate(
+                zip(HISTORY_FIELDS, state, strict=True)
+            )
+            if value != UNKNOWN
+        }
+        return result or None
+
+    def changes(
+        self,
+        zone: int | None = None,
+        *,
+        since: float | None = None,
+        until: float | None = None,
+    ) -> list[HistoryEvent]:
+        """Return recorded changes in a time range, oldest first.
+
+        Args:
+            zone: Only this zone (default every zone).
+            since: Only changes after this time.time() value.
+            until: Only changes at or before this time.time() value.
+
+        Returns:
+            Recorded changes ordered by time.
+        """
+        events: list[HistoryEvent] = []
+        with self._lock:
+            zones = [zone] if zone is not None else list(self._zones)
+            for number in zones:
+                buffer = self._zones.get(number)
+                if buffer is None:
+                    continue
+                first = 0 if since is None else buffer.position_after(since)
+                last = buffer.count if until is None else buffer.position_after(until)
+                for position in range(first, last):
+                    slot = buffer.slot(position)
+                    index = buffer.fields[slot]
+                    events.append(
+                        HistoryEvent(
+                            buffer.times[slot],
+                            number,
+                            HISTORY_FIELDS[index],
+                            _decode(index, buffer.values[slot]),
+                        )
+                    )
+        if zone is None:
+            events.sort(key=lambda event: event.time)
+        return events
+
+    def export(self, zone: int) -> dict[str, array[Any]]:
+        """Return a zone's retained changes as flat, oldest-first arrays.
+
+        The arrays expose the buffer protocol, e.g. for numpy.frombuffer():
+        'time' is float64, 'field' uint8 (an index into HISTORY_FIELDS) and
+        'value' int16.
+
+        Args:
+            zone: Zone number.
+
+        Returns:
+            Dictionary of 'time', 'field' and 'value' arrays (empty when the
+            zone has no history).
+        """
+        columns: dict[str, array[Any]] = {
+            'time': array('d'),
+            'field': array('B'),
+            'value': array('h'),
+        }
+        with self._lock:
+            buffer = self._zones.get(zone)
+            if buffer is None:
+                return columns
+            end = buffer.start + buffer.count
+            size = len(buffer.times)
+            sources: tuple[tuple[str, array[Any]], ...] = (
+                ('time', buffer.times),
+                ('field', buffer.fields),
+                ('value', buffer.values),
+            )
+            for name, source in sources:
+                columns[name] = (
+                    source[buffer.start : min(end, size)] + source[: max(0, end - size)]
+                )
+        return columns
+
+    def clear(self) -> None:
+        """Discard all recorded history."""
+        with self._lock:
+            self._zones.clear()
+
+    def attach(
+        self,
+        add_listener: Callable[[Callable[[ZoneChangeEvent], None]], Callable[[], None]],
+    ) -> Callable[[], None]:
+        """Start recording from a change event source.
+
+        Args:
+            add_listener: Registration function such as a controller's
+                add_change_listener.
+
+        Returns:
+            Callable that stops recording.
+        """
+        return add_listener(self.record)
@@ -0,0 +1,219 @@
+"""Step-to-decibel lookup tables.
+
+Amps take volume and tone as raw steps (e.g. volume 0-38). A series config may
+describe the dB value of each step with a '<field>_level' table (bass_level,
+treble_level, volume_level) and a balance_attenuation table, and a protocol
+with a 'ranges' table; elided steps ('#...') are linearly interpolated. Each
+table is expanded once at config load into two flat arrays, so converting in
+either direction is a single index:
+
+    table = LEVEL_TABLES['xantech8']['volume']
+    table.to_db(37)        # -1.25
+    table.to_step(-20.0)   # 28
+
+Balance is expressed as one signed value: the attenuation of the left channel
+minus that of the right, so positive values shift the image to the right and
++/-inf means one side is muted.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+import math
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+LEVEL_FIELDS = ('volume', 'bass', 'treble', 'balance')
+
+# series config keys holding each field's table
+SERIES_LEVEL_KEYS = {
+    'volume': 'volume_level',
+    'bass': 'bass_level',
+    'treble': 'treble_level',
+    'balance': 'balance_attenuation',
+}
+
+# reverse lookup grid spacing; finer than any step size in the configs
+DB_RESOLUTION = 0.05
+
+
+def parse_db(value: Any) -> float:
+    """Parse a table value ('+14', '-2 dB', -1.25, None for mute) to dB."""
+    if value is None or value == 'None':
+        return -math.inf
+    if isinstance(value, str):
+        value = value.lower().removesuffix('db').strip()
+    return float(value)
+
+
+def _balance_db(value: Any) -> float:
+    """Fold a {'left': dB, 'right': dB} attenuation into one signed value."""
+    if not isinstance(value, dict):
+        return parse_db(value)
+    return parse_db(value.get('right', 0)) - parse_db(value.get('left', 0))
+
+
+def expand_steps(steps: Mapping[int, float]) -> list[float]:
+    """Expand a sparse step table to every step from 0 to the highest one.
+
+    Steps between two known steps are linearly interpolated; steps outside
+    the known range take the nearest known value.
+
+    Args:
+        steps: dB value by step number.
+
+    Returns:
+        dB value per step, indexed by step.
+    """
+    known = sorted(steps.items())
+    keys = [step for step, _ in known]
+    values: list[float] = []
+    for step in range(keys[-1] + 1):
+        index = bisect_left(keys, step)
+        if index < len(keys) and keys[index] == step:
+            values.append(known[index][1])
+        elif index == 0:
+            values.append(known[0][1])
+        else:
+            (low, low_db), (high, high_db) = known[index - 1], known[index]
+            if math.isinf(low_db) or math.isinf(high_db):
+                values.append(low_db if math.isinf(high_db) else high_db)
+            else:
+                values.append(low_db + (high_db - low_db) * (step - low) / (high - low))
+    return values
+
+
+class LevelTable:
+    """Precomputed conversion between raw steps and dB for one field.
+
+    Args:
+        values: dB value per step, indexed by step (-inf/+inf for mute).
+    """
+
+    def __init__(self, values: Iterable[float]) -> None:
+        self._to_db = array('d', values)
+        finite = sorted(
+            (db, step) for step, db in enumerate(self._to_db) if math.isfinite(db)
+        )
+        self._min_db = finite[0][0]
+        self._max_db = finite[-1][0]
+
+        # nearest step for every grid point between the extremes; among steps
+        # with equal dB the highest wins
+        size = round((self._max_db - self._min_db) / DB_RESOLUTION) + 1
+        self._from_db = array('H', bytes(2 * size))
+        index = 0
+        for point in range(size):
+            db = self._min_db + point * DB_RESOLUTION
+            while index + 1 < len(finite) and abs(finite[index + 1][0] - db) <= abs(
+                finite[index][0] - db
+            ):
+                index += 1
+            self._from_db[point] = finite[index][1]
+
+        self._lowest = self._from_db[0]
+        self._highest = self._from_db[-1]
+        self._muted_low = next(
+            (s for s, db in enumerate(self._to_db) if db == -math.inf), None
+        )
+        self._muted_high = next(
+            (s for s, db in enumerate(self._to_db) if db == math.inf), None
+        )
+
+    @property
+    def steps(self) -> int:
+        """Number of steps (the highest step is steps - 1)."""
+        return len(self._to_db)
+
+    @property
+    def db_range(self) -> tuple[float, float]:
+        """Lowest and highest finite dB values."""
+        return self._min_db, self._max_db
+
+    def to_db(self, step: int) -> float:
+        """Return the dB value of a step.
+
+        Raises:
+            ValueError: If the step is outside the table.
+        """
+        if not 0 <= step < len(self._to_db):
+            raise ValueError(f'Step {step} outside 0-{len(self._to_db) - 1}')
+        return self._to_db[step]
+
+    def to_db_many(self, steps: Iterable[int]) -> list[float]:
+        """Return the dB value of each step (unchecked, for bulk conversion)."""
+        return list(map(self._to_db.__getitem__, steps))
+
+    def to_step(self, db: float) -> int:
+        """Return the step nearest a dB value, clamped to the table range."""
+        if db <= self._min_db:
+            if db == -math.inf and self._muted_low is not None:
+                return self._muted_low
+            return self._lowest
+        if db >= self._max_db:
+            if db == math.inf and self._muted_high is not None:
+                return self._muted_high
+            return self._highest
+        return self._from_db[round((db - self._min_db) / DB_RESOLUTION)]
+
+
+def build_level_tables(
+    device_config: Mapping[str, Any], protocol_config: Mapping[str, Any] | None
+) -> dict[str, LevelTable]:
+    """Build the lookup tables a series declares.
+
+    Series tables take priority over the protocol's 'ranges'.
+
+    Args:
+        device_config: Series configuration.
+        protocol_config: Configuration of the series' protocol.
+
+    Returns:
+        LevelTable by field name, for the fields with a table.
+    """
+    ranges = (protocol_config or {}).get('ranges') or {}
+    tables = {}
+    for name in LEVEL_FIELDS:
+        series_table = device_config.get(SERIES_LEVEL_KEYS[name])
+        if series_table:
+            steps = series_table.get('steps') or {}
+        else:
+            steps = ranges.get(name) or {}
+        if not steps:
+            continue
+        parse = _balance_db if name == 'balance' else parse_db
+        tables[name] = LevelTable(
+            expand_steps({int(k): parse(v) for k, v in steps.items()})
+        )
+    return tables
+
+
+def statuses_to_db(
+    tables: Mapping[str, LevelTable], statuses: Mapping[int, Mapping[str, Any]]
+) -> dict[int, dict[str, float]]:
+    """Convert the levels of many zones to dB at once (e.g. a whole house).
+
+    Each field is converted as one column across all zones.
+
+    Args:
+        tables: LevelTable by field name (e.g. LEVEL_TABLES[amp_type]).
+        statuses: Zone status (with raw steps) by zone number.
+
+    Returns:
+        dB value by field name, by zone; fields without a table or value are
+        omitted.
+    """
+    result: dict[int, dict[str, float]] = {zone: {} for zone in statuses}
+    for name, table in tables.items():
+        zones = [
+            zone
+            for zone, status in statuses.items()
+            if isinstance(status.get(name), int) and 0 <= status[name] < table.steps
+        ]
+        values = table.to_db_many(statuses[zone][name] for zone in zones)
+        for zone, db in zip(zones, values, strict=True):
+            result[zone][name] = db
+    return result
@@ -0,0 +1,390 @@
+"""Single-thread poller for many serial ports.
+
+AmpControlSync blocks in read() for every reply, so polling several amps
+synchronously needs one thread per port. MultiPortPoller instead registers
+every port's file descriptor with a selectors selector and interleaves the
+writes and reads of all ports in the calling thread. Each port keeps its
+own pacing (min_time_between_commands) and reply timeout, and results are
+yielded as each request completes:
+
+    with MultiPortPoller() as poller:
+        poller.add_port('monoprice6', '/dev/ttyUSB0')
+        poller.add_port('xantech8', '/dev/ttyUSB1')
+        for port_url, zone, status in poller.zone_statuses():
+            ...
+
+Lower level, submit() queues raw command batches and run() executes them.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+import logging
+import os
+import selectors
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import serial
+
+from . import (
+    get_device_config,
+    get_protocol_config,
+    parse_zone_status,
+    zone_status_queries,
+)
+from .protocol import (
+    CONF_RESPONSE_EOL,
+    CONF_THROTTLE_RATE,
+    DEFAULT_TIMEOUT,
+    log_timeout,
+)
+from .trace import TRACE_RECEIVE, TRACE_SEND, TRACE_TIMEOUT, CommandTrace
+from .transport import MAX_READ_SIZE, _native_fileno
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
+
+LOG = logging.getLogger(__name__)
+
+
+class PollResult(NamedTuple):
+    """Outcome of one submitted batch.
+
+    Attributes:
+        port_url: Port the batch was sent to.
+        tag: Tag passed to submit().
+        replies: One reply per command, up to the first that timed out.
+        error: SerialTimeoutException if a reply timed out, SerialException
+            if the port hung up, else None.
+    """
+
+    port_url: str
+    tag: Any
+    replies: list[str]
+    error: Exception | None = None
+
+
+@dataclass(slots=True)
+class _Batch:
+    commands: Sequence[bytes]
+    skip: int
+    tag: Any
+    replies: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _Port:
+    amp_type: str
+    port_url: str
+    serial: Any
+    fd: int
+    response_eol: bytes
+    min_interval: float
+    timeout: float
+    trace: CommandTrace
+    pending: deque[_Batch] = field(default_factory=deque)
+    batch: _Batch | None = None
+    awaiting_reply: bool = False
+    received: bytearray = field(default_factory=bytearray)
+    output: bytearray = field(default_factory=bytearray)
+    reply_deadline: float = 0.0
+    last_send: float = 0.0
+
+    @property
+    def busy(self) -> bool:
+        return self.batch is not None or bool(self.pending)
+
+
+class MultiPortPoller:
+    """Multiplex requests to many serial ports in one thread."""
+
+    def __init__(self) -> None:
+        self._selector = selectors.DefaultSelector()
+        self._ports: dict[str, _Port] = {}
+
+    def add_port(
+        self,
+        amp_type: str,
+        port_url: str,
+        serial_config_overrides: dict[str, Any] | None = None,
+    ) -> None:
+        """Open a port and add it to the poller.
+
+        Args:
+            amp_type: Amplifier type on the port (e.g., 'xantech8').
+            port_url: Serial port path or URL.
+            serial_config_overrides: Optional serial port configuration overrides.
+
+        Raises:
+            ValueError: If the port is already added or has no pollable file
+                descriptor.
+            serial.SerialException: If the port cannot be opened.
+        """
+        if port_url in self._ports:
+            raise ValueError(f'Port {port_url} already added')
+
+        serial_config = dict(get_device_config(amp_type, 'rs232'))
+        serial_config.update(serial_config_overrides or {})
+        timeout = serial_config.get('timeout') or DEFAULT_TIMEOUT
+        # replies are read through the selector, never by blocking in pyserial
+        serial_config['timeout'] = 0
+        serial_instance = serial.serial_for_url(port_url, **serial_config)
+
+        fd = _native_fileno(serial_instance)
+        if fd is None:
+            serial_instance.close()
+            raise ValueError(f'Port {port_url} has no file descriptor to poll')
+        os.set_blocking(fd, False)
+
+        throttle = get_device_config(amp_type, CONF_THROTTLE_RATE, log_missing=False)
+        port = _Port(
+            amp_type=amp_type,
+            port_url=port_url,
+            serial=serial_instance,
+            fd=fd,
+            response_eol=(
+                get_protocol_config(amp_type, CONF_RESPONSE_EOL) or '\r'
+            ).encode('ascii'),
+            min_interval=0.05 if throttle is None else throttle,
+            timeout=timeout,
+            trace=CommandTrace(),
+        )
+        self._selector.register(fd, selectors.EVENT_READ, port)
+        self._ports[port_url] = port
+
+    def remove_port(self, port_url: str) -> None:
+        """Close a port and drop its queued requests."""
+        port = self._ports.pop(port_url)
+        self._selector.unregister(port.fd)
+        port.serial.close()
+
+    def close(self) -> None:
+        """Close every port."""
+        for port_url in list(self._ports):
+            self.remove_port(port_url)
+        self._selector.close()
+
+    def __enter__(self) -> MultiPortPoller:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def ports(self) -> dict[str, str]:
+        """Amplifier type by port URL."""
+        return {port_url: port.amp_type for port_url, port in self._ports.items()}
+
+    def trace(self, port_url: str) -> CommandTrace:
+        """Ring buffer of recent traffic on a port."""
+        return self._ports[port_url].trace
+
+    def submit(
+        self,
+        port_url: str,
+        commands: Sequence[bytes],
+        *,
+        skip: int = 0,
+        tag: Any = None,
+    ) -> None:
+        """Queue commands to send back to back on one port, each awaiting a reply.
+
+        Args:
+            port_url: Port to send on.
+            commands: Encoded commands.
+            skip: Bytes to skip when looking for the reply EOL.
+            tag: Returned with the batch's PollResult.
+
+        Raises:
+            ValueError: If commands is empty.
+        """
+        if not commands:
+            raise ValueError('No commands to submit')
+        self._ports[port_url].pending.append(_Batch(list(commands), skip, tag))
+
+    def run(self, timeout: float | None = None) -> Iterator[PollResult]:
+        """Execute queued batches on every port, yielding each as it completes.
+
+        A port whose device hangs up is removed, failing its remaining batches.
+
+        Args:
+            timeout: Stop after this many seconds; batches still queued then
+                stay queued for the next run().
+
+        Yields:
+            PollResult per batch, in completion order.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                return
+
+            waits = []
+            # snapshot: the consumer may add or remove ports at each yield
+            for port in list(self._ports.values()):
+                if self._removed(port):
+                    continue
+                if port.awaiting_reply and now >= port.reply_deadline:
+                    yield self._fail(port)
+                    if self._removed(port):
+                        continue
+                if port.awaiting_reply:
+                    waits.append(port.reply_deadline - now)
+                elif port.busy:
+                    due = port.last_send + port.min_interval
+                    if now >= due:
+                        # the consumer may have held the generator since `now`
+                        self._send_next(port, time.monotonic())
+                        waits.append(port.timeout)
+                    else:
+                        waits.append(due - now)
+            if not waits:
+                return
+
+            wait = min(waits)
+            if deadline is not None:
+                wait = min(wait, deadline - now)
+            for key, mask in self._selector.select(max(0.0, wait)):
+                port = key.data
+                if self._removed(port):
+                    continue
+                if mask & selectors.EVENT_WRITE:
+                    self._flush(port)
+                if mask & selectors.EVENT_READ:
+                    yield from self._receive(port)
+
+    def zone_statuses(
+        self,
+        zones: Mapping[str, Iterable[int]] | None = None,
+        *,
+        timeout: float | None = None,
+        composite: bool = False,
+    ) -> Iterator[tuple[str, int, dict[str, Any] | None]]:
+        """Read zone status from many ports concurrently.
+
+        Args:
+            zones: Zones to read by port URL (defaults to every zone of every
+                port's series).
+            timeout: Stop after this many seconds.
+            composite: Use per-attribute status queries where the protocol
+                has them (see AmpControlBase.enable_composite_status()).
+
+        Yields:
+            Tuples of port URL, zone and its status (None if it timed out or
+            did not parse), as each zone completes.
+        """
+        if zones is None:
+            zones = {
+                port_url: get_device_config(port.amp_type, 'zones')
+                for port_url, port in self._ports.items()
+            }
+        amp_types = self.ports
+        for port_url, port_zones in zones.items():
+            for zone in port_zones:
+                queries, skip = zone_status_queries(
+                    amp_types[port_url], zone, composite=composite
+                )
+                self.submit(port_url, queries, skip=skip, tag=zone)
+
+        for result in self.run(timeout):
+            status = None
+            if result.error is None:
+                status = parse_zone_status(
+                    amp_types[result.port_url], result.tag, result.replies
+                )
+            yield result.port_url, result.tag, status
+
+    def _removed(self, port: _Port) -> bool:
+        """Whether a port was removed (or replaced) while results were consumed."""
+        return self._ports.get(port.port_url) is not port
+
+    def _send_next(self, port: _Port, now: float) -> None:
+        if port.batch is None:
+            port.batch = port.pending.popleft()
+        command = port.batch.commands[len(port.batch.replies)]
+        port.received.clear()
+        port.trace.record(TRACE_SEND, command)
+        port.output += command
+        port.awaiting_reply = True
+        port.last_send = now
+        port.reply_deadline = now + port.timeout
+        self._flush(port)
+
+    def _flush(self, port: _Port) -> None:
+        try:
+            written = os.write(port.fd, port.output)
+        except BlockingIOError:
+            written = 0
+        except OSError as exc:
+            # a hung-up fd also turns readable, and _receive() fails the port
+            LOG.debug('Failed writing to port: port=%s, error=%s', port.port_url, exc)
+            written = len(port.output)
+        del port.output[:written]
+        events = selectors.EVENT_READ
+        if port.output:
+            events |= selectors.EVENT_WRITE
+        self._selector.modify(port.fd, events, port)
+
+    def _receive(self, port: _Port) -> list[PollResult]:
+        try:
+            data = os.read(port.fd, MAX_READ_SIZE)
+        except BlockingIOError:
+            return []
+        except OSError as exc:
+            return self._hang_up(port, exc)
+        if not data:
+            # EOF: the fd stays readable, so keeping the port would spin
+            return self._hang_up(port, None)
+        batch = port.batch
+        if not port.awaiting_reply or batch is None:
+            return []  # stray bytes between requests
+        port.received += data
+
+        if port.response_eol not in port.received[batch.skip :]:
+            return []
+        lines = [
+            line for line in port.received.split(port.response_eol)[:-1] if line.strip()
+        ]
+        if not lines:
+            return []
+
+        port.trace.record(TRACE_RECEIVE, bytes(port.received))
+        port.awaiting_reply = False
+        batch.replies.append(lines[0].decode('ascii', errors='ignore'))
+        if len(batch.replies) < len(batch.commands):
+            return []
+        port.batch = None
+        return [PollResult(port.port_url, batch.tag, batch.replies)]
+
+    def _hang_up(self, port: _Port, exc: OSError | None) -> list[PollResult]:
+        """Remove a port whose device hung up and fail its remaining batches."""
+        LOG.warning('Serial port hung up: port=%s, error=%s', port.port_url, exc)
+        self.remove_port(port.port_url)
+        batches = [] if port.batch is None else [port.batch]
+        batches.extend(port.pending)
+        port.batch = None
+        port.pending.clear()
+        port.awaiting_reply = False
+        error = serial.SerialException(f'Port {port.port_url} hung up')
+        return [
+            PollResult(port.port_url, batch.tag, batch.replies, error)
+            for batch in batches
+        ]
+
+    def _fail(self, port: _Port) -> PollResult:
+        batch = port.batch or _Batch([b''], 0, None)
+        port.trace.record(TRACE_TIMEOUT, bytes(port.received))
+        log_timeout(port.port_url, bytes(port.received), port.timeout, port.trace)
+        port.awaiting_reply = False
+        port.batch = None
+        return PollResult(
+            port.port_url,
+            batch.tag,
+            batch.replies,
+            serial.SerialTimeoutException(
+                f'No reply from {port.port_url} to {batch.commands[len(batch.replies)]!r}'
+            ),
+        )
@@ -7,6 +7,8 @@ and proper connection management.
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from dataclasses import dataclass
 import functools
 import logging
 import time
@@ -14,9 +16,21 @@ from typing import TYPE_CHECKING, Any
 
 from ratelimit import limits
 
+from .capture import REPLAY_URL_SCHEME, CaptureWriter, create_replay_connection
+from .health import (
+    BREAKER_OPEN,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_RESET_TIMEOUT,
+    AmpUnavailableError,
+    CircuitBreaker,
+    LinkStateEvent,
+)
+from .trace import TRACE_RECEIVE, TRACE_SEND, TRACE_TIMEOUT, CommandTrace
+from .transport import create_serial_connection
+
 if TYPE_CHECKING:
     from asyncio import AbstractEventLoop
-    from collections.abc import Callable
+    from pathlib import Path
 
 LOG = logging.getLogger(__name__)
 
@@ -28,6 +42,109 @@ CONF_THROTTLE_RATE = 'min_time_between_commands'
 
 DEFAULT_TIMEOUT = 1.0
 RATE_LIMIT_PERIOD_SECONDS = 300  # 5 minutes
+TIMEOUT_TRACE_EVENTS = 8  # trace events included in a timeout log
+
+# request queue backpressure policies
+BACKPRESSURE_WAIT = 'wait'
+BACKPRESSURE_REJECT = 'reject'
+BACKPRESSURE_DROP_OLDEST = 'drop_oldest'
+BACKPRESSURE_POLICIES = (
+    BACKPRESSURE_WAIT,
+    BACKPRESSURE_REJECT,
+    BACKPRESSURE_DROP_OLDEST,
+)
+DEFAULT_MAX_QUEUE_SIZE = 64
+
+
+class QueueFullError(Exception):
+    """Raised when the request queue is full and the policy is 'reject'."""
+
+
+class RequestDroppedError(Exception):
+    """Raised for a background request dropped to make room in the queue."""
+
+
+# one limiter shared by every port and controller, so the limit actually holds
+@limits(calls=2, period=RATE_LIMIT_PERIOD_SECONDS, raise_on_limit=False)
+def log_timeout(
+    port: str, received: bytes, timeout: float, trace: CommandTrace
+) -> None:
+    """Log a request timeout with the recent trace (at most twice per period).
+
+    Args:
+        port: Serial port path or URL.
+        received: Bytes received before the timeout.
+        timeout: Timeout that expired, in seconds.
+        trace: Trace of the port's recent traffic.
+    """
+    LOG.info(
+        'Request timeout: port=%s, received=%s, timeout=%s, recent traffic:\n%s',
+        port,
+        received,
+        timeout,
+        trace.format(TIMEOUT_TRACE_EVENTS),
+    )
+
+
+@dataclass(slots=True)
+class _Request:
+    """One queued unit of work for the writer task.
+
+    A request holds one or more commands that are sent back to back without
+    any other request being interleaved.
+    """
+
+    commands: list[bytes]
+    wait_for_reply: bool
+    skip: int
+    background: bool
+    future: asyncio.Future[list[str]]
+    deadline: float | None = None
+    lines: int = 1
+
+
+@dataclass(slots=True)
+class QueueMetrics:
+    """Request queue counters for one serial port.
+
+    Attributes:
+        depth: Requests currently waiting to be sent.
+        max_depth: Highest depth observed.
+        completed: Requests the writer task sent and answered successfully.
+        failed: Requests the writer task finished with an error.
+        rejected: Requests refused because the queue was full.
+        dropped: Background requests dropped to make room.
+        expired: Requests abandoned by their caller (deadline passed or
+            cancelled) before or while being sent.
+    """
+
+    depth: int = 0
+    max_depth: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    dropped: int = 0
+    expired: int = 0
+
+
+def resolve_deadline(
+    timeout: float | None = None,
+    deadline: float | None = None,
+) -> float | None:
+    """Combine a relative timeout and an absolute deadline.
+
+    Args:
+        timeout: Seconds from now.
+        deadline: Absolute time.monotonic() value.
+
+    Returns:
+        The earlier of the two as a time.monotonic() value, or None if neither
+        was given.
+    """
+    if timeout is None:
+        return deadline
+    expires = time.monotonic() + timeout
+    return expires if deadline is None else min(deadline, expires)
 
 
 async def async_get_rs232_protocol(
@@ -36,19 +153,33 @@ async def async_get_rs232_protocol(
     serial_config: dict[str, Any],
     protocol_config: dict[str, Any],
     loop: AbstractEventLoop,
+    *,
+    capture_path: str | Path | None = None,
+    max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+    backpressure: str = BACKPRESSURE_WAIT,
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+    reset_timeout: float = DEFAULT_RESET_TIMEOUT,
 ) -> RS232ControlProtocol:
     """Create an async RS232 protocol handler.
 
     Args:
-        serial_port: Serial port path or URL.
+        serial_port: Serial port path or URL; replay://<capture>?speed=<factor>
+            replays a traffic capture instead of opening a port.
         config: Device configuration dictionary.
         serial_config: Serial port settings (baudrate, parity, etc).
         protocol_config: Protocol-specific settings.
         loop: Event loop for async operations.
+        capture_path: Append all serial traffic to this capture file.
+        max_queue_size: Maximum number of queued requests.
+        backpressure: Policy when the queue is full (see BACKPRESSURE_POLICIES).
+        failure_threshold: Consecutive reply timeouts that open the circuit
+            breaker (see pyxantech.health).
+        reset_timeout: Seconds the breaker stays open before a trial request.
 
     Returns:
         Configured RS232ControlProtocol instance.
     """
+    capture = CaptureWriter(capture_path) if capture_path else None
     factory = functools.partial(
         RS232ControlProtocol,
         serial_port,
@@ -56,19 +187,22 @@ async def async_get_rs232_protocol(
         serial_config,
         protocol_config,
         loop,
+        capture=capture,
+        max_queue_size=max_queue_size,
+        backpressure=backpressure,
+        failure_threshold=failure_threshold,
+        reset_timeout=reset_timeout,
     )
-    LOG.info('Creating RS232 connection: port=%s, config=%s', serial_port, serial_config)
-
-    # defer import to avoid blocking in event loop
-    def _import_serial_asyncio() -> Callable[..., Any]:
-        from serial_asyncio import create_serial_connection
-        return create_serial_connection
-
-    create_serial_connection = await loop.run_in_executor(None, _import_serial_asyncio)
-
-    _, protocol = await create_serial_connection(
-        loop, factory, serial_port, **serial_config
+    LOG.info(
+        'Creating RS232 connection: port=%s, config=%s', serial_port, serial_config
     )
+
+    if serial_port.startswith(f'{REPLAY_URL_SCHEME}://'):
+        _, protocol = await create_replay_connection(loop, factory, serial_port)
+    else:
+        _, protocol = await create_serial_connection(
+            loop, factory, serial_port, **serial_config
+        )
     return protocol  # type: ignore[return-value]
 
 
@@ -76,7 +210,8 @@ class RS232ControlProtocol(asyncio.Protocol):
     """Async protocol handler for RS232 amplifier communication.
 
     Handles connection management, request throttling, and response parsing
-    for multi-zone amplifier serial protocols.
+    for multi-zone amplifier serial protocols. A single writer task per port
+    drains a bounded request queue; callers await futures instead of locks.
     """
 
     def __init__(
@@ -86,6 +221,12 @@ class RS232ControlProtocol(asyncio.Protocol):
         serial_config: dict[str, Any],
         protocol_config: dict[str, Any],
         loop: AbstractEventLoop,
+        *,
+        capture: CaptureWriter | None = None,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        backpressure: str = BACKPRESSURE_WAIT,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
     ) -> None:
         """Initialize the RS232 protocol handler.
 
@@ -95,23 +236,78 @@ class RS232ControlProtocol(asyncio.Protocol):
             serial_config: Serial port settings.
             protocol_config: Protocol-specific settings.
             loop: Event loop for async operations.
+            capture: Optional writer recording all serial traffic.
+            max_queue_size: Maximum number of queued requests.
+            backpressure: Policy when the queue is full: 'wait' for space,
+                'reject' with QueueFullError, or 'drop_oldest' background
+                request (waiting if there is none).
+            failure_threshold: Consecutive reply timeouts that open the
+                circuit breaker.
+            reset_timeout: Seconds the breaker stays open before a trial.
         """
         super().__init__()
 
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(f'Invalid backpressure policy {backpressure!r}')
+
         self._serial_port = serial_port
         self._config = config
         self._serial_config = serial_config
         self._protocol_config = protocol_config
         self._loop = loop
+        self._capture = capture
 
         self._last_send = time.time() - 1
         self._timeout = float(config.get('timeout', DEFAULT_TIMEOUT))
-        LOG.debug('Protocol initialized: port=%s, timeout=%s', serial_port, self._timeout)
+        LOG.debug(
+            'Protocol initialized: port=%s, timeout=%s', serial_port, self._timeout
+        )
 
         self._transport: Any = None
         self._connected = asyncio.Event()
         self._queue: asyncio.Queue[bytes] = asyncio.Queue()
-        self._lock = asyncio.Lock()
+
+        self._max_queue_size = max(1, max_queue_size)
+        self._backpressure = backpressure
+        self._pending: deque[_Request] = deque()
+        self._pending_ready = asyncio.Event()
+        self._space_waiters: deque[asyncio.Future[None]] = deque()
+        self._writer: asyncio.Task[None] | None = None
+        self._metrics = QueueMetrics()
+        self._trace = CommandTrace()
+        self._breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self._breaker.add_listener(self._on_link_state)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting to be sent."""
+        return len(self._pending)
+
+    @property
+    def metrics(self) -> QueueMetrics:
+        """Request queue counters (depth is current at access time)."""
+        self._metrics.depth = len(self._pending)
+        return self._metrics
+
+    @property
+    def trace(self) -> CommandTrace:
+        """Ring buffer of recent commands and replies on this port."""
+        return self._trace
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """Circuit breaker tracking whether the amp answers."""
+        return self._breaker
+
+    def _on_link_state(self, event: LinkStateEvent) -> None:
+        if event.new != BREAKER_OPEN:
+            return
+        # queued requests would each wait the full timeout; fail them now
+        while self._pending:
+            request = self._pending.popleft()
+            self._wake_space_waiter()
+            if not request.future.done():
+                request.future.set_exception(AmpUnavailableError('Amp unreachable'))
 
     def connection_made(self, transport: Any) -> None:
         """Handle successful connection establishment."""
@@ -121,11 +317,27 @@ class RS232ControlProtocol(asyncio.Protocol):
 
     def data_received(self, data: bytes) -> None:
         """Handle incoming data from serial port."""
-        asyncio.ensure_future(self._queue.put(data))
+        if self._capture is not None:
+            self._capture.read(data)
+        self._queue.put_nowait(data)
 
     def connection_lost(self, exc: Exception | None) -> None:
         """Handle connection closure."""
         LOG.debug('Port closed: port=%s', self._serial_port)
+        if self._capture is not None:
+            self._capture.close()
+        if self._writer is not None:
+            self._writer.cancel()
+            self._writer = None
+        while self._pending:
+            request = self._pending.popleft()
+            if not request.future.done():
+                request.future.set_exception(ConnectionError('Serial port closed'))
+
+    def close(self) -> None:
+        """Close the underlying transport."""
+        if self._transport is not None:
+            self._transport.close()
 
     async def _throttle_requests(self) -> None:
         """Enforce minimum time between RS232 commands to prevent timeouts."""
@@ -146,10 +358,13 @@ class RS232ControlProtocol(asyncio.Protocol):
         Returns:
             True if connected, False if timeout.
         """
+        if self._connected.is_set():
+            return True
         try:
-            await asyncio.wait_for(self._connected.wait(), self._timeout)
+            async with asyncio.timeout(self._timeout):
+                await self._connected.wait()
             return True
-        except asyncio.TimeoutError:
+        except TimeoutError:
             LOG.debug('Connection timeout: port=%s', self._serial_port)
             return False
 
@@ -159,6 +374,10 @@ class RS232ControlProtocol(asyncio.Protocol):
         *,
         wait_for_reply: bool = True,
         skip: int = 0,
+        background: bool = False,
+        timeout: float | None = None,
+        deadline: float | None = None,
+        lines: int = 1,
     ) -> str:
         """Send command and optionally wait for response.
 
@@ -166,67 +385,292 @@ class RS232ControlProtocol(asyncio.Protocol):
             request: Command bytes to send.
             wait_for_reply: Whether to wait for and return response.
             skip: Number of bytes to skip when looking for EOL.
+            background: Mark as a background request that may be dropped
+                under the 'drop_oldest' backpressure policy.
+            timeout: Give up after this many seconds, including queue time.
+            deadline: Give up at this time.monotonic() value.
+            lines: Number of response lines to read (joined by the response
+                EOL), for queries answered with several lines.
 
         Returns:
             Response string, or empty string if no reply expected/received.
 
         Raises:
-            asyncio.TimeoutError: If response not received within timeout.
+            TimeoutError: If response not received within timeout or
+                the deadline passed.
+            QueueFullError: If the queue is full and the policy is 'reject'.
+            RequestDroppedError: If a background request was dropped.
+            AmpUnavailableError: If the circuit breaker is open.
         """
-        async with self._lock:
-            if not await self._wait_for_connection():
-                return ''
-
-            await self._throttle_requests()
+        replies = await self.send_many(
+            [request],
+            wait_for_reply=wait_for_reply,
+            skip=skip,
+            background=background,
+            timeout=timeout,
+            deadline=deadline,
+            lines=lines,
+        )
+        return replies[0]
+
+    async def send_many(
+        self,
+        requests: list[bytes],
+        *,
+        wait_for_reply: bool = True,
+        skip: int = 0,
+        background: bool = False,
+        timeout: float | None = None,
+        deadline: float | None = None,
+        lines: int = 1,
+    ) -> list[str]:
+        """Send several commands back to back as one atomic queue entry.
+
+        No other request is interleaved between the commands. A request whose
+        deadline passes while queued is never sent. If the deadline passes or
+        the caller is cancelled while a reply is pending, the caller returns
+        immediately and the writer discards the late reply before moving on,
+        so the next request stays in sync with the amp.
 
-            # clear buffers before sending
-            self._transport.serial.reset_output_buffer()
-            self._transport.serial.reset_input_buffer()
-            while not self._queue.empty():
-                self._queue.get_nowait()
+        Args:
+            requests: Command bytes to send, in order.
+            wait_for_reply: Whether to wait for a response to each command.
+            skip: Number of bytes to skip when looking for EOL.
+            background: Mark as a background request (see send()).
+            timeout: Give up after this many seconds, including queue time.
+            deadline: Give up at this time.monotonic() value.
+            lines: Number of response lines to read for each command.
 
-            LOG.debug('Sending RS232 command: request=%s', request)
-            self._last_send = time.time()
-            self._transport.serial.write(request)
+        Returns:
+            One response string per command.
 
-            if not wait_for_reply:
+        Raises:
+            TimeoutError: If a response is not received within timeout
+                or the deadline passed.
+            QueueFullError: If the queue is full and the policy is 'reject'.
+            RequestDroppedError: If a background request was dropped.
+            AmpUnavailableError: If the circuit breaker is open.
+        """
+        if not requests:
+            return []
+        self._breaker.before_request()
+
+        deadline = resolve_deadline(timeout, deadline)
+        future: asyncio.Future[list[str]] = self._loop.create_future()
+        request = _Request(
+            list(requests), wait_for_reply, skip, background, future, deadline, lines
+        )
+        if deadline is None:
+            await self._enqueue(request)
+            return await future
+
+        # the loop clock is time.monotonic() for the standard event loops
+        when = self._loop.time() + (deadline - time.monotonic())
+        async with asyncio.timeout_at(when):
+            await self._enqueue(request)
+            return await future
+
+    async def _enqueue(self, request: _Request) -> None:
+        """Add a request to the queue, applying the backpressure policy."""
+        metrics = self._metrics
+
+        if len(self._pending) >= self._max_queue_size:
+            if self._backpressure == BACKPRESSURE_REJECT:
+                metrics.rejected += 1
+                raise QueueFullError(
+                    f'Request queue full: port={self._serial_port}, '
+                    f'size={self._max_queue_size}'
+                )
+            if self._backpressure == BACKPRESSURE_DROP_OLDEST:
+                self._drop_oldest_background()
+
+        while len(self._pending) >= self._max_queue_size:
+            waiter: asyncio.Future[None] = self._loop.create_future()
+            self._space_waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._space_waiters:
+                    self._space_waiters.remove(waiter)
+                raise
+
+        self._pending.append(request)
+        metrics.max_depth = max(metrics.max_depth, len(self._pending))
+        self._pending_ready.set()
+
+        if self._writer is None or self._writer.done():
+            self._writer = self._loop.create_task(self._run_writer())
+
+    def _drop_oldest_background(self) -> None:
+        """Drop the oldest queued background request, if there is one."""
+        for queued in self._pending:
+            if queued.background:
+                self._pending.remove(queued)
+                self._metrics.dropped += 1
+                if not queued.future.done():
+                    queued.future.set_exception(
+                        RequestDroppedError('Background request dropped: queue full')
+                    )
+                return
+
+    def _wake_space_waiter(self) -> None:
+        while self._space_waiters:
+            waiter = self._space_waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _run_writer(self) -> None:
+        """Writer task: drain the request queue one entry at a time."""
+        while True:
+            while not self._pending:
+                self._pending_ready.clear()
+                await self._pending_ready.wait()
+
+            request = self._pending.popleft()
+            self._wake_space_waiter()
+
+            if request.future.done():
+                # caller gave up while the request was queued
+                self._metrics.expired += 1
+                continue
+            if request.deadline is not None and time.monotonic() >= request.deadline:
+                self._metrics.expired += 1
+                request.future.set_exception(
+                    TimeoutError('Request deadline passed while queued')
+                )
+                continue
+
+            try:
+                replies = await self._execute(request)
+            except asyncio.CancelledError:
+                if not request.future.done():
+                    request.future.cancel()
+                raise
+            except Exception as exc:
+                self._metrics.failed += 1
+                if not request.future.done():
+                    request.future.set_exception(exc)
+            else:
+                if request.future.done():
+                    # caller gave up while the request was being sent
+                    self._metrics.expired += 1
+                else:
+                    self._metrics.completed += 1
+                    request.future.set_result(replies)
+
+    async def _execute(self, request: _Request) -> list[str]:
+        """Send the commands of one request and collect the replies."""
+        if not await self._wait_for_connection():
+            return [''] * len(request.commands)
+
+        replies = []
+        for command in request.commands:
+            if request.future.done():
+                # caller gave up part way through a batch
+                break
+            await self._throttle_requests()
+            self._write(command)
+            if request.wait_for_reply:
+                replies.append(await self._read_reply(request, command))
+            else:
+                replies.append('')
+        return replies
+
+    async def _read_reply(self, request: _Request, command: bytes) -> str:
+        """Read the reply to the command just written for a request.
+
+        If the caller gives up first, keep reading in the background of the
+        writer until the reply's EOL (or the device timeout) so the late reply
+        is discarded rather than mistaken for the next request's reply.
+        """
+        read = self._loop.create_task(
+            self._read_response(request.skip, request.lines, command)
+        )
+        try:
+            await asyncio.wait(
+                (read, request.future), return_when=asyncio.FIRST_COMPLETED
+            )
+            if not read.done():
+                LOG.debug(
+                    'Caller gave up, discarding late reply: port=%s', self._serial_port
+                )
+                await asyncio.wait((read,))
+                # consume the result so a late timeout is not reported as unhandled
+                if not read.cancelled():
+                    read.exception()
                 return ''
-
-            return await self._read_response(skip)
-
-    async def _read_response(self, skip: int) -> str:
+        except asyncio.CancelledError:
+            read.cancel()
+            raise
+        return read.result()
+
+    def _write(self, request: bytes) -> None:
+        """Clear stale input and write a command to the port."""
+        port = self._transport.serial
+        if port is not None:
+            port.reset_output_buffer()
+            port.reset_input_buffer()
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+        self._trace.record(TRACE_SEND, request)
+        self._last_send = time.time()
+        if self._capture is not None:
+            self._capture.write(request)
+        self._transport.write(request)
+
+    async def _read_response(
+        self, skip: int, lines: int = 1, command: bytes = b''
+    ) -> str:
         """Read and parse response from serial port.
 
         Args:
             skip: Number of bytes to skip when looking for EOL.
+            lines: Number of non-blank lines to read; more than one are
+                returned joined by the response EOL.
+            command: The command just written; when reading several lines,
+                an echo of it is not counted as a reply line.
 
         Returns:
             Parsed response string.
 
         Raises:
-            asyncio.TimeoutError: If response not received within timeout.
+            TimeoutError: If response not received within timeout.
         """
         data = bytearray()
-        response_eol = self._protocol_config.get(CONF_RESPONSE_EOL, '\r').encode('ascii')
+        response_eol = self._protocol_config.get(CONF_RESPONSE_EOL, '\r').encode(
+            'ascii'
+        )
+        echo = command.strip()
 
         try:
             while True:
-                chunk = await asyncio.wait_for(self._queue.get(), self._timeout)
+                async with asyncio.timeout(self._timeout):
+                    chunk = await self._queue.get()
                 data += chunk
 
                 if response_eol in data[skip:]:
-                    decoded = bytes(data).decode('ascii', errors='ignore')
-                    LOG.debug(
-                        'Received response: data=%s, length=%d, eol=%s',
-                        decoded,
-                        len(data),
-                        response_eol,
-                    )
+                    if lines > 1:
+                        # only count lines already terminated by the EOL,
+                        # skipping an echo of the command (with or without
+                        # its separator)
+                        complete = [
+                            line
+                            for line in data.split(response_eol)[:-1]
+                            if line.strip() and not echo.startswith(line.strip())
+                        ]
+                        if len(complete) < lines:
+                            continue
+                        self._trace.record(TRACE_RECEIVE, bytes(data))
+                        self._breaker.record_success()
+                        return response_eol.join(complete[:lines]).decode(
+                            'ascii', errors='ignore'
+                        )
 
-                    result_lines = [
-                        line for line in data.split(response_eol)
-                        if line
-                    ]
+                    self._trace.record(TRACE_RECEIVE, bytes(data))
+                    self._breaker.record_success()
+                    result_lines = [line for line in data.split(response_eol) if line]
 
                     if not result_lines:
                         return ''
@@ -239,30 +683,8 @@ class RS232ControlProtocol(asyncio.Protocol):
 
                     return result_lines[0].decode('ascii', errors='ignore')
 
-        except asyncio.TimeoutError:
-            # rate-limited logging to avoid log saturation
-            self._log_timeout(data=data, response_eol=response_eol)
+        except TimeoutError:
+            self._trace.record(TRACE_TIMEOUT, bytes(data))
+            self._breaker.record_failure()
+            log_timeout(self._serial_port, bytes(data), self._timeout, self._trace)
             raise
-
-    def _log_timeout(
-        self,
-        data: bytearray,
-        response_eol: bytes,
-    ) -> None:
-        """Log timeout with rate limiting to prevent log saturation."""
-        # use local function with @limits to get fresh rate limit per timeout context
-        # (avoids RateLimitException being raised and propagated up)
-        @limits(calls=2, period=RATE_LIMIT_PERIOD_SECONDS)
-        def _do_log() -> None:
-            LOG.info(
-                'Request timeout: received=%s, timeout=%s, eol=%s',
-                bytes(data),
-                self._timeout,
-                response_eol,
-            )
-
-        try:
-            _do_log()
-        except Exception:
-            # suppress rate limit exceptions - we just want to skip logging
-            pass
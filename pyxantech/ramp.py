@@ -0,0 +1,156 @@
+"""Volume ramp planning for fades across many zones.
+
+Ramps are planned up front as a list of rounds. Each round holds at most one
+step per zone, so zones sharing a serial line are interleaved round-robin and
+the whole fade fits within the device pacing budget for the requested duration.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+
+def _linear(x: float) -> float:
+    return x
+
+
+def _ease_in(x: float) -> float:
+    return x * x
+
+
+def _ease_out(x: float) -> float:
+    return 1.0 - (1.0 - x) * (1.0 - x)
+
+
+def _ease_in_out(x: float) -> float:
+    return x * x * (3.0 - 2.0 * x)
+
+
+CURVES: dict[str, Callable[[float], float]] = {
+    'linear': _linear,
+    'ease_in': _ease_in,
+    'ease_out': _ease_out,
+    'ease_in_out': _ease_in_out,
+}
+
+
+@dataclass(frozen=True)
+class RampStep:
+    """A single volume level to send to a zone.
+
+    Attributes:
+        zone: Zone number.
+        volume: Absolute volume level for this step.
+    """
+
+    zone: int
+    volume: int
+
+
+@dataclass(frozen=True)
+class RampPlan:
+    """Planned ramp as time-ordered rounds.
+
+    Attributes:
+        rounds: Steps per round; at most one step per zone in each round.
+        interval: Seconds between the start of consecutive rounds.
+        targets: Final volume for every zone in the ramp.
+    """
+
+    rounds: list[list[RampStep]]
+    interval: float
+    targets: dict[int, int]
+
+    @property
+    def duration(self) -> float:
+        """Planned duration of the ramp in seconds."""
+        return self.interval * len(self.rounds)
+
+
+def _resolve_curve(curve: str | Callable[[float], float]) -> Callable[[float], float]:
+    if callable(curve):
+        return curve
+    try:
+        return CURVES[curve]
+    except KeyError:
+        raise ValueError(f'Unknown ramp curve {curve!r}') from None
+
+
+def _zone_levels(
+    start: int,
+    target: int,
+    steps: int,
+    curve: Callable[[float], float],
+) -> list[int]:
+    """Return the distinct volume levels for one zone, ending at target."""
+    levels: list[int] = []
+    last = start
+    for i in range(1, steps):
+        fraction = min(1.0, max(0.0, curve(i / steps)))
+        level = round(start + (target - start) * fraction)
+        if level != last and level != target:
+            levels.append(level)
+            last = level
+    levels.append(target)
+    return levels
+
+
+def plan_ramp(
+    start: Mapping[int, int],
+    target: int,
+    duration: float,
+    min_interval: float,
+    curve: str | Callable[[float], float] = 'linear',
+) -> RampPlan:
+    """Plan a volume ramp for several zones sharing one serial line.
+
+    Args:
+        start: Current volume per zone.
+        target: Volume every zone should end at.
+        duration: Requested ramp duration in seconds.
+        min_interval: Minimum seconds between commands on the line.
+        curve: Curve name from CURVES or a callable mapping [0, 1] to [0, 1].
+
+    Returns:
+        RampPlan whose rounds fit within the requested duration.
+
+    Raises:
+        ValueError: If the curve is unknown or duration is negative.
+    """
+    if duration < 0:
+        raise ValueError(f'Invalid ramp duration {duration}')
+    curve_fn = _resolve_curve(curve)
+
+    zones = [zone for zone in start if start[zone] != target]
+    targets = dict.fromkeys(start, target)
+    if not zones:
+        return RampPlan(rounds=[], interval=0.0, targets=targets)
+
+    # each round sends one command per zone, so the budget is shared
+    if min_interval > 0:
+        max_rounds = max(1, int(duration / min_interval) // len(zones))
+    else:
+        max_rounds = max(abs(target - start[zone]) for zone in zones)
+
+    levels = {
+        zone: _zone_levels(
+            start[zone], target, min(abs(target - start[zone]), max_rounds), curve_fn
+        )
+        for zone in zones
+    }
+    num_rounds = max(len(zone_levels) for zone_levels in levels.values())
+    rounds: list[list[RampStep]] = [[] for _ in range(num_rounds)]
+
+    # spread zones with fewer steps evenly over the rounds
+    for zone, zone_levels in levels.items():
+        count = len(zone_levels)
+        for j, level in enumerate(zone_levels):
+            round_index = math.ceil((j + 1) * num_rounds / count) - 1
+            rounds[round_index].append(RampStep(zone, level))
+
+    return RampPlan(rounds=rounds, interval=duration / num_rounds, targets=targets)
@@ -0,0 +1,90 @@
+"""Persisted zone-state snapshots for warm starts.
+
+A snapshot is a small JSON file holding the last known ZoneStatus values per
+zone. Controllers load it at construction as provisional (stale) state so data
+is available immediately while the amp is revalidated in the background.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+import tempfile
+import time
+from typing import Any
+
+LOG = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+DEFAULT_SNAPSHOT_INTERVAL = 60.0
+
+
+def save_snapshot(
+    path: str | Path,
+    amp_type: str,
+    zones: dict[int, dict[str, Any]],
+) -> None:
+    """Atomically write a zone-state snapshot.
+
+    Args:
+        path: Snapshot file path.
+        amp_type: Amplifier type the state belongs to.
+        zones: Zone status dictionaries keyed by zone number.
+    """
+    path = Path(path)
+    payload = {
+        'version': SNAPSHOT_VERSION,
+        'amp_type': amp_type,
+        'saved_at': time.time(),
+        'zones': {str(zone): status for zone, status in zones.items()},
+    }
+
+    fd, tmp_name = tempfile.mkstemp(prefix=f'.{path.name}.', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as stream:
+            json.dump(payload, stream, separators=(',', ':'))
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def load_snapshot(path: str | Path, amp_type: str) -> dict[int, dict[str, Any]]:
+    """Load a zone-state snapshot written by save_snapshot().
+
+    Missing, unreadable or mismatched snapshots are ignored.
+
+    Args:
+        path: Snapshot file path.
+        amp_type: Expected amplifier type.
+
+    Returns:
+        Zone status dictionaries keyed by zone number (empty if unavailable).
+    """
+    try:
+        with Path(path).open(encoding='utf-8') as stream:
+            payload = json.load(stream)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError):
+        LOG.warning('Failed reading zone snapshot: path=%s', path)
+        return {}
+
+    if not isinstance(payload, dict):
+        LOG.warning('Malformed zone snapshot: path=%s', path)
+        return {}
+
+    if (
+        payload.get('version') != SNAPSHOT_VERSION
+        or payload.get('amp_type') != amp_type
+    ):
+        LOG.info('Ignoring zone snapshot for different amp: path=%s', path)
+        return {}
+
+    try:
+        return {int(zone): status for zone, status in payload['zones'].items()}
+    except (KeyError, AttributeError, TypeError, ValueError):
+        LOG.warning('Malformed zone snapshot: path=%s', path)
+        return {}
@@ -0,0 +1,90 @@
+"""In-memory trace of serial command traffic.
+
+A fixed-size ring buffer of structured events replaces per-command logging:
+recording an event is one tuple append, and formatting (hex, decoding) only
+happens when the trace is dumped, on demand or after an error:
+
+    amp.trace.dump()                     # log every buffered event
+    for event in amp.trace.events():     # or inspect them directly
+        ...
+"""
+
+from __future__ import annotations
+
+from collections import deque
+import logging
+import time
+from typing import Any, NamedTuple
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_TRACE_SIZE = 256
+
+# event kinds
+TRACE_SEND = 'send'
+TRACE_RECEIVE = 'receive'
+TRACE_TIMEOUT = 'timeout'
+
+
+class TraceEvent(NamedTuple):
+    """A single traced event.
+
+    Attributes:
+        time: time.monotonic() when the event was recorded.
+        kind: Event kind (TRACE_SEND, TRACE_RECEIVE or TRACE_TIMEOUT).
+        data: Bytes written or received.
+    """
+
+    time: float
+    kind: str
+    data: Any
+
+
+class CommandTrace:
+    """Ring buffer of the most recent serial events.
+
+    Args:
+        size: Number of events kept; older events are overwritten.
+    """
+
+    def __init__(self, size: int = DEFAULT_TRACE_SIZE) -> None:
+        self._events: deque[tuple[float, str, Any]] = deque(maxlen=size)
+        self._clock = time.monotonic
+
+    def record(self, kind: str, data: Any = None) -> None:
+        """Append an event (cheap enough for every command)."""
+        self._events.append((self._clock(), kind, data))
+
+    def events(self, last: int | None = None) -> list[TraceEvent]:
+        """Return buffered events, oldest first.
+
+        Args:
+            last: Only return this many of the most recent events.
+        """
+        events = list(self._events)
+        if last is not None:
+            events = events[-last:] if last > 0 else []
+        return [TraceEvent(*event) for event in events]
+
+    def format(self, last: int | None = None) -> str:
+        """Format buffered events one per line, times relative to the newest."""
+        events = self.events(last)
+        if not events:
+            return ''
+        newest = events[-1].time
+        return '\n'.join(
+            f'{event.time - newest:+.3f}s {event.kind:<8} {event.data!r}'
+            for event in events
+        )
+
+    def dump(self, logger: logging.Logger = LOG, level: int = logging.INFO) -> None:
+        """Log every buffered event as one message."""
+        if logger.isEnabledFor(level):
+            logger.log(level, 'Command trace:\n%s', self.format())
+
+    def clear(self) -> None:
+        """Discard all buffered events."""
+        self._events.clear()
+
+    def __len__(self) -> int:
+        return len(self._events)
@@ -0,0 +1,248 @@
+"""Native asyncio serial transport.
+
+Registers the tty file descriptor directly with the event loop reader/writer
+callbacks instead of polling it. Pyserial is only used once per connection to
+open the port and configure termios. Ports without a file descriptor (e.g.
+``socket://`` URLs) and non-POSIX platforms fall back to pyserial-asyncio,
+whose import cost is paid at most once per process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import os
+import sys
+from typing import TYPE_CHECKING, Any
+
+import serial
+
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop
+    from collections.abc import Callable
+
+LOG = logging.getLogger(__name__)
+
+MAX_READ_SIZE = 1024
+
+_serial_asyncio_transport: Callable[..., asyncio.Transport] | None = None
+
+
+def _fallback_transport_class() -> Callable[..., asyncio.Transport]:
+    """Return pyserial-asyncio's transport class, importing it only once."""
+    global _serial_asyncio_transport
+    if _serial_asyncio_transport is None:
+        from serial_asyncio import SerialTransport as _SerialAsyncioTransport
+
+        _serial_asyncio_transport = _SerialAsyncioTransport
+    return _serial_asyncio_transport
+
+
+def _native_fileno(serial_instance: Any) -> int | None:
+    """Return the file descriptor usable with add_reader, if any."""
+    if sys.platform == 'win32':
+        return None
+    try:
+        fd = serial_instance.fileno()
+    except (AttributeError, NotImplementedError, OSError, serial.SerialException):
+        return None
+    return fd if isinstance(fd, int) and fd >= 0 else None
+
+
+class SerialTransport(asyncio.Transport):
+    """Asyncio transport over a POSIX serial file descriptor."""
+
+    def __init__(
+        self,
+        loop: AbstractEventLoop,
+        protocol: asyncio.Protocol,
+        serial_instance: Any,
+        fd: int,
+    ) -> None:
+        super().__init__()
+        self._loop = loop
+        self._protocol = protocol
+        self._serial = serial_instance
+        self._fd = fd
+        self._write_buffer = bytearray()
+        self._writing = False
+        self._closing = False
+        self._closed = False
+        self._paused = False
+
+        os.set_blocking(fd, False)
+        loop.call_soon(protocol.connection_made, self)
+        loop.call_soon(self._start_reading)
+
+    @property
+    def serial(self) -> Any:
+        """The underlying pyserial instance."""
+        return self._serial
+
+    @property
+    def loop(self) -> AbstractEventLoop:
+        """The event loop this transport is attached to."""
+        return self._loop
+
+    def get_extra_info(self, name: str, default: Any = None) -> Any:
+        if name == 'serial':
+            return self._serial
+        if name == 'fileno':
+            return self._fd
+        return default
+
+    def get_protocol(self) -> asyncio.BaseProtocol:
+        return self._protocol
+
+    def set_protocol(self, protocol: asyncio.BaseProtocol) -> None:
+        self._protocol = protocol  # type: ignore[assignment]
+
+    def is_closing(self) -> bool:
+        return self._closing
+
+    def _start_reading(self) -> None:
+        if not self._closing and not self._paused:
+            self._loop.add_reader(self._fd, self._read_ready)
+
+    def is_reading(self) -> bool:
+        return not self._closing and not self._paused
+
+    def pause_reading(self) -> None:
+        if self._closing or self._paused:
+            return
+        self._paused = True
+        self._loop.remove_reader(self._fd)
+
+    def resume_reading(self) -> None:
+        if self._closing or not self._paused:
+            return
+        self._paused = False
+        self._start_reading()
+
+    def _read_ready(self) -> None:
+        try:
+            data = os.read(self._fd, MAX_READ_SIZE)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as exc:
+            self._fatal_error(exc)
+            return
+
+        if not data:
+            # EOF: the device hung up, and the fd would stay readable forever
+            LOG.warning('Serial port hung up: port=%s', self._serial.port)
+            self._closing = True
+            self._close(None)
+            return
+        self._protocol.data_received(data)
+
+    def write(self, data: bytes | bytearray | memoryview) -> None:
+        if self._closing:
+            return
+
+        if not self._write_buffer:
+            try:
+                written = os.write(self._fd, data)
+            except (BlockingIOError, InterruptedError):
+                written = 0
+            except OSError as exc:
+                self._fatal_error(exc)
+                return
+
+            if written == len(data):
+                return
+            data = memoryview(data)[written:]
+            self._loop.add_writer(self._fd, self._write_ready)
+            self._writing = True
+
+        self._write_buffer += data
+
+    def _write_ready(self) -> None:
+        try:
+            written = os.write(self._fd, self._write_buffer)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as exc:
+            self._fatal_error(exc)
+            return
+
+        del self._write_buffer[:written]
+        if not self._write_buffer:
+            self._loop.remove_writer(self._fd)
+            self._writing = False
+            if self._closing:
+                self._close(None)
+
+    def can_write_eof(self) -> bool:
+        return False
+
+    def get_write_buffer_size(self) -> int:
+        return len(self._write_buffer)
+
+    def close(self) -> None:
+        if self._closing:
+            return
+        self._closing = True
+        self._loop.remove_reader(self._fd)
+        if not self._write_buffer:
+            self._close(None)
+
+    def abort(self) -> None:
+        self._closing = True
+        self._close(None)
+
+    def _fatal_error(self, exc: Exception) -> None:
+        LOG.warning('Serial transport error: port=%s, error=%s', self._serial.port, exc)
+        self._closing = True
+        self._close(exc)
+
+    def _close(self, exc: Exception | None) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._write_buffer.clear()
+        self._loop.remove_reader(self._fd)
+        if self._writing:
+            self._loop.remove_writer(self._fd)
+            self._writing = False
+        self._loop.call_soon(self._call_connection_lost, exc)
+
+    def _call_connection_lost(self, exc: Exception | None) -> None:
+        try:
+            self._protocol.connection_lost(exc)
+        finally:
+            self._serial.close()
+
+
+async def create_serial_connection(
+    loop: AbstractEventLoop,
+    protocol_factory: Callable[[], asyncio.Protocol],
+    url: str,
+    **kwargs: Any,
+) -> tuple[asyncio.Transport, asyncio.Protocol]:
+    """Open a serial port and connect it to a protocol.
+
+    Args:
+        loop: Event loop to attach the transport to.
+        protocol_factory: Callable returning the protocol instance.
+        url: Serial port path or pyserial URL.
+        **kwargs: Pyserial settings (baudrate, parity, etc).
+
+    Returns:
+        Tuple of (transport, protocol).
+    """
+    # opening and configuring the tty can block, so keep it off the loop
+    serial_instance = await loop.run_in_executor(
+        None, functools.partial(serial.serial_for_url, url, **kwargs)
+    )
+    protocol = protocol_factory()
+
+    fd = _native_fileno(serial_instance)
+    if fd is None:
+        LOG.debug('No native fd for serial port, using pyserial-asyncio: port=%s', url)
+        transport = _fallback_transport_class()(loop, protocol, serial_instance)
+    else:
+        transport = SerialTransport(loop, protocol, serial_instance, fd)
+
+    return transport, protocol
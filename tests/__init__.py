@@ -36,3 +36,34 @@ def create_dummy_port(responses: dict[bytes, bytes]) -> str:
     thread = threading.Thread(target=listener, args=[master], daemon=True)
     thread.start()
     return os.ttyname(slave)
+
+
+def create_responder_port(
+    handler: Callable[[bytes], bytes | None],
+    terminator: bytes = b'\r',
+) -> str:
+    """Create a pseudo-terminal that answers every request via a callback.
+
+    Args:
+        handler: Called with each request (including terminator); returns the
+            bytes to reply with, or None to stay silent.
+        terminator: Byte sequence ending each request.
+
+    Returns:
+        Path to the slave pseudo-terminal device.
+    """
+
+    def listener(port: int) -> None:
+        while True:
+            res = b''
+            while not res.endswith(terminator):
+                res += os.read(port, 1)
+
+            resp = handler(res)
+            if resp:
+                os.write(port, resp)
+
+    master, slave = pty.openpty()
+    thread = threading.Thread(target=listener, args=[master], daemon=True)
+    thread.start()
+    return os.ttyname(slave)
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import time
+
 import pytest
+import serial
 
 from pyxantech import (
     SUPPORTED_AMP_TYPES,
     get_amp_controller,
 )
 
+from . import create_responder_port
+
 
 class TestGetAmpController:
     """Tests for get_amp_controller factory function."""
@@ -54,3 +59,39 @@ class TestAmpControllerInterface:
             assert hasattr(AmpControlBase, method), (
                 f'AmpControlBase should define {method}'
             )
+
+
+class TestSyncDeadlines:
+    """Tests for per-call deadlines on the synchronous controller."""
+
+    def test_past_deadline_is_not_sent(self) -> None:
+        """Verify a call whose deadline already passed never writes."""
+        requests: list[bytes] = []
+        port = create_responder_port(
+            lambda request: requests.append(request) or b'#>110104000131112100601\r',
+            terminator=b'\r',
+        )
+        amp = get_amp_controller('monoprice6', port)
+        assert amp is not None
+
+        with pytest.raises(serial.SerialTimeoutException):
+            amp.set_volume(11, 20, deadline=time.monotonic() - 1)
+        assert amp.zone_status(11, timeout=2.0)['volume'] == 13
+        assert requests == [b'?11#\r']
+        amp.close()
+
+    def test_deadline_bounds_blocking_read(self) -> None:
+        """Verify a short deadline is not stretched to the port timeout."""
+        port = create_responder_port(lambda request: None, terminator=b'\r')
+        amp = get_amp_controller('xantech8', port)
+        assert amp is not None
+        port_timeout = amp._port.timeout
+
+        started = time.monotonic()
+        with pytest.raises(serial.SerialTimeoutException):
+            amp.zone_status(1, timeout=0.2)
+
+        assert time.monotonic() - started < 1.0
+        assert amp._port.timeout == port_timeout
+        assert amp.link_state == 'closed'
+        amp.close()
@@ -0,0 +1,106 @@
+"""Tests for baud rate negotiation."""
+
+from __future__ import annotations
+
+import os
+import pty
+import termios
+import threading
+from typing import TYPE_CHECKING
+
+from pyxantech import get_amp_controller, negotiate_baud
+from pyxantech.baud import candidate_baud_rates, load_cached_baud, save_cached_baud
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+ZONE_REPLY = b'#>110104000131112100601\r'
+
+
+def create_baud_port(speed: int, requests: list[int]) -> str:
+    """Create a pseudo-terminal that only answers when opened at one speed.
+
+    Args:
+        speed: termios speed constant (e.g. termios.B19200) the amp runs at.
+        requests: Collects the speed of every request received.
+
+    Returns:
+        Path to the slave pseudo-terminal device.
+    """
+
+    def listener(master: int, slave: int) -> None:
+        while True:
+            res = b''
+            while not res.endswith(b'\r'):
+                res += os.read(master, 1)
+
+            current = termios.tcgetattr(slave)[4]
+            requests.append(current)
+            if current == speed:
+                os.write(master, ZONE_REPLY)
+
+    master, slave = pty.openpty()
+    thread = threading.Thread(target=listener, args=[master, slave], daemon=True)
+    thread.start()
+    return os.ttyname(slave)
+
+
+class TestBaudCache:
+    """Tests for candidate rates and the negotiated rate cache."""
+
+    def test_candidates_include_model_overrides(self) -> None:
+        """Verify series and model rates are probed fastest first."""
+        rates = candidate_baud_rates('xantech8')
+
+        assert 57600 in rates
+        assert 9600 in rates
+        assert rates == sorted(rates, reverse=True)
+
+    def test_cache_round_trip(self, tmp_path: Path) -> None:
+        """Verify a cached rate is only returned for the same series."""
+        path = tmp_path / 'cache' / 'baud.json'
+        save_cached_baud(path, '/dev/ttyUSB0', 'monoprice6', 19200)
+        save_cached_baud(path, '/dev/ttyUSB1', 'xantech8', 57600)
+
+        assert load_cached_baud(path, '/dev/ttyUSB0', 'monoprice6') == 19200
+        assert load_cached_baud(path, '/dev/ttyUSB1', 'xantech8') == 57600
+        assert load_cached_baud(path, '/dev/ttyUSB0', 'xantech8') is None
+        assert (
+            load_cached_baud(tmp_path / 'missing.json', '/dev/ttyUSB0', 'monoprice6')
+            is None
+        )
+
+
+class TestNegotiateBaud:
+    """Tests for probing the amp's baud rate."""
+
+    def test_settles_on_answering_rate_and_caches(self, tmp_path: Path) -> None:
+        """Verify faster rates are tried first and the answer is cached."""
+        requests: list[int] = []
+        port = create_baud_port(termios.B19200, requests)
+        cache = tmp_path / 'baud.json'
+
+        assert (
+            negotiate_baud('monoprice6', port, cache_path=cache, probe_timeout=0.1)
+            == 19200
+        )
+        assert requests[0] == termios.B115200
+        assert requests[-1] == termios.B19200
+        assert load_cached_baud(cache, port, 'monoprice6') == 19200
+
+        probes = len(requests)
+        assert negotiate_baud('monoprice6', port, cache_path=cache) == 19200
+        assert len(requests) == probes
+
+    def test_auto_baud_controller(self, tmp_path: Path) -> None:
+        """Verify auto_baud opens the controller at the negotiated rate."""
+        requests: list[int] = []
+        port = create_baud_port(termios.B38400, requests)
+
+        amp = get_amp_controller(
+            'monoprice6', port, auto_baud=True, baud_cache_path=tmp_path / 'baud.json'
+        )
+        assert amp is not None
+        assert amp.get_volume(11) == 13
+        assert requests[-1] == termios.B38400
+        amp.close()
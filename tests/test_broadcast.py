@@ -0,0 +1,162 @@
+"""Tests for setting one value across many zones."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from pyxantech import async_get_amp_controller, get_amp_controller
+
+from . import create_responder_port
+
+ZPR68_ZONES = list(range(1, 16))
+
+STATUS_REQUEST = b'?11#\r'
+# zone 11: power on, source 4, unmuted, volume 13
+STATUS_REPLY = b'\r\n#>110104000131112100601\r\n#'
+
+
+class TestBroadcastSetters:
+    """Tests for the set_*_many() methods."""
+
+    async def test_uses_broadcast_when_covering_every_zone(self) -> None:
+        """Verify one all-zones command replaces the per-zone commands."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes:
+            requests.append(request)
+            return b'OK\n\r'
+
+        port = create_responder_port(handler, terminator=b'+')
+        amp = await async_get_amp_controller(
+            'zpr68-10', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        await amp.set_volume_many(reversed(ZPR68_ZONES), 20)
+        await amp.set_mute_many(ZPR68_ZONES, True)
+        await amp.set_source_many(ZPR68_ZONES, 3)
+
+        assert requests == [b'!00V20+', b'!00QY+', b'!00I3+']
+        await amp.close()
+
+    async def test_falls_back_to_per_zone_commands(self) -> None:
+        """Verify a subset of zones, or a field without broadcast, goes per zone."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes:
+            requests.append(request)
+            return b'OK\n\r'
+
+        port = create_responder_port(handler, terminator=b'+')
+        amp = await async_get_amp_controller(
+            'zpr68-10', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        await amp.set_volume_many([1, 2], 20)
+        assert requests == [b'!01V20+', b'!02V20+']
+
+        requests.clear()
+        await amp.set_power_many(ZPR68_ZONES, True)  # no all-zones-on command
+        assert requests == [f'!{zone:02}CY+'.encode() for zone in ZPR68_ZONES]
+        await amp.close()
+
+    async def test_combines_per_zone_commands_into_one_line(self) -> None:
+        """Verify protocols with a command separator get a single write."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes:
+            requests.append(request)
+            return STATUS_REPLY if request == STATUS_REQUEST else b'\r\n#'
+
+        port = create_responder_port(handler)
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+        amp.enable_idempotent_writes()
+
+        await amp.zone_status(11)
+        await amp.set_mute_many([11, 12, 11], True)
+
+        assert requests == [STATUS_REQUEST, b'<11MU01#<12MU01#\r']
+        status = amp.cached_status(11)
+        assert status is not None
+        assert status['mute'] is True
+        await amp.close()
+
+    async def test_rejects_invalid_zone_before_sending(self) -> None:
+        """Verify nothing is sent when any zone is invalid."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes:
+            requests.append(request)
+            return b'OK\n\r'
+
+        port = create_responder_port(handler, terminator=b'+')
+        amp = await async_get_amp_controller(
+            'zpr68-10', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        with pytest.raises(ValueError):
+            await amp.set_volume_many([1, 99], 20)
+        assert requests == []
+        await amp.close()
+
+    def test_sync_broadcast_power_off(self) -> None:
+        """Verify the sync controller sends the all-zones-off command."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes:
+            requests.append(request)
+            return request + b'\r'
+
+        port = create_responder_port(handler, terminator=b'+')
+        amp = get_amp_controller('xantech8', port)
+        assert amp is not None
+
+        amp.set_power_many([*range(1, 9), *range(21, 29)], False)
+
+        assert requests == [b'!AO+']
+
+    def test_no_broadcast_when_a_chassis_is_not_covered(self) -> None:
+        """Verify zones of one chassis of several go per zone."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes:
+            requests.append(request)
+            return request + b'\r'
+
+        port = create_responder_port(handler, terminator=b'+')
+        amp = get_amp_controller('xantech8', port)
+        assert amp is not None
+
+        amp.set_power_many([1, 2, 3, 4, 5, 6, 7, 8], False)
+
+        assert b'!AO+' not in requests
+
+    async def test_broadcast_clamps_and_validates_value(self) -> None:
+        """Verify broadcast values are clamped, and invalid sources rejected."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes:
+            requests.append(request)
+            return b'OK\n\r'
+
+        port = create_responder_port(handler, terminator=b'+')
+        amp = await async_get_amp_controller(
+            'zpr68-10', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        await amp.set_volume_many(ZPR68_ZONES, 99)
+        assert requests == [b'!00V40+']
+
+        requests.clear()
+        with pytest.raises(ValueError):
+            await amp.set_source_many(ZPR68_ZONES, 99)
+        assert requests == []
+        await amp.close()
@@ -0,0 +1,218 @@
+"""Tests for the serial port broker and its client controller."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from pathlib import Path
+import stat
+import time
+
+import pytest
+
+from pyxantech import async_get_amp_controller
+from pyxantech.broker import AmpBroker, async_get_broker_controller
+from pyxantech.health import BREAKER_CLOSED, BREAKER_OPEN, LinkStateEvent
+
+from . import create_responder_port
+
+STATUS_REPLY = b'\r\n#>110104000131112100601\r\n#'
+
+
+async def start_broker(
+    tmp_path: Path, requests: list[bytes], delay: float = 0.0
+) -> AmpBroker:
+    """Start a broker for a simulated monoprice6 amp recording every request."""
+
+    def handler(request: bytes) -> bytes | None:
+        requests.append(request)
+        time.sleep(delay)
+        return STATUS_REPLY if request.startswith(b'?') else None
+
+    port = create_responder_port(handler)
+    amp = await async_get_amp_controller('monoprice6', port, asyncio.get_running_loop())
+    assert amp is not None
+    broker = AmpBroker(amp, 'monoprice6', tmp_path / 'amp.sock')
+    await broker.start()
+    return broker
+
+
+class TestBroker:
+    """Tests for clients sharing one amp through the broker."""
+
+    async def test_client_reads_status(self, tmp_path: Path) -> None:
+        """Verify a client controller reads zone status through the broker."""
+        broker = await start_broker(tmp_path, [])
+        client = await async_get_broker_controller(broker.socket_path)
+
+        status = await client.zone_status(11)
+
+        assert status is not None
+        assert status['volume'] == 13
+        assert client.cached_status(11) == status
+        await client.close()
+        await broker.close()
+
+    async def test_client_is_a_drop_in_controller(self, tmp_path: Path) -> None:
+        """Verify the chassis layout and single-attribute reads on a client."""
+        broker = await start_broker(tmp_path, [])
+        client = await async_get_broker_controller(broker.socket_path)
+
+        assert client.present_zones[:6] == (11, 12, 13, 14, 15, 16)
+        assert await client.get_volume(11) == 13
+        assert await client.get_mute(11) is False
+        assert await client.get_source(11) == 4
+        await client.close()
+        await broker.close()
+
+    async def test_concurrent_reads_are_coalesced(self, tmp_path: Path) -> None:
+        """Verify identical concurrent reads from many clients cost one request."""
+        requests: list[bytes] = []
+        broker = await start_broker(tmp_path, requests)
+        clients = [
+            await async_get_broker_controller(broker.socket_path) for _ in range(3)
+        ]
+
+        results = await asyncio.gather(*(client.zone_status(11) for client in clients))
+
+        assert all(result == results[0] for result in results)
+        assert requests == [b'?11#\r']
+        for client in clients:
+            await client.close()
+        await broker.close()
+
+    async def test_state_cache_is_shared(self, tmp_path: Path) -> None:
+        """Verify other clients see status read by one client, and max_age uses it."""
+        requests: list[bytes] = []
+        broker = await start_broker(tmp_path, requests)
+        reader = await async_get_broker_controller(broker.socket_path)
+        watcher = await async_get_broker_controller(broker.socket_path)
+        events = watcher.subscribe_changes()
+
+        await reader.zone_status(11)
+        event = await asyncio.wait_for(events.get(), 1.0)
+
+        assert event.zone == 11
+        assert watcher.cached_status(11) == reader.cached_status(11)
+        assert await watcher.zone_status(11, max_age=60.0) == reader.cached_status(11)
+        assert len(requests) == 1
+        await reader.close()
+        await watcher.close()
+        await broker.close()
+
+    async def test_unknown_operation_raises(self, tmp_path: Path) -> None:
+        """Verify operations outside the allow list are refused."""
+        broker = await start_broker(tmp_path, [])
+        client = await async_get_broker_controller(broker.socket_path)
+
+        with pytest.raises(ValueError, match='Unsupported broker operation'):
+            await client.call('close')  # type: ignore[attr-defined]
+        await client.close()
+        await broker.close()
+
+    async def test_connect_without_broker_raises(self, tmp_path: Path) -> None:
+        """Verify a missing socket is reported as ConnectionError."""
+        with pytest.raises(ConnectionError):
+            await async_get_broker_controller(tmp_path / 'missing.sock')
+
+    async def test_coalesced_callers_keep_their_own_deadline(
+        self, tmp_path: Path
+    ) -> None:
+        """Verify a joiner's short timeout does not fail the first caller."""
+        requests: list[bytes] = []
+        broker = await start_broker(tmp_path, requests, delay=0.3)
+        patient = await async_get_broker_controller(broker.socket_path)
+        hasty = await async_get_broker_controller(broker.socket_path)
+
+        slow = asyncio.ensure_future(patient.zone_status(11, timeout=5.0))
+        await asyncio.sleep(0.05)
+        with pytest.raises(TimeoutError):
+            await hasty.zone_status(11, timeout=0.1)
+
+        status = await slow
+        assert status is not None
+        assert status['volume'] == 13
+        assert requests == [b'?11#\r']
+        await patient.close()
+        await hasty.close()
+        await broker.close()
+
+    async def test_socket_is_not_world_accessible(self, tmp_path: Path) -> None:
+        """Verify the socket is created with mode 0660."""
+        broker = await start_broker(tmp_path, [])
+
+        mode = stat.S_IMODE(os.stat(broker.socket_path).st_mode)
+
+        assert mode & 0o007 == 0
+        await broker.close()
+
+    async def test_link_state_is_relayed(self, tmp_path: Path) -> None:
+        """Verify clients follow the broker's circuit breaker state."""
+        online = False
+
+        def handler(request: bytes) -> bytes | None:
+            return STATUS_REPLY if online else None
+
+        amp = await async_get_amp_controller(
+            'monoprice6',
+            create_responder_port(handler),
+            asyncio.get_running_loop(),
+            failure_threshold=1,
+            reset_timeout=0.1,
+        )
+        assert amp is not None
+        broker = AmpBroker(amp, 'monoprice6', tmp_path / 'amp.sock')
+        await broker.start()
+        client = await async_get_broker_controller(broker.socket_path)
+        events: list[LinkStateEvent] = []
+        client.add_link_listener(events.append)
+
+        with pytest.raises(TimeoutError):
+            await client.zone_status(11)
+        await asyncio.sleep(0.05)
+
+        assert client.link_state == BREAKER_OPEN
+        late = await async_get_broker_controller(broker.socket_path)
+        assert late.link_state == BREAKER_OPEN
+
+        online = True
+        await asyncio.sleep(0.15)
+        assert await client.zone_status(11) is not None
+        await asyncio.sleep(0.05)
+
+        assert client.link_state == BREAKER_CLOSED
+        assert events[0].new == BREAKER_OPEN
+        assert events[-1].new == BREAKER_CLOSED
+        await late.close()
+        await client.close()
+        await broker.close()
+
+
+class TestBrokerClientTimeouts:
+    """Tests for client calls to a broker that stops answering."""
+
+    async def test_call_times_out_and_cancels(self, tmp_path: Path) -> None:
+        """Verify a wedged broker cannot hang a client, and is told to cancel."""
+        received: list[dict[str, object]] = []
+
+        async def wedged(
+            reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+        ) -> None:
+            writer.write(b'{"event":"hello","version":1,"amp_type":"monoprice6"}\n')
+            while line := await reader.readline():
+                received.append(json.loads(line))
+
+        path = tmp_path / 'wedged.sock'
+        server = await asyncio.start_unix_server(wedged, path=str(path))
+        client = await async_get_broker_controller(path, call_timeout=0.2)
+
+        with pytest.raises(TimeoutError):
+            await client.set_volume(11, 20)
+        await asyncio.sleep(0.05)
+
+        assert received[0]['op'] == 'set_volume'
+        assert received[1] == {'cancel': received[0]['id']}
+        await client.close()
+        server.close()
+        await server.wait_closed()
@@ -0,0 +1,98 @@
+"""Tests for serial traffic capture and replay."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from pyxantech import async_get_amp_controller
+from pyxantech.capture import (
+    DIRECTION_READ,
+    DIRECTION_WRITE,
+    CaptureWriter,
+    parse_replay_url,
+    read_capture,
+)
+
+from . import create_dummy_port
+
+STATUS_REQUEST = b'?11#\r'
+STATUS_REPLY = b'\r\n#>110104000131112100601\r\n#'
+
+
+class TestCaptureFormat:
+    """Tests for the binary capture file format."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Verify records are read back in order with monotonic timestamps."""
+        path = tmp_path / 'site.cap'
+        writer = CaptureWriter(path)
+        writer.write(b'?11#\r')
+        writer.read(b'#>11')
+        writer.read(b'0101\r')
+        writer.close()
+
+        records = list(read_capture(path))
+
+        assert [(r.direction, r.data) for r in records] == [
+            (DIRECTION_WRITE, b'?11#\r'),
+            (DIRECTION_READ, b'#>11'),
+            (DIRECTION_READ, b'0101\r'),
+        ]
+        assert records[0].timestamp <= records[1].timestamp <= records[2].timestamp
+
+    def test_append_only(self, tmp_path: Path) -> None:
+        """Verify reopening a capture appends instead of truncating."""
+        path = tmp_path / 'site.cap'
+        for chunk in (b'a', b'b'):
+            writer = CaptureWriter(path)
+            writer.write(chunk)
+            writer.close()
+
+        assert [r.data for r in read_capture(path)] == [b'a', b'b']
+
+    def test_rejects_foreign_file(self, tmp_path: Path) -> None:
+        """Verify non-capture files are rejected."""
+        path = tmp_path / 'other.bin'
+        path.write_bytes(b'garbage')
+
+        with pytest.raises(ValueError, match='Not a pyxantech capture'):
+            list(read_capture(path))
+
+    def test_parse_replay_url(self) -> None:
+        """Verify replay URLs yield path and speed."""
+        assert parse_replay_url('replay:///tmp/site.cap?speed=10') == (
+            Path('/tmp/site.cap'),
+            10.0,
+        )
+        assert parse_replay_url('replay:///tmp/site.cap')[1] == 1.0
+
+
+class TestCaptureAndReplay:
+    """Tests for capturing live traffic and replaying it into a controller."""
+
+    async def test_replay_reproduces_status(self, tmp_path: Path) -> None:
+        """Verify a replayed capture produces the same parsed status."""
+        path = tmp_path / 'site.cap'
+        loop = asyncio.get_running_loop()
+
+        port = create_dummy_port({STATUS_REQUEST: STATUS_REPLY})
+        amp = await async_get_amp_controller(
+            'monoprice6', port, loop, capture_path=path
+        )
+        assert amp is not None
+        live = await amp.zone_status(11)
+        amp._protocol._transport.close()
+        await asyncio.sleep(0.05)
+
+        directions = [r.direction for r in read_capture(path)]
+        assert directions[0] == DIRECTION_WRITE
+        assert DIRECTION_READ in directions
+
+        replay = await async_get_amp_controller(
+            'monoprice6', f'replay://{path}?speed=0', loop
+        )
+        assert replay is not None
+        assert await replay.zone_status(11) == live
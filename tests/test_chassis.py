@@ -0,0 +1,149 @@
+"""Tests for multi-chassis zone addressing."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from pyxantech import async_get_amp_controller, get_amp_controller
+from pyxantech.chassis import ChassisLayout, ZoneAddress, get_chassis_layout
+
+from . import create_responder_port
+
+
+def unit_reply(unit: int) -> bytes:
+    """Unit query reply for a chassis whose zones all have volume 13."""
+    lines = b''.join(
+        b'\r\n#>%d%d0104000131112100601' % (unit, zone) for zone in range(1, 7)
+    )
+    return lines + b'\r\n#'
+
+
+class TestChassisLayout:
+    """Tests for zone id decoding."""
+
+    def test_two_digit_zone_ids(self) -> None:
+        """Verify monoprice zone ids decode into unit and zone."""
+        layout = get_chassis_layout('monoprice6')
+
+        assert layout.units == (1, 2, 3)
+        assert layout.address(25) == ZoneAddress(2, 5)
+        assert layout.zones_of(3) == (31, 32, 33, 34, 35, 36)
+        assert layout.group_by_unit([11, 21, 12]) == {1: [11, 12], 2: [21]}
+
+    def test_plain_zone_numbers_are_one_chassis(self) -> None:
+        """Verify single-digit numbering is treated as a single unit."""
+        layout = ChassisLayout(range(1, 16))
+
+        assert layout.units == (1,)
+        assert layout.address(8) == ZoneAddress(1, 8)
+
+    def test_alternative_zones_add_expansion_units(self) -> None:
+        """Verify xantech8 expansion ids are capped by max_expansion_amps."""
+        layout = get_chassis_layout('xantech8')
+
+        assert layout.units == (1, 2)
+        assert layout.zones_of(2) == (21, 22, 23, 24, 25, 26, 27, 28)
+        assert layout.address(24) == ZoneAddress(2, 4)
+        # unit 1 two-digit ids alias the plain zones without being listed twice
+        assert 11 in layout
+        assert layout.unit_of(11) == 1
+        assert 11 not in layout.zones
+        assert 31 not in layout
+
+    def test_invalid_zone(self) -> None:
+        """Verify unknown zones raise ValueError."""
+        with pytest.raises(ValueError):
+            get_chassis_layout('monoprice6').address(47)
+
+
+class TestChassisProbe:
+    """Tests for probing present chassis and skipping absent ones."""
+
+    async def test_absent_chassis_are_skipped(self) -> None:
+        """Verify bulk reads query only chassis that answered the probe."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes | None:
+            requests.append(request)
+            if request == b'?10#\r':
+                return unit_reply(1)
+            if request.startswith(b'?1'):
+                return b'\r\n#>%s0104000131112100601\r\n#' % request[1:3]
+            return None  # chassis 2 and 3 are not connected
+
+        port = create_responder_port(handler)
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        assert await amp.probe_chassis(timeout=0.1) == (1,)
+        assert amp.present_zones == (11, 12, 13, 14, 15, 16)
+
+        requests.clear()
+        statuses = await amp.zone_statuses()
+
+        assert sorted(statuses) == [11, 12, 13, 14, 15, 16]
+        assert statuses[14]['volume'] == 13
+        assert requests == [b'?10#\r']
+        assert amp.cached_status(16) == statuses[16]
+        await amp.close()
+
+    async def test_single_zone_uses_zone_query(self) -> None:
+        """Verify reading one zone of a chassis does not use the unit query."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes | None:
+            requests.append(request)
+            return b'\r\n#>%s0104000131112100601\r\n#' % request[1:3]
+
+        port = create_responder_port(handler)
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        assert list(await amp.zone_statuses([21])) == [21]
+        assert requests == [b'?21#\r']
+        await amp.close()
+
+    async def test_unit_query_skips_echo(self) -> None:
+        """Verify an echoed unit query is not counted as a zone line."""
+
+        def handler(request: bytes) -> bytes | None:
+            return request + unit_reply(1) if request == b'?10#\r' else None
+
+        port = create_responder_port(handler)
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        statuses = await amp.zone_statuses([11, 12, 13, 14, 15, 16])
+
+        assert sorted(statuses) == [11, 12, 13, 14, 15, 16]
+        await amp.close()
+
+    def test_sync_controller(self) -> None:
+        """Verify the sync controller probes and skips absent chassis too."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes | None:
+            requests.append(request)
+            if request.startswith(b'?1'):
+                return b'#>%s0104000131112100601\r' % request[1:3]
+            return None
+
+        amp = get_amp_controller('monoprice6', create_responder_port(handler))
+        assert amp is not None
+
+        assert amp.probe_chassis(timeout=0.1) == (1,)
+
+        requests.clear()
+        statuses = amp.zone_statuses([11, 12, 21])
+
+        assert sorted(statuses) == [11, 12]
+        assert requests == [b'?11#\r', b'?12#\r']
+        amp.close()
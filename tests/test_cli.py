@@ -0,0 +1,72 @@
+"""Tests for the pyxantech command-line batch runner."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from pyxantech.cli import ScriptCommand, main, parse_command, parse_script
+
+from . import create_dummy_port
+
+ZONES = [11, 12, 13]
+
+
+class TestParseCommand:
+    """Tests for script line parsing."""
+
+    def test_set_volume(self) -> None:
+        """Verify attribute set commands."""
+        assert parse_command('11 volume 20', ZONES) == [
+            ScriptCommand('11 volume 20', 'set', 11, 'volume', 20)
+        ]
+
+    def test_power_on_off(self) -> None:
+        """Verify boolean attributes accept on/off."""
+        assert parse_command('12 power on', ZONES)[0].value is True
+        assert parse_command('12 mute off', ZONES)[0].value is False
+
+    def test_status_wildcard_expands(self) -> None:
+        """Verify 'status *' expands to every zone."""
+        commands = parse_command('status *', ZONES)
+
+        assert [c.zone for c in commands] == ZONES
+        assert {c.action for c in commands} == {'status'}
+
+    def test_zone_status_forms(self) -> None:
+        """Verify both '<zone> status' and 'status <zone>' are accepted."""
+        assert parse_command('11 status', ZONES)[0].zone == 11
+        assert parse_command('status 11', ZONES)[0].zone == 11
+
+    def test_all_off(self) -> None:
+        """Verify amp-wide all off."""
+        assert parse_command('all off', ZONES)[0].action == 'all_off'
+
+    def test_comments_and_blank_lines(self) -> None:
+        """Verify comments and blank lines are skipped."""
+        assert parse_script(['# setup', '', '11 volume 5  # quiet'], ZONES) == [
+            ScriptCommand('11 volume 5  # quiet', 'set', 11, 'volume', 5)
+        ]
+
+    @pytest.mark.parametrize('line', ['11 volume', 'eleven power on', '11 power maybe'])
+    def test_invalid_lines(self, line: str) -> None:
+        """Verify malformed lines raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_command(line, ZONES)
+
+
+class TestMain:
+    """Tests for the console entry point."""
+
+    def test_status_json_output(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Verify results are printed as JSON lines with timing."""
+        port = create_dummy_port({b'?11#\r': b'\r\n#>110104000131112100601\r\n#'})
+
+        exit_code = main(['monoprice6', port, '-c', 'status 11', '--timing'])
+
+        result = json.loads(capsys.readouterr().out.strip())
+        assert exit_code == 0
+        assert result['ok'] is True
+        assert result['result']['volume'] == 13
+        assert result['elapsed'] >= 0
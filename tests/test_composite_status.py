@@ -0,0 +1,162 @@
+"""Tests for zone status assembled from per-attribute queries (ZPR68)."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from typing import TYPE_CHECKING
+
+from pyxantech import (
+    async_get_amp_controller,
+    get_amp_controller,
+    parse_zone_status,
+    zone_status_queries,
+)
+
+from . import create_responder_port
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+ATTRIBUTE_VALUES = {
+    b'C': b'PY',
+    b'V': b'V20',
+    b'I': b'I3',
+    b'M': b'MN',
+    b'T': b'T06',
+    b'B': b'B07',
+}
+
+
+def zpr68_handler(requests: list[bytes]) -> Callable[[bytes], bytes | None]:
+    """Answer ZPR68 attribute queries; every zone reports the same state."""
+
+    def handler(request: bytes) -> bytes | None:
+        requests.append(request)
+        match = re.fullmatch(rb'\?(\d\d)([CVIMTB])=', request)
+        if match is None:
+            return None
+        return b'?%s%s+\n\r' % (match[1], ATTRIBUTE_VALUES[match[2]])
+
+    return handler
+
+
+class TestCompositeStatus:
+    """Tests for composite zone status reads."""
+
+    async def test_zone_status_from_attribute_queries(self) -> None:
+        """Verify zone_status sends zone_status_commands and assembles them."""
+        requests: list[bytes] = []
+        port = create_responder_port(zpr68_handler(requests), b'=')
+        amp = await async_get_amp_controller(
+            'zpr68-10', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+        amp.enable_composite_status()
+
+        status = await amp.zone_status(2)
+
+        assert requests == [b'?02C=', b'?02V=', b'?02I=', b'?02M=', b'?02T=', b'?02B=']
+        assert status is not None
+        assert status['zone'] == 2
+        assert status['power'] is True
+        assert status['mute'] is False
+        assert (status['volume'], status['source']) == (20, 3)
+        assert (status['treble'], status['bass']) == (6, 7)
+        # zpr68 has no balance query: absent rather than reported as 0
+        assert 'balance' not in status
+        assert amp.cached_status(2) == amp.cached_status(2) | status
+        await amp.close()
+
+    async def test_zone_statuses_batch_across_zones(self) -> None:
+        """Verify bulk reads send every zone's queries in one batch."""
+        requests: list[bytes] = []
+        port = create_responder_port(zpr68_handler(requests), b'=')
+        amp = await async_get_amp_controller(
+            'zpr68-10', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+        amp.enable_composite_status()
+
+        statuses = await amp.zone_statuses([1, 3])
+
+        assert sorted(statuses) == [1, 3]
+        assert [request[1:3] for request in requests] == [b'01'] * 6 + [b'03'] * 6
+        await amp.close()
+
+    def test_sync_zone_status(self) -> None:
+        """Verify the sync controller assembles the same status."""
+        requests: list[bytes] = []
+        port = create_responder_port(zpr68_handler(requests), b'=')
+        amp = get_amp_controller('zpr68-10', port)
+        assert amp is not None
+        amp.enable_composite_status()
+
+        status = amp.zone_status(1)
+
+        assert status is not None
+        assert status['volume'] == 20
+        assert len(requests) == 6
+        amp.close()
+
+    async def test_status_dump_is_default(self) -> None:
+        """Verify zone_status uses the single status query until opted in."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes | None:
+            requests.append(request)
+            return b'\a02 03 00 20 00C 00C 00 06 00 07 1 0 38 \n\r'
+
+        port = create_responder_port(handler, b'Z02')
+        amp = await async_get_amp_controller(
+            'zpr68-10', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        status = await amp.zone_status(2)
+
+        assert requests == [b'Z02']
+        assert status is not None
+        assert status['volume'] == 20
+        await amp.close()
+
+    async def test_partial_status_when_a_reply_does_not_parse(self) -> None:
+        """Verify one unparsable attribute reply leaves that field out."""
+        requests: list[bytes] = []
+        answer = zpr68_handler(requests)
+
+        def handler(request: bytes) -> bytes | None:
+            if request.endswith(b'T='):
+                requests.append(request)
+                return b'garbage\n\r'
+            return answer(request)
+
+        port = create_responder_port(handler, b'=')
+        amp = await async_get_amp_controller(
+            'zpr68-10', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+        amp.enable_composite_status()
+
+        status = await amp.zone_status(2)
+
+        assert status is not None
+        assert status['volume'] == 20
+        assert 'treble' not in status
+        await amp.close()
+
+
+class TestZoneStatusHelpers:
+    """Tests for the public zone status query helpers."""
+
+    def test_queries_and_parsing(self) -> None:
+        """Verify the status dump is the default and composite is opt-in."""
+        assert zone_status_queries('zpr68-10', 2) == ([b'Z02'], 2)
+        queries, skip = zone_status_queries('zpr68-10', 2, composite=True)
+        assert (len(queries), skip) == (6, 0)
+
+        replies = ['?02PY+', '?02V20+', '?02I3+', '?02MN+', '?02T06+', '?02B07+']
+        status = parse_zone_status('zpr68-10', 2, replies)
+        assert status is not None
+        assert (status['power'], status['volume']) == (True, 20)
+        assert parse_zone_status('monoprice6', 11, ['garbage']) is None
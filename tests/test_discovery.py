@@ -0,0 +1,56 @@
+"""Tests for concurrent amp discovery."""
+
+from __future__ import annotations
+
+import time
+
+from pyxantech.discovery import DiscoveredAmp, discover_amps
+
+from . import create_responder_port
+
+MONOPRICE_REPLY = b'\r\n#>110104000131112100601\r\n#'
+
+
+class TestDiscoverAmps:
+    """Tests for discover_amps()."""
+
+    async def test_identifies_each_port(self) -> None:
+        """Verify every port is matched to the series that answers on it."""
+
+        def monoprice(request: bytes) -> bytes | None:
+            # only the main unit is chained
+            return MONOPRICE_REPLY if request.endswith(b'?11#\r') else None
+
+        def xantech(request: bytes) -> bytes | None:
+            if request.endswith(b'?1PR+'):
+                return b'?1PR1+\r'
+            if request.endswith(b'?1ZD+'):
+                return b'#1ZS PR1 SS2 VO10 MU0 TR7 BS7 BA32 LS0 PS0+\r'
+            return None
+
+        monoprice_port = create_responder_port(monoprice)
+        xantech_port = create_responder_port(xantech, terminator=b'+')
+
+        amps = await discover_amps(
+            [xantech_port, '/dev/pyxantech-missing', monoprice_port],
+            amp_types=['xantech8', 'monoprice6'],
+            probe_timeout=0.1,
+        )
+
+        assert amps == [
+            DiscoveredAmp(xantech_port, 'xantech8', 9600, (1,)),
+            DiscoveredAmp(monoprice_port, 'monoprice6', 9600, (1,)),
+        ]
+
+    async def test_ports_are_scanned_concurrently(self) -> None:
+        """Verify scanning several silent ports takes about as long as one."""
+        start = time.monotonic()
+        await discover_amps(
+            [create_responder_port(lambda request: None)], probe_timeout=0.1
+        )
+        single = time.monotonic() - start
+
+        ports = [create_responder_port(lambda request: None) for _ in range(6)]
+        start = time.monotonic()
+        assert await discover_amps(ports, probe_timeout=0.1) == []
+        assert time.monotonic() - start < single * 2.5
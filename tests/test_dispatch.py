@@ -0,0 +1,99 @@
+"""Tests for the compiled protocol dispatch table."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from pyxantech import async_get_amp_controller
+from pyxantech.dispatch import FLAT_FEATURE, get_dispatch_table, lookup
+
+from . import create_responder_port
+
+
+class TestDispatchTable:
+    """Tests for compiling protocol YAML into commands."""
+
+    def test_api_v2_features_compiled(self) -> None:
+        """Verify every api_v2 feature is compiled, including late siblings."""
+        table = get_dispatch_table('xantech')
+
+        assert ('treble', 'up') in table
+        assert ('activity_updates', 'on') in table
+        assert table['volume', 'up'].encode(zone=1) == b'!1VI+'
+        assert table['volume', 'set'].encode(zone=2, volume=7) == b'!2VO07+'
+
+    def test_aliases_share_command(self) -> None:
+        """Verify action aliases resolve to the same compiled command."""
+        table = get_dispatch_table('xantech')
+
+        assert table['bass', '+'] is table['bass', 'up']
+
+    def test_variables_validated(self) -> None:
+        """Verify api_vars limits and missing variables raise ValueError."""
+        command = lookup('xantech', 'volume', 'set')
+
+        with pytest.raises(ValueError):
+            command.encode(zone=1, volume=39)
+        with pytest.raises(ValueError):
+            command.encode(zone=9, volume=10)
+        with pytest.raises(ValueError):
+            command.encode(zone=1)
+        with pytest.raises(ValueError):
+            lookup('xantech', 'volume', 'sideways')
+
+    def test_decode_response(self) -> None:
+        """Verify replies are matched against the compiled response regex."""
+        command = lookup('xantech', 'volume', 'status')
+
+        assert command.decode('?1VO20+') == {'zone': '1', 'volume': '20'}
+        assert command.decode('garbage') is None
+
+    def test_flat_commands_compiled(self) -> None:
+        """Verify flat protocol commands are reachable under 'command'."""
+        command = lookup('monoprice', FLAT_FEATURE, 'set_volume')
+
+        assert command.encode(zone=11, volume=20) == b'<11VO20#\r'
+
+    def test_single_digit_values_zero_padded(self) -> None:
+        """Verify numeric format specs pad on the left without api_vars."""
+        volume = lookup('monoprice', FLAT_FEATURE, 'set_volume')
+        source = lookup('monoprice', FLAT_FEATURE, 'set_source')
+        power = lookup('zpr68', FLAT_FEATURE, 'power_on')
+
+        assert volume.encode(zone=11, volume=5) == b'<11VO05#\r'
+        assert volume.encode(zone=11, volume='5') == b'<11VO05#\r'
+        assert source.encode(zone=11, source=3) == b'<11CH03#\r'
+        assert power.encode(zone=2) == b'!02CY+'
+        with pytest.raises(ValueError):
+            volume.encode(zone=11, volume='loud')
+
+
+class TestExecute:
+    """Tests for the generic controller execute() fast path."""
+
+    async def test_async_execute(self) -> None:
+        """Verify execute sends the encoded command and tracks zone status."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes | None:
+            requests.append(request)
+            if request.startswith(b'?'):
+                return b'\r\n#>%s0104000131112100601\r\n#' % request[1:3]
+            return b'\r\n#'
+
+        port = create_responder_port(handler)
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        assert await amp.execute(FLAT_FEATURE, 'set_volume', zone=12, volume=20) is None
+        status = await amp.execute(FLAT_FEATURE, 'zone_status', zone=12)
+
+        assert status is not None
+        assert status['volume'] == 13
+        assert amp.cached_status(12) == status
+        assert requests == [b'<12VO20#\r', b'?12#\r']
+        await amp.close()
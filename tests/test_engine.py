@@ -0,0 +1,88 @@
+"""Tests for the shared async engine and engine-backed sync controller."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import pytest
+
+from pyxantech import get_amp_controller, get_engine
+from pyxantech.engine import ENGINE_THREAD_NAME, AsyncEngine
+
+from . import create_dummy_port, create_responder_port
+
+
+class TestAsyncEngine:
+    """Tests for the background event loop thread."""
+
+    def test_singleton_engine(self) -> None:
+        """Verify the process-wide engine is shared."""
+        assert get_engine() is get_engine()
+
+    def test_run_returns_result_from_many_threads(self) -> None:
+        """Verify coroutines submitted from many threads run on one loop."""
+        engine = AsyncEngine()
+
+        async def current_thread_name(value: int) -> tuple[int, str]:
+            await asyncio.sleep(0)
+            return value, threading.current_thread().name
+
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(
+                    pool.map(lambda v: engine.run(current_thread_name(v)), range(32))
+                )
+        finally:
+            engine.stop()
+
+        assert [value for value, _ in results] == list(range(32))
+        assert {name for _, name in results} == {ENGINE_THREAD_NAME}
+
+    def test_run_from_engine_thread_raises(self) -> None:
+        """Verify re-entrant blocking calls are rejected instead of deadlocking."""
+        engine = AsyncEngine()
+
+        async def nested() -> None:
+            engine.run(asyncio.sleep(0))
+
+        try:
+            with pytest.raises(RuntimeError):
+                engine.run(nested())
+        finally:
+            engine.stop()
+
+
+class TestEngineController:
+    """Tests for get_amp_controller(use_engine=True)."""
+
+    def test_zone_status_through_engine(self) -> None:
+        """Verify blocking wrappers return parsed status from the async engine."""
+        port = create_dummy_port({b'?11#\r': b'\r\n#>110104000131112100601\r\n#'})
+        amp = get_amp_controller('monoprice6', port, use_engine=True)
+
+        assert amp is not None
+        status = amp.zone_status(11)
+
+        assert status is not None
+        assert status['zone'] == 11
+        assert status['power'] is True
+        assert status['volume'] == 13
+
+    def test_power_and_chassis_probe_through_engine(self) -> None:
+        """Verify get_power and probe_chassis have blocking wrappers."""
+
+        def handler(request: bytes) -> bytes | None:
+            if request.startswith(b'?1'):
+                return b'\r\n#>%s0104000131112100601\r\n#' % request[1:3]
+            return None
+
+        amp = get_amp_controller(
+            'monoprice6', create_responder_port(handler), use_engine=True
+        )
+
+        assert amp is not None
+        assert amp.get_power(11) is True
+        assert amp.probe_chassis(timeout=0.1) == (1,)
+        amp.close()
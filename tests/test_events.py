@@ -0,0 +1,86 @@
+"""Tests for zone state tracking and change events."""
+
+from __future__ import annotations
+
+import asyncio
+
+from pyxantech import ZoneChangeEvent, ZoneStatus, async_get_amp_controller
+from pyxantech.events import ZoneStateTracker
+
+from . import create_dummy_port
+
+
+class TestZoneStateTracker:
+    """Tests for ZoneStateTracker."""
+
+    def test_first_status_emits_all_fields(self) -> None:
+        """Verify a newly seen zone reports every attribute with old=None."""
+        tracker = ZoneStateTracker()
+
+        events = tracker.update(ZoneStatus(zone=11, volume=10))
+
+        assert ZoneChangeEvent(11, 'volume', None, 10) in events
+        assert all(event.old is None for event in events)
+        assert 'zone' not in {event.field for event in events}
+
+    def test_unchanged_status_emits_nothing(self) -> None:
+        """Verify repeated identical reads produce no events."""
+        tracker = ZoneStateTracker()
+        tracker.update(ZoneStatus(zone=11, volume=10))
+
+        assert tracker.update(ZoneStatus(zone=11, volume=10)) == []
+
+    def test_changed_fields_only(self) -> None:
+        """Verify only attributes that changed are reported."""
+        tracker = ZoneStateTracker()
+        tracker.update(ZoneStatus(zone=11, volume=10, source=1))
+
+        events = tracker.update(ZoneStatus(zone=11, volume=12, source=1))
+
+        assert events == [ZoneChangeEvent(11, 'volume', 10, 12)]
+
+    def test_listener_and_removal(self) -> None:
+        """Verify listeners receive events until removed."""
+        tracker = ZoneStateTracker()
+        received: list[ZoneChangeEvent] = []
+        remove = tracker.add_listener(received.append)
+
+        tracker.update(ZoneStatus(zone=11, power=False))
+        tracker.update(ZoneStatus(zone=11, power=True))
+        count = len(received)
+        remove()
+        tracker.update(ZoneStatus(zone=11, power=False))
+
+        assert received[-1] == ZoneChangeEvent(11, 'power', False, True)
+        assert len(received) == count
+
+    async def test_queue_subscription(self) -> None:
+        """Verify events are delivered to subscribed asyncio queues."""
+        tracker = ZoneStateTracker()
+        tracker.update(ZoneStatus(zone=11, mute=False))
+        queue = tracker.subscribe()
+
+        tracker.update(ZoneStatus(zone=11, mute=True))
+
+        assert queue.get_nowait() == ZoneChangeEvent(11, 'mute', False, True)
+        assert queue.empty()
+
+
+class TestControllerChangeEvents:
+    """Tests for change events emitted by the async controller."""
+
+    async def test_zone_status_feeds_tracker(self) -> None:
+        """Verify zone_status() updates cached state and emits events."""
+        port = create_dummy_port({b'?11#\r': b'\r\n#>110104000131112100601\r\n#'})
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+        queue = amp.subscribe_changes()
+
+        await amp.zone_status(11)
+
+        assert amp.cached_status(11)['volume'] == 13
+        assert ZoneChangeEvent(11, 'volume', None, 13) in [
+            queue.get_nowait() for _ in range(queue.qsize())
+        ]
@@ -0,0 +1,166 @@
+"""Tests for the HTTP/WebSocket gateway against a simulated amp."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import os
+import struct
+from typing import Any
+
+from pyxantech import async_get_amp_controller
+from pyxantech.gateway import AmpGateway, serve_gateway
+
+from . import create_responder_port
+
+ZONE_11_REPLY = b'\r\n#>110104000131112100601\r\n#'
+UNIT_1_REPLY = (
+    b''.join(b'\r\n#>%d0104000131112100601' % zone for zone in range(11, 17)) + b'\r\n#'
+)
+
+
+async def start_gateway(requests: list[bytes], **kwargs: Any) -> AmpGateway:
+    """Start a gateway on localhost for a simulated monoprice6 amp."""
+
+    def handler(request: bytes) -> bytes | None:
+        requests.append(request)
+        if request.startswith(b'?10'):
+            return UNIT_1_REPLY
+        if request.startswith(b'?'):
+            return ZONE_11_REPLY if request.startswith(b'?11') else None
+        return b'\r\n#'
+
+    port = create_responder_port(handler)
+    amp = await async_get_amp_controller('monoprice6', port, asyncio.get_running_loop())
+    assert amp is not None
+    return await serve_gateway(amp, [11, 12], port=0, **kwargs)
+
+
+async def http(
+    gateway: AmpGateway, method: str, path: str, body: Any = None
+) -> tuple[int, Any]:
+    """Send one HTTP request and return (status, decoded JSON body)."""
+    reader, writer = await asyncio.open_connection('127.0.0.1', gateway.port)
+    data = json.dumps(body).encode() if body is not None else b''
+    writer.write(
+        f'{method} {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n'
+        f'Content-Length: {len(data)}\r\n\r\n'.encode()
+        + data
+    )
+    head = await reader.readuntil(b'\r\n\r\n')
+    status = int(head.split(b' ', 2)[1])
+    payload = json.loads(await reader.read())
+    writer.close()
+    return status, payload
+
+
+class TestGatewayHttp:
+    """Tests for the REST endpoints."""
+
+    async def test_reads_are_served_from_cache(self) -> None:
+        """Verify GETs never touch the serial port."""
+        requests: list[bytes] = []
+        gateway = await start_gateway(requests, poll_interval=60)
+        await asyncio.sleep(0.3)  # first poll
+        polled = len(requests)
+
+        for _ in range(5):
+            status, payload = await http(gateway, 'GET', '/zones/11')
+            assert status == 200
+            assert payload['volume'] == 13
+
+        status, payload = await http(gateway, 'GET', '/zones')
+        assert status == 200
+        assert '11' in payload
+        assert len(requests) == polled
+        await gateway.close()
+
+    async def test_post_forwards_commands(self) -> None:
+        """Verify POSTed attributes are sent to the amp as one update."""
+        requests: list[bytes] = []
+        gateway = await start_gateway(requests)
+
+        status, payload = await http(
+            gateway, 'POST', '/zones/12', {'volume': 20, 'mute': True}
+        )
+
+        assert status == 200
+        assert payload == {'ok': True}
+        assert requests == [b'<12MU01#<12VO20#\r']
+        await gateway.close()
+
+    async def test_post_parses_boolean_strings(self) -> None:
+        """Verify "false"/"off" turn a zone off rather than on."""
+        requests: list[bytes] = []
+        gateway = await start_gateway(requests)
+
+        assert (await http(gateway, 'POST', '/zones/12', {'power': 'false'}))[0] == 200
+        assert (await http(gateway, 'POST', '/zones/12', {'mute': 'off'}))[0] == 200
+        assert (await http(gateway, 'POST', '/zones/12', {'power': 'maybe'}))[0] == 400
+        assert (await http(gateway, 'POST', '/zones/12', {'volume': True}))[0] == 400
+
+        assert requests == [b'<12PR00#\r', b'<12MU00#\r']
+        await gateway.close()
+
+    async def test_invalid_content_length(self) -> None:
+        """Verify a malformed or negative Content-Length gets a 400 response."""
+        gateway = await start_gateway([])
+
+        for length in (b'abc', b'-1'):
+            reader, writer = await asyncio.open_connection('127.0.0.1', gateway.port)
+            writer.write(
+                b'POST /zones/12 HTTP/1.1\r\nContent-Length: ' + length + b'\r\n\r\n'
+            )
+            head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), 1.0)
+            assert head.startswith(b'HTTP/1.1 400')
+            writer.close()
+        await gateway.close()
+
+    async def test_errors(self) -> None:
+        """Verify unknown zones, attributes and paths are rejected."""
+        gateway = await start_gateway([])
+
+        assert (await http(gateway, 'GET', '/zones/11'))[0] == 404
+        assert (await http(gateway, 'GET', '/zones/99'))[0] == 404
+        assert (await http(gateway, 'POST', '/zones/11', {'loudness': 1}))[0] == 400
+        assert (await http(gateway, 'GET', '/nowhere'))[0] == 404
+        await gateway.close()
+
+
+class TestGatewayWebSocket:
+    """Tests for pushed change events."""
+
+    async def test_changes_are_pushed(self) -> None:
+        """Verify a WebSocket client receives change events."""
+        gateway = await start_gateway([])
+        reader, writer = await asyncio.open_connection('127.0.0.1', gateway.port)
+        key = base64.b64encode(os.urandom(16)).decode()
+        writer.write(
+            'GET /events HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\n'
+            f'Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\n'
+            'Sec-WebSocket-Version: 13\r\n\r\n'.encode()
+        )
+        head = await reader.readuntil(b'\r\n\r\n')
+        assert head.startswith(b'HTTP/1.1 101')
+
+        await gateway._amp.zone_status(11)
+
+        first, length = await reader.readexactly(2)
+        assert first & 0x0F == 0x1
+        event = json.loads(await reader.readexactly(length))
+        assert event['zone'] == 11
+        assert event['old'] is None
+
+        # masked client close frame
+        mask = os.urandom(4)
+        payload = struct.pack('!H', 1000)
+        masked = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        writer.write(bytes([0x88, 0x80 | len(payload)]) + mask + masked)
+        while True:
+            first, length = await reader.readexactly(2)
+            await reader.readexactly(length)
+            if first & 0x0F == 0x8:
+                break
+        writer.close()
+        await gateway.close()
@@ -0,0 +1,136 @@
+"""Tests for the link circuit breaker."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from pyxantech import AmpUnavailableError, async_get_amp_controller
+from pyxantech.health import (
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+    CircuitBreaker,
+    LinkStateEvent,
+)
+
+from . import create_responder_port
+
+ZONE_REPLY = b'\r\n#>110104000131112100601\r\n#'
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_opens_after_consecutive_failures(self) -> None:
+        """Verify the threshold of consecutive timeouts opens the breaker."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        events: list[LinkStateEvent] = []
+        breaker.add_listener(events.append)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == BREAKER_CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == BREAKER_OPEN
+        assert events == [LinkStateEvent(BREAKER_CLOSED, BREAKER_OPEN, 2)]
+        with pytest.raises(AmpUnavailableError):
+            breaker.before_request()
+
+    def test_half_open_allows_one_trial(self) -> None:
+        """Verify one trial request is admitted after the reset timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+
+        assert breaker.state == BREAKER_HALF_OPEN
+        breaker.before_request()
+        with pytest.raises(AmpUnavailableError):
+            breaker.before_request()
+
+        breaker.record_success()
+        assert breaker.state == BREAKER_CLOSED
+        breaker.before_request()
+
+    def test_failed_trial_reopens(self) -> None:
+        """Verify a timeout during the trial re-opens the breaker."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        breaker.before_request()
+
+        breaker.record_failure()
+        assert breaker.state == BREAKER_OPEN
+
+
+class TestControllerBreaker:
+    """Tests for the breaker on an async controller."""
+
+    async def test_unreachable_amp_fails_fast_and_recovers(self) -> None:
+        """Verify calls fail at once while open and succeed after recovery."""
+        online = False
+
+        def handler(request: bytes) -> bytes | None:
+            return ZONE_REPLY if online else None
+
+        port = create_responder_port(handler)
+        amp = await async_get_amp_controller(
+            'monoprice6',
+            port,
+            asyncio.get_running_loop(),
+            failure_threshold=1,
+            reset_timeout=0.2,
+        )
+        assert amp is not None
+        events: list[LinkStateEvent] = []
+        amp.add_link_listener(events.append)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await amp.zone_status(11)
+        assert amp.link_state == BREAKER_OPEN
+
+        start = time.monotonic()
+        with pytest.raises(AmpUnavailableError):
+            await amp.zone_status(11)
+        assert time.monotonic() - start < 0.1
+
+        online = True
+        await asyncio.sleep(0.25)
+        assert amp.link_state == BREAKER_HALF_OPEN
+        assert await amp.zone_status(11) is not None
+        assert amp.link_state == BREAKER_CLOSED
+        assert [event.new for event in events] == [
+            BREAKER_OPEN,
+            BREAKER_HALF_OPEN,
+            BREAKER_CLOSED,
+        ]
+        await amp.close()
+
+    async def test_health_monitor_probes(self) -> None:
+        """Verify the monitor probes the amp periodically until stopped."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes | None:
+            requests.append(request)
+            return ZONE_REPLY
+
+        port = create_responder_port(handler)
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        amp.start_health_monitor(interval=0.05)
+        await asyncio.sleep(0.3)
+        amp.stop_health_monitor()
+        probes = len(requests)
+        await asyncio.sleep(0.15)
+
+        assert probes >= 2
+        assert set(requests) == {b'?11#\r'}
+        assert len(requests) == probes
+        await amp.close()
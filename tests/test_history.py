@@ -0,0 +1,88 @@
+"""Tests for the zone change history recorder."""
+
+from __future__ import annotations
+
+import asyncio
+
+from pyxantech import ZoneChangeEvent, async_get_amp_controller
+from pyxantech.history import HISTORY_FIELDS, HistoryEvent, ZoneHistory
+
+from . import create_responder_port
+
+
+def change(zone: int, field: str, value: object) -> ZoneChangeEvent:
+    """Build a change event for a zone attribute."""
+    return ZoneChangeEvent(zone, field, None, value)
+
+
+class TestZoneHistory:
+    """Tests for ZoneHistory buffers and queries."""
+
+    def test_state_at_and_changes(self) -> None:
+        """Verify point-in-time state and time-range queries."""
+        history = ZoneHistory()
+        history.record(change(12, 'power', True), timestamp=100.0)
+        history.record(change(12, 'volume', 10), timestamp=100.0)
+        history.record(change(12, 'volume', 20), timestamp=200.0)
+        history.record(change(13, 'source', 3), timestamp=150.0)
+
+        assert history.state_at(12, 50.0) is None
+        assert history.state_at(12, 150.0) == {'power': True, 'volume': 10}
+        assert history.state_at(12, 250.0) == {'power': True, 'volume': 20}
+        assert history.changes(since=100.0) == [
+            HistoryEvent(150.0, 13, 'source', 3),
+            HistoryEvent(200.0, 12, 'volume', 20),
+        ]
+        assert history.changes(12, until=100.0) == [
+            HistoryEvent(100.0, 12, 'power', True),
+            HistoryEvent(100.0, 12, 'volume', 10),
+        ]
+
+    def test_ring_buffer_folds_into_baseline(self) -> None:
+        """Verify overwritten changes still count towards later state."""
+        history = ZoneHistory(size=3)
+        history.record(change(1, 'source', 2), timestamp=1.0)
+        for step in range(5):
+            history.record(change(1, 'volume', step), timestamp=2.0 + step)
+
+        assert len(history.changes(1)) == 3
+        assert history.state_at(1, 100.0) == {'source': 2, 'volume': 4}
+
+        columns = history.export(1)
+        assert list(columns['time']) == [4.0, 5.0, 6.0]
+        assert list(columns['value']) == [2, 3, 4]
+        assert {HISTORY_FIELDS[index] for index in columns['field']} == {'volume'}
+        assert columns['time'].itemsize == 8
+
+    def test_non_integer_values_are_ignored(self) -> None:
+        """Verify attributes outside the compact encoding are skipped."""
+        history = ZoneHistory()
+        history.record(change(1, 'volume', 'loud'))
+        history.record(change(1, 'unknown_field', 1))
+
+        assert history.zones == []
+
+
+class TestControllerHistory:
+    """Tests for recording a controller's changes."""
+
+    async def test_records_status_changes(self) -> None:
+        """Verify zone status reads are recorded once enabled."""
+        port = create_responder_port(
+            lambda request: b'\r\n#>110104000131112100601\r\n#'
+        )
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        await amp.zone_status(11)
+        history = amp.record_history()
+        assert amp.history is history
+        assert amp.record_history() is history
+
+        state = history.state_at(11, float('inf'))
+        assert state is not None
+        assert state['volume'] == 13
+        assert state['power'] is True
+        await amp.close()
@@ -0,0 +1,181 @@
+"""Tests for idempotent write suppression."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from pyxantech import async_get_amp_controller, get_amp_controller
+
+from . import create_responder_port
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+STATUS_REQUEST = b'?11#\r'
+# zone 11: power on, source 4, volume 13
+STATUS_REPLY = b'\r\n#>110104000131112100601\r\n#'
+# xantech zone 1: power on, source 2, volume 10
+XANTECH_STATUS = b'#1ZS PR1 SS2 VO10 MU0 TR7 BS7 BA32 LS0 PS0+\r'
+
+
+def monoprice_handler(requests: list[bytes]) -> Callable[[bytes], bytes]:
+    """Answer zone 11 status and acknowledge every write."""
+
+    def handler(request: bytes) -> bytes:
+        requests.append(request)
+        return STATUS_REPLY if request == STATUS_REQUEST else b'\r\n#'
+
+    return handler
+
+
+class TestIdempotentWrites:
+    """Tests for enable_idempotent_writes()."""
+
+    async def test_redundant_writes_skip_the_wire(self) -> None:
+        """Verify writes matching fresh state are suppressed and counted."""
+        requests: list[bytes] = []
+        port = create_responder_port(monoprice_handler(requests))
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+        amp.enable_idempotent_writes()
+
+        await amp.zone_status(11)
+        await amp.set_power(11, True)
+        await amp.set_source(11, 4)
+        await amp.set_volume(11, 20)
+        await amp.set_volume(11, 20)
+        await amp.set_volume(11, 13)
+
+        assert requests == [STATUS_REQUEST, b'<11VO20#\r', b'<11VO13#\r']
+        assert amp.suppressed_writes == {'power': 1, 'source': 1, 'volume': 1}
+        await amp.close()
+
+    async def test_reads_before_enabling_are_not_trusted(self) -> None:
+        """Verify writes made while disabled cannot leave trusted stale state."""
+        requests: list[bytes] = []
+        port = create_responder_port(monoprice_handler(requests))
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        await amp.zone_status(11)
+        await amp.set_volume(11, 20)
+        amp.enable_idempotent_writes()
+        await amp.set_volume(11, 13)
+
+        assert requests == [STATUS_REQUEST, b'<11VO20#\r', b'<11VO13#\r']
+        assert amp.suppressed_writes == {}
+        await amp.close()
+
+    async def test_clamped_value_is_cached(self) -> None:
+        """Verify the cache records the clamped level actually sent."""
+        requests: list[bytes] = []
+        port = create_responder_port(monoprice_handler(requests))
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+        amp.enable_idempotent_writes()
+
+        await amp.zone_status(11)
+        await amp.set_volume(11, 99)
+        cached = amp.cached_status(11)
+        await amp.set_volume(11, 50)
+
+        assert cached is not None
+        assert cached['volume'] == 38
+        assert requests == [STATUS_REQUEST, b'<11VO38#\r']
+        assert amp.suppressed_writes == {'volume': 1}
+        await amp.close()
+
+    async def test_unknown_or_old_state_is_written(self) -> None:
+        """Verify writes go out without fresh state or when disabled."""
+        requests: list[bytes] = []
+        port = create_responder_port(monoprice_handler(requests))
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        amp.enable_idempotent_writes()
+        await amp.set_power(11, True)
+        assert requests == [b'<11PR01#\r']
+
+        amp.enable_idempotent_writes(max_age=0.05)
+        await amp.zone_status(11)
+        await asyncio.sleep(0.1)
+        await amp.set_power(11, True)
+
+        amp.disable_idempotent_writes()
+        await amp.zone_status(11)
+        await amp.set_power(11, True)
+
+        assert requests.count(b'<11PR01#\r') == 3
+        assert amp.suppressed_writes == {}
+        await amp.close()
+
+    async def test_all_off_is_cached(self) -> None:
+        """Verify powering a zone back on after all_off() is not suppressed."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes:
+            requests.append(request)
+            return XANTECH_STATUS if request == b'?1ZD+' else request + b'\r'
+
+        port = create_responder_port(handler, b'+')
+        amp = await async_get_amp_controller(
+            'xantech8', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+        amp.enable_idempotent_writes()
+
+        await amp.zone_status(1)
+        await amp.all_off()
+        await amp.set_power(1, True)
+
+        assert requests == [b'?1ZD+', b'!AO+', b'!1PR1+']
+        assert amp.suppressed_writes == {}
+        await amp.close()
+
+    async def test_ramp_is_cached(self) -> None:
+        """Verify setting the pre-ramp volume after a ramp is not suppressed."""
+        requests: list[bytes] = []
+        port = create_responder_port(monoprice_handler(requests))
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+        amp.enable_idempotent_writes()
+
+        await amp.zone_status(11)
+        await amp.ramp_volume([11], 15, 0.1, start=13)
+        await amp.set_volume(11, 13)
+        await amp.set_volume(11, 13)
+
+        assert requests[-2:] == [b'<11VO15#\r', b'<11VO13#\r']
+        assert amp.suppressed_writes == {'volume': 1}
+        await amp.close()
+
+    def test_sync_controller(self) -> None:
+        """Verify the sync controller suppresses redundant writes too."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes:
+            requests.append(request)
+            return b'#>110104000131112100601\r' if request == STATUS_REQUEST else b'#\r'
+
+        amp = get_amp_controller('monoprice6', create_responder_port(handler))
+        assert amp is not None
+        amp.enable_idempotent_writes()
+
+        amp.zone_status(11)
+        amp.set_mute(11, False)
+        amp.set_mute(11, True)
+
+        assert requests == [STATUS_REQUEST, b'<11MU01#\r']
+        assert amp.suppressed_writes == {'mute': 1}
+        amp.close()
@@ -0,0 +1,113 @@
+"""Tests for step-to-dB lookup tables."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+
+import pytest
+
+from pyxantech import async_get_amp_controller
+from pyxantech.config import LEVEL_TABLES
+from pyxantech.levels import LevelTable, expand_steps, statuses_to_db
+
+from . import create_responder_port
+
+
+class TestLevelTable:
+    """Tests for table expansion and lookups."""
+
+    def test_elided_steps_are_interpolated(self) -> None:
+        """Verify steps between known ones are linearly interpolated."""
+        assert expand_steps({0: -10.0, 4: -2.0, 5: 0.0}) == [
+            -10.0,
+            -8.0,
+            -6.0,
+            -4.0,
+            -2.0,
+            0.0,
+        ]
+
+        volume = LEVEL_TABLES['xantech8']['volume']
+        assert volume.steps == 39
+        assert volume.to_db(38) == 0
+        assert volume.to_db(37) == -1.25
+        assert volume.to_db(36) == pytest.approx(-3.25)
+        assert volume.to_db(0) == -78.75
+
+    def test_to_step_picks_nearest_and_clamps(self) -> None:
+        """Verify dB values map to the nearest step within the table."""
+        table = LevelTable([-6.0, -3.0, 0.0, 0.0, 3.0])
+
+        assert table.to_step(-2.0) == 1
+        assert table.to_step(0.0) == 3
+        assert table.to_step(-100.0) == 0
+        assert table.to_step(12.0) == 4
+        with pytest.raises(ValueError):
+            table.to_db(5)
+
+    def test_balance_folds_channels(self) -> None:
+        """Verify balance is one signed value with muted sides at infinity."""
+        balance = LEVEL_TABLES['xantech8']['balance']
+
+        assert balance.to_db(62) == 37.5
+        assert balance.to_db(1) == -37.5
+        assert balance.to_db(63) == math.inf
+        assert balance.to_step(-math.inf) == 0
+        assert balance.to_step(0.0) == 32
+
+    def test_statuses_to_db(self) -> None:
+        """Verify a whole-house snapshot converts column by column."""
+        tables = LEVEL_TABLES['zpr68-10']
+        statuses = {1: {'volume': 40, 'bass': 6}, 2: {'volume': 0, 'balance': 10}}
+
+        assert statuses_to_db(tables, statuses) == {
+            1: {'volume': 0.0, 'bass': 0.0},
+            2: {'volume': -80.0},
+        }
+
+
+class TestControllerLevels:
+    """Tests for the dB controller API."""
+
+    async def test_set_volume_db(self) -> None:
+        """Verify dB setters send the nearest step and cached reads convert."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes | None:
+            requests.append(request)
+            if request == b'?1ZD+':
+                return b'#1ZS PR1 SS2 VO20 MU0 TR7 BS7 BA32 LS0 PS0+\r'
+            return request + b'\r'
+
+        port = create_responder_port(handler, terminator=b'+')
+        amp = await async_get_amp_controller(
+            'xantech8', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        await amp.set_volume_db(1, -20.0)
+        assert requests[-1] == b'!1VO28+'
+
+        await amp.zone_status(1)
+        assert amp.volume_db(1) == pytest.approx(-35.25)
+        assert amp.levels_db()[1] == {
+            'volume': pytest.approx(-35.25),
+            'bass': 0.0,
+            'treble': 0.0,
+            'balance': 0.0,
+        }
+        await amp.close()
+
+    async def test_series_without_table(self) -> None:
+        """Verify dB calls fail clearly where the series has no table."""
+        port = create_responder_port(lambda request: None)
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        with pytest.raises(ValueError):
+            await amp.set_volume_db(11, -20.0)
+        assert amp.levels_db() == {}
+        await amp.close()
@@ -0,0 +1,132 @@
+"""Tests for the single-thread multi-port poller."""
+
+from __future__ import annotations
+
+import os
+import pty
+import time
+
+import pytest
+import serial
+
+from pyxantech.poller import MultiPortPoller
+
+from . import create_responder_port
+
+MONOPRICE_REPLY = b'\r\n#>110104000131112100601\r\n#'
+XANTECH_REPLY = b'#1ZS PR1 SS2 VO10 MU0 TR7 BS7 BA32 LS0 PS0+\r'
+
+
+class TestMultiPortPoller:
+    """Tests for MultiPortPoller."""
+
+    def test_zone_statuses_across_ports(self) -> None:
+        """Verify statuses from several amps are read in one thread."""
+        monoprice_port = create_responder_port(
+            lambda request: MONOPRICE_REPLY if request == b'?11#\r' else None
+        )
+        xantech_port = create_responder_port(
+            lambda request: XANTECH_REPLY if request == b'?1ZD+' else None, b'+'
+        )
+
+        with MultiPortPoller() as poller:
+            poller.add_port('monoprice6', monoprice_port, {'timeout': 0.2})
+            poller.add_port('xantech8', xantech_port)
+            results = {
+                (port_url, zone): status
+                for port_url, zone, status in poller.zone_statuses(
+                    {monoprice_port: [11, 12], xantech_port: [1]}
+                )
+            }
+
+        assert results[monoprice_port, 11]['volume'] == 13
+        assert results[monoprice_port, 12] is None
+        assert results[xantech_port, 1]['volume'] == 10
+        assert results[xantech_port, 1]['source'] == 2
+
+    def test_batches_are_paced_and_in_order(self) -> None:
+        """Verify a port's commands are sent one at a time with pacing."""
+        sent: list[tuple[float, bytes]] = []
+
+        def handler(request: bytes) -> bytes:
+            sent.append((time.monotonic(), request))
+            return MONOPRICE_REPLY
+
+        port = create_responder_port(handler)
+        with MultiPortPoller() as poller:
+            poller.add_port('monoprice6', port)
+            poller.submit(port, [b'?11#\r', b'?12#\r'], tag='batch')
+            results = list(poller.run())
+
+        assert [result.tag for result in results] == ['batch']
+        assert len(results[0].replies) == 2
+        assert results[0].error is None
+        assert [request for _, request in sent] == [b'?11#\r', b'?12#\r']
+        assert sent[1][0] - sent[0][0] >= 0.045
+
+    def test_timeouts_overlap_across_ports(self) -> None:
+        """Verify silent ports time out concurrently, not one after another."""
+        ports = [create_responder_port(lambda request: None) for _ in range(4)]
+        with MultiPortPoller() as poller:
+            for port in ports:
+                poller.add_port('monoprice6', port, {'timeout': 0.2})
+                poller.submit(port, [b'?11#\r'])
+                poller.submit(port, [b'?12#\r'])
+
+            start = time.monotonic()
+            results = list(poller.run())
+            elapsed = time.monotonic() - start
+
+        assert len(results) == 8
+        assert all(
+            isinstance(result.error, serial.SerialTimeoutException)
+            for result in results
+        )
+        assert elapsed < 0.8
+
+    def test_remove_port_while_consuming_results(self) -> None:
+        """Verify ports can be removed between yielded results."""
+        ports = [create_responder_port(lambda request: None) for _ in range(3)]
+        with MultiPortPoller() as poller:
+            for port in ports:
+                poller.add_port('monoprice6', port, {'timeout': 0.1})
+                poller.submit(port, [b'?11#\r'])
+
+            results = []
+            for result in poller.run():
+                results.append(result)
+                for port_url in list(poller.ports):
+                    if port_url != result.port_url:
+                        poller.remove_port(port_url)
+
+        assert len(results) == 1
+
+    def test_hang_up_fails_the_port(self) -> None:
+        """Verify a port whose device hung up fails at once and is removed."""
+        master, slave = pty.openpty()
+        port = os.ttyname(slave)
+        with MultiPortPoller() as poller:
+            poller.add_port('monoprice6', port, {'timeout': 2.0})
+            poller.submit(port, [b'?11#\r'], tag=11)
+            poller.submit(port, [b'?12#\r'], tag=12)
+            os.close(master)
+            os.close(slave)
+
+            start = time.monotonic()
+            results = list(poller.run())
+            elapsed = time.monotonic() - start
+
+            assert poller.ports == {}
+        assert [result.tag for result in results] == [11, 12]
+        assert all(
+            isinstance(result.error, serial.SerialException) for result in results
+        )
+        assert elapsed < 1.0
+
+    def test_empty_batch_is_rejected(self) -> None:
+        """Verify submit() refuses a batch without commands."""
+        port = create_responder_port(lambda request: None)
+        with MultiPortPoller() as poller:
+            poller.add_port('monoprice6', port)
+            with pytest.raises(ValueError):
+                poller.submit(port, [])
@@ -0,0 +1,185 @@
+"""Tests for the RS232 protocol request queue and writer task."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from pyxantech.config import DEVICE_CONFIG, PROTOCOL_CONFIG
+from pyxantech.protocol import (
+    BACKPRESSURE_DROP_OLDEST,
+    BACKPRESSURE_REJECT,
+    QueueFullError,
+    RequestDroppedError,
+    RS232ControlProtocol,
+)
+
+
+class FakeTransport:
+    """In-memory transport that optionally answers every write."""
+
+    serial = None
+
+    def __init__(
+        self, protocol: RS232ControlProtocol, reply: bytes | None = b'OK\r'
+    ) -> None:
+        self.protocol = protocol
+        self.reply = reply
+        self.delay = 0.0
+        self.writes: list[bytes] = []
+
+    def write(self, data: bytes) -> None:
+        self.writes.append(data)
+        if self.reply is not None:
+            asyncio.get_running_loop().call_later(
+                self.delay, self.protocol.data_received, self.reply
+            )
+
+    def close(self) -> None:
+        self.protocol.connection_lost(None)
+
+
+def make_protocol(
+    reply: bytes | None = b'OK\r', **kwargs: Any
+) -> tuple[RS232ControlProtocol, FakeTransport]:
+    """Create a connected protocol with no pacing delay."""
+    config = dict(DEVICE_CONFIG['monoprice6'], min_time_between_commands=0)
+    protocol = RS232ControlProtocol(
+        'fake',
+        config,
+        {},
+        PROTOCOL_CONFIG['monoprice'],
+        asyncio.get_running_loop(),
+        **kwargs,
+    )
+    transport = FakeTransport(protocol, reply)
+    protocol.connection_made(transport)
+    return protocol, transport
+
+
+class TestWriterQueue:
+    """Tests for the single writer task."""
+
+    async def test_requests_sent_in_order(self) -> None:
+        """Verify concurrent callers are served FIFO by one writer."""
+        protocol, transport = make_protocol()
+
+        replies = await asyncio.gather(
+            *(protocol.send(f'?{zone}\r'.encode()) for zone in range(11, 17))
+        )
+
+        assert replies == ['OK'] * 6
+        assert transport.writes == [f'?{zone}\r'.encode() for zone in range(11, 17)]
+        assert protocol.metrics.completed == 6
+        assert protocol.metrics.max_depth >= 1
+
+    async def test_failed_requests_not_counted_completed(self) -> None:
+        """Verify a request that times out counts as failed only."""
+        protocol, transport = make_protocol(reply=None)
+        protocol._timeout = 0.05
+
+        with pytest.raises(TimeoutError):
+            await protocol.send(b'?11\r')
+
+        assert protocol.metrics.completed == 0
+        assert protocol.metrics.failed == 1
+
+    async def test_send_many_is_atomic(self) -> None:
+        """Verify batch commands are not interleaved with other requests."""
+        protocol, transport = make_protocol()
+
+        await asyncio.gather(
+            protocol.send_many([b'a1\r', b'a2\r', b'a3\r']),
+            protocol.send(b'b\r'),
+        )
+
+        assert transport.writes == [b'a1\r', b'a2\r', b'a3\r', b'b\r']
+
+    async def test_reject_when_full(self) -> None:
+        """Verify the reject policy raises QueueFullError."""
+        protocol, transport = make_protocol(
+            reply=None, max_queue_size=1, backpressure=BACKPRESSURE_REJECT
+        )
+        protocol._timeout = 0.2
+
+        first = asyncio.ensure_future(protocol.send(b'1\r'))
+        await asyncio.sleep(0)  # writer picks up the first request
+        second = asyncio.ensure_future(protocol.send(b'2\r'))
+        await asyncio.sleep(0)
+
+        with pytest.raises(QueueFullError):
+            await protocol.send(b'3\r')
+        assert protocol.metrics.rejected == 1
+
+        for task in (first, second):
+            task.cancel()
+
+    async def test_drop_oldest_background(self) -> None:
+        """Verify drop_oldest evicts the oldest background request."""
+        protocol, transport = make_protocol(
+            reply=None, max_queue_size=2, backpressure=BACKPRESSURE_DROP_OLDEST
+        )
+        protocol._timeout = 0.2
+
+        busy = asyncio.ensure_future(protocol.send(b'busy\r'))
+        await asyncio.sleep(0)
+        poll = asyncio.ensure_future(protocol.send(b'poll\r', background=True))
+        user = asyncio.ensure_future(protocol.send(b'user\r'))
+        await asyncio.sleep(0)
+        urgent = asyncio.ensure_future(protocol.send(b'urgent\r'))
+        await asyncio.sleep(0)
+
+        with pytest.raises(RequestDroppedError):
+            await poll
+        assert protocol.metrics.dropped == 1
+        assert protocol.queue_depth == 2
+
+        for task in (busy, user, urgent):
+            task.cancel()
+
+
+class TestDeadlines:
+    """Tests for per-request deadlines and cancellation."""
+
+    async def test_expired_request_is_not_sent(self) -> None:
+        """Verify a request whose deadline passes while queued is dropped."""
+        protocol, transport = make_protocol()
+        transport.delay = 0.1
+
+        busy = asyncio.ensure_future(protocol.send(b'busy\r'))
+        await asyncio.sleep(0)
+        with pytest.raises(asyncio.TimeoutError):
+            await protocol.send(b'late\r', deadline=time.monotonic() + 0.02)
+        await busy
+        await asyncio.sleep(0)
+
+        assert transport.writes == [b'busy\r']
+        assert protocol.metrics.expired == 1
+
+    async def test_timeout_while_in_flight_discards_late_reply(self) -> None:
+        """Verify the late reply of an abandoned request is not handed to the next one."""
+        protocol, transport = make_protocol(reply=b'FIRST\r')
+        transport.delay = 0.1
+
+        with pytest.raises(asyncio.TimeoutError):
+            await protocol.send(b'first\r', timeout=0.02)
+
+        transport.reply = b'SECOND\r'
+        transport.delay = 0.0
+        assert await protocol.send(b'second\r') == 'SECOND'
+        assert transport.writes == [b'first\r', b'second\r']
+
+    async def test_cancelled_batch_stops_sending(self) -> None:
+        """Verify cancelling a caller stops the remaining commands of its batch."""
+        protocol, transport = make_protocol()
+        transport.delay = 0.05
+
+        batch = asyncio.ensure_future(protocol.send_many([b'a\r', b'b\r', b'c\r']))
+        await asyncio.sleep(0.01)
+        batch.cancel()
+
+        assert await protocol.send(b'next\r') == 'OK'
+        assert transport.writes == [b'a\r', b'next\r']
@@ -0,0 +1,104 @@
+"""Tests for volume ramp planning and execution."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from pyxantech import _volume_step_cmd, async_get_amp_controller
+from pyxantech.ramp import CURVES, plan_ramp
+
+from . import create_responder_port
+
+
+class TestPlanRamp:
+    """Tests for plan_ramp."""
+
+    def test_every_zone_ends_at_target(self) -> None:
+        """Verify the final round moves every zone to the target."""
+        plan = plan_ramp({11: 0, 12: 10, 13: 30}, 20, 2.0, 0.05)
+
+        final = {step.zone: step.volume for step in plan.rounds[-1]}
+        assert final == {11: 20, 12: 20, 13: 20}
+
+    def test_at_most_one_step_per_zone_per_round(self) -> None:
+        """Verify zones are interleaved round-robin."""
+        plan = plan_ramp({11: 0, 12: 5}, 30, 3.0, 0.05)
+
+        for steps in plan.rounds:
+            zones = [step.zone for step in steps]
+            assert len(zones) == len(set(zones))
+
+    def test_plan_fits_pacing_budget(self) -> None:
+        """Verify the total command count fits within duration / min_interval."""
+        zones = dict.fromkeys(range(11, 17), 0)
+        plan = plan_ramp(zones, 38, 1.0, 0.05)
+
+        commands = sum(len(steps) for steps in plan.rounds)
+        assert commands <= int(1.0 / 0.05)
+        assert plan.duration == pytest.approx(1.0)
+
+    def test_zone_already_at_target_is_skipped(self) -> None:
+        """Verify zones already at the target get no steps."""
+        plan = plan_ramp({11: 20, 12: 10}, 20, 1.0, 0.05)
+
+        assert all(step.zone == 12 for steps in plan.rounds for step in steps)
+
+    @pytest.mark.parametrize('curve', sorted(CURVES))
+    def test_curves_are_monotonic(self, curve: str) -> None:
+        """Verify built-in curves produce monotonic fades."""
+        plan = plan_ramp({11: 0}, 38, 10.0, 0.05, curve)
+
+        levels = [step.volume for steps in plan.rounds for step in steps]
+        assert levels == sorted(levels)
+        assert levels[-1] == 38
+
+    def test_unknown_curve_raises(self) -> None:
+        """Verify unknown curve names are rejected."""
+        with pytest.raises(ValueError, match='Unknown ramp curve'):
+            plan_ramp({11: 0}, 10, 1.0, 0.05, 'bogus')
+
+
+class TestVolumeStepCommand:
+    """Tests for choosing relative vs absolute volume commands."""
+
+    def test_single_step_uses_native_up_down(self) -> None:
+        """Verify xantech single steps use volume_up/volume_down."""
+        assert _volume_step_cmd('xantech8', 1, 10, 11) == b'!1VI+'
+        assert _volume_step_cmd('xantech8', 1, 10, 9) == b'!1VD+'
+
+    def test_larger_step_uses_set_volume(self) -> None:
+        """Verify multi-level jumps use absolute set_volume."""
+        assert _volume_step_cmd('xantech8', 1, 10, 15) == b'!1VO15+'
+
+    def test_protocol_without_up_down(self) -> None:
+        """Verify protocols without volume_up fall back to set_volume."""
+        assert _volume_step_cmd('monoprice6', 11, 10, 11) == b'<11VO11#\r'
+
+
+class TestRampVolume:
+    """Tests for AmpControlAsync.ramp_volume over a simulated amp."""
+
+    async def test_ramp_reaches_target_within_duration(self) -> None:
+        """Verify a multi-zone ramp ends at the target close to the duration."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes:
+            requests.append(request)
+            return b'OK\r'
+
+        port = create_responder_port(handler)
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        loop = asyncio.get_running_loop()
+        began = loop.time()
+        await amp.ramp_volume([11, 12], 10, 0.5, start=0)
+        elapsed = loop.time() - began
+
+        assert elapsed < 1.0
+        assert b'<11VO10#\r' in requests
+        assert b'<12VO10#\r' in requests
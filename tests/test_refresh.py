@@ -0,0 +1,114 @@
+"""Tests for single-attribute status reads and partial refresh."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyxantech import async_get_amp_controller, get_amp_controller
+
+from . import create_responder_port
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+XANTECH_STATUS = b'#1ZS PR1 SS2 VO10 MU0 TR7 BS7 BA32 LS0 PS0+\r'
+
+
+def xantech_handler(
+    requests: list[bytes], volume: int = 20
+) -> Callable[[bytes], bytes | None]:
+    """Answer xantech zone and single-attribute queries for zone 1."""
+
+    def handler(request: bytes) -> bytes | None:
+        requests.append(request)
+        if request == b'?1ZD+':
+            return XANTECH_STATUS
+        if match := re.fullmatch(rb'\?1(VO|MU|PR)\+', request):
+            value = {b'VO': b'%d' % volume, b'MU': b'1', b'PR': b'1'}[match[1]]
+            return b'?1%s%s+\r' % (match[1], value)
+        return None
+
+    return handler
+
+
+class TestRefresh:
+    """Tests for refresh() and the get_* readers."""
+
+    async def test_refresh_merges_into_cache(self) -> None:
+        """Verify single-attribute queries update only the requested fields."""
+        requests: list[bytes] = []
+        port = create_responder_port(xantech_handler(requests), b'+')
+        amp = await async_get_amp_controller(
+            'xantech8', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        await amp.zone_status(1)
+        events = amp.subscribe_changes()
+        requests.clear()
+
+        assert await amp.refresh(1, ['volume', 'mute']) == {'volume': 20, 'mute': True}
+        assert requests == [b'?1VO+', b'?1MU+']
+
+        cached = amp.cached_status(1)
+        assert cached['volume'] == 20
+        assert cached['mute'] is True
+        assert cached['source'] == 2
+        assert events.qsize() == 2
+        await amp.close()
+
+    async def test_get_volume_without_cached_state(self) -> None:
+        """Verify get_volume works before the zone was ever read."""
+        requests: list[bytes] = []
+        port = create_responder_port(xantech_handler(requests, volume=5), b'+')
+        amp = await async_get_amp_controller(
+            'xantech8', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        assert await amp.get_volume(1) == 5
+        assert amp.cached_status(1) is None
+        await amp.close()
+
+    async def test_falls_back_to_zone_status(self) -> None:
+        """Verify protocols without attribute queries read the full status."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes | None:
+            requests.append(request)
+            return b'\r\n#>%s0104000131112100601\r\n#' % request[1:3]
+
+        port = create_responder_port(handler)
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        assert await amp.get_volume(11) == 13
+        assert requests == [b'?11#\r']
+        await amp.close()
+
+    def test_invalid_field(self) -> None:
+        """Verify unknown field names raise ValueError."""
+        port = create_responder_port(xantech_handler([]), b'+')
+        amp = get_amp_controller('xantech8', port)
+        assert amp is not None
+
+        with pytest.raises(ValueError):
+            amp.refresh(1, ['loudness'])
+        amp.close()
+
+    def test_sync_get_volume(self) -> None:
+        """Verify the sync controller reads a single attribute."""
+        requests: list[bytes] = []
+        port = create_responder_port(xantech_handler(requests, volume=33), b'+')
+        amp = get_amp_controller('xantech8', port)
+        assert amp is not None
+
+        assert amp.get_volume(1) == 33
+        assert requests == [b'?1VO+']
+        amp.close()
@@ -0,0 +1,116 @@
+"""Tests for zone-state snapshots and warm start."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+from pyxantech import ZoneStatus, async_get_amp_controller
+from pyxantech.events import ZoneStateTracker
+from pyxantech.snapshot import load_snapshot, save_snapshot
+
+from . import create_dummy_port
+
+
+class TestSnapshotFile:
+    """Tests for snapshot save/load."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Verify saved zones load back keyed by int zone."""
+        path = tmp_path / 'zones.json'
+        save_snapshot(path, 'monoprice6', {11: ZoneStatus(zone=11, volume=20).dict})
+
+        assert load_snapshot(path, 'monoprice6')[11]['volume'] == 20
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Verify a missing snapshot yields no state."""
+        assert load_snapshot(tmp_path / 'missing.json', 'monoprice6') == {}
+
+    def test_other_amp_type_ignored(self, tmp_path: Path) -> None:
+        """Verify snapshots for a different amp type are ignored."""
+        path = tmp_path / 'zones.json'
+        save_snapshot(path, 'xantech8', {1: ZoneStatus(zone=1).dict})
+
+        assert load_snapshot(path, 'monoprice6') == {}
+
+    def test_corrupt_file_ignored(self, tmp_path: Path) -> None:
+        """Verify corrupt snapshots do not raise."""
+        path = tmp_path / 'zones.json'
+        path.write_text('{not json')
+
+        assert load_snapshot(path, 'monoprice6') == {}
+
+    def test_non_object_file_ignored(self, tmp_path: Path) -> None:
+        """Verify valid JSON that is not an object does not raise."""
+        path = tmp_path / 'zones.json'
+        for content in ('[1, 2]', '42', 'null'):
+            path.write_text(content)
+
+            assert load_snapshot(path, 'monoprice6') == {}
+
+
+class TestProvisionalState:
+    """Tests for stale state in the tracker."""
+
+    def test_loaded_state_is_stale_until_read(self) -> None:
+        """Verify provisional zones are stale and emit no events on load."""
+        tracker = ZoneStateTracker()
+        received: list[object] = []
+        tracker.add_listener(received.append)
+
+        tracker.load_provisional([ZoneStatus(zone=11, volume=20)])
+        assert tracker.is_stale(11)
+        assert received == []
+
+        events = tracker.update(ZoneStatus(zone=11, volume=22))
+        assert not tracker.is_stale(11)
+        assert [(e.field, e.old, e.new) for e in events] == [('volume', 20, 22)]
+
+    def test_persistence_saves_on_change(self, tmp_path: Path) -> None:
+        """Verify changes are persisted once the save interval has elapsed."""
+        path = tmp_path / 'zones.json'
+        tracker = ZoneStateTracker()
+        tracker.enable_persistence(path, 'monoprice6', interval=0.0)
+
+        tracker.update(ZoneStatus(zone=12, source=3))
+
+        assert json.loads(path.read_text())['zones']['12']['source'] == 3
+
+    async def test_persistence_saves_off_the_event_loop(self, tmp_path: Path) -> None:
+        """Verify changes made on a running loop are written by the executor."""
+        path = tmp_path / 'zones.json'
+        tracker = ZoneStateTracker()
+        tracker.enable_persistence(path, 'monoprice6', interval=0.0)
+
+        tracker.update(ZoneStatus(zone=12, source=3))
+
+        for _ in range(100):
+            if path.exists():
+                break
+            await asyncio.sleep(0.01)
+        assert json.loads(path.read_text())['zones']['12']['source'] == 3
+
+
+class TestControllerWarmStart:
+    """Tests for controller warm start from a snapshot."""
+
+    async def test_warm_start_and_revalidate(self, tmp_path: Path) -> None:
+        """Verify cached state is available before polling and refreshed after."""
+        path = tmp_path / 'zones.json'
+        save_snapshot(path, 'monoprice6', {11: ZoneStatus(zone=11, volume=5).dict})
+        port = create_dummy_port({b'?11#\r': b'\r\n#>110104000131112100601\r\n#'})
+
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop(), snapshot_path=path
+        )
+        assert amp is not None
+        assert amp.cached_status(11)['volume'] == 5
+        assert amp.is_stale(11)
+
+        await amp.revalidate_stale()
+        assert amp.cached_status(11)['volume'] == 13
+        assert not amp.is_stale(11)
+
+        await amp.close()
+        assert load_snapshot(path, 'monoprice6')[11]['volume'] == 13
@@ -0,0 +1,87 @@
+"""Tests for the command trace ring buffer."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import pytest
+
+from pyxantech import async_get_amp_controller
+from pyxantech.protocol import log_timeout
+from pyxantech.trace import TRACE_RECEIVE, TRACE_SEND, TRACE_TIMEOUT, CommandTrace
+
+from . import create_responder_port
+
+ZONE_REPLY = b'\r\n#>110104000131112100601\r\n#'
+
+
+class TestCommandTrace:
+    """Tests for CommandTrace."""
+
+    def test_ring_buffer_keeps_newest(self) -> None:
+        """Verify old events are overwritten once the buffer is full."""
+        trace = CommandTrace(size=3)
+        for index in range(5):
+            trace.record(TRACE_SEND, b'%d' % index)
+
+        assert len(trace) == 3
+        assert [event.data for event in trace.events()] == [b'2', b'3', b'4']
+        assert [event.data for event in trace.events(last=1)] == [b'4']
+
+    def test_dump_logs_events(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Verify dump() formats every buffered event into one log record."""
+        trace = CommandTrace()
+        trace.record(TRACE_SEND, b'?11#\r')
+        trace.record(TRACE_RECEIVE, ZONE_REPLY)
+
+        with caplog.at_level(logging.INFO, logger='pyxantech.trace'):
+            trace.dump()
+
+        assert len(caplog.records) == 1
+        assert "b'?11#\\r'" in caplog.records[0].getMessage()
+
+    def test_timeout_log_is_rate_limited(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Verify repeated timeouts share one rate limit."""
+        trace = CommandTrace()
+        with caplog.at_level(logging.INFO, logger='pyxantech.protocol'):
+            for _ in range(5):
+                log_timeout('/dev/null', b'', 1.0, trace)
+
+        assert len(caplog.records) <= 2
+
+
+class TestControllerTrace:
+    """Tests for tracing controller traffic."""
+
+    async def test_async_commands_are_traced(self) -> None:
+        """Verify sent commands, replies and timeouts are recorded."""
+
+        def handler(request: bytes) -> bytes | None:
+            return ZONE_REPLY if request == b'?11#\r' else None
+
+        port = create_responder_port(handler)
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        await amp.zone_status(11)
+        with pytest.raises(asyncio.TimeoutError):
+            await amp.zone_status(12, timeout=0.2)
+
+        kinds = [(event.kind, event.data) for event in amp.trace.events()]
+        assert kinds[:3] == [
+            (TRACE_SEND, b'?11#\r'),
+            (TRACE_RECEIVE, ZONE_REPLY),
+            (TRACE_SEND, b'?12#\r'),
+        ]
+        # the writer keeps reading until the device timeout to drain a late reply
+        for _ in range(30):
+            if amp.trace.events()[-1].kind == TRACE_TIMEOUT:
+                break
+            await asyncio.sleep(0.1)
+        assert amp.trace.events()[-1].kind == TRACE_TIMEOUT
+        await amp.close()
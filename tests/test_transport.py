@@ -0,0 +1,136 @@
+"""Tests for the native asyncio serial transport."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import pty
+
+from pyxantech import async_get_amp_controller
+from pyxantech.transport import SerialTransport, create_serial_connection
+
+from . import create_dummy_port
+
+
+class _CollectingProtocol(asyncio.Protocol):
+    """Protocol that records everything it receives."""
+
+    def __init__(self) -> None:
+        self.received = bytearray()
+        self.made = asyncio.Event()
+        self.lost = asyncio.Event()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.made.set()
+
+    def data_received(self, data: bytes) -> None:
+        self.received += data
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self.lost.set()
+
+
+class TestSerialTransport:
+    """Tests for SerialTransport over a pty pair."""
+
+    async def test_read_and_write_over_pty(self) -> None:
+        """Verify data flows both ways through the registered fd."""
+        master, slave = pty.openpty()
+        loop = asyncio.get_running_loop()
+
+        transport, protocol = await create_serial_connection(
+            loop, _CollectingProtocol, os.ttyname(slave), baudrate=9600
+        )
+        assert isinstance(transport, SerialTransport)
+        assert isinstance(protocol, _CollectingProtocol)
+        await asyncio.wait_for(protocol.made.wait(), 1.0)
+
+        transport.write(b'?11#\r')
+        request = await loop.run_in_executor(None, os.read, master, 64)
+        assert request == b'?11#\r'
+
+        os.write(master, b'#>11\r')
+        for _ in range(100):
+            if protocol.received.endswith(b'\r'):
+                break
+            await asyncio.sleep(0.01)
+        assert bytes(protocol.received) == b'#>11\r'
+
+        transport.close()
+        await asyncio.wait_for(protocol.lost.wait(), 1.0)
+        assert transport.is_closing()
+        os.close(master)
+        os.close(slave)
+
+    async def test_pause_and_resume_reading(self) -> None:
+        """Verify no data is delivered while reading is paused."""
+        master, slave = pty.openpty()
+        loop = asyncio.get_running_loop()
+
+        transport, protocol = await create_serial_connection(
+            loop, _CollectingProtocol, os.ttyname(slave), baudrate=9600
+        )
+        assert isinstance(protocol, _CollectingProtocol)
+        await asyncio.wait_for(protocol.made.wait(), 1.0)
+
+        transport.pause_reading()
+        assert not transport.is_reading()
+        os.write(master, b'#>11\r')
+        await asyncio.sleep(0.1)
+        assert protocol.received == b''
+
+        transport.resume_reading()
+        assert transport.is_reading()
+        for _ in range(100):
+            if protocol.received:
+                break
+            await asyncio.sleep(0.01)
+        assert bytes(protocol.received) == b'#>11\r'
+
+        transport.close()
+        await asyncio.wait_for(protocol.lost.wait(), 1.0)
+        os.close(master)
+        os.close(slave)
+
+    async def test_hang_up_closes_transport(self) -> None:
+        """Verify an empty read closes the transport instead of spinning."""
+
+        class _Port:
+            port = 'pipe'
+            closed = False
+
+            def close(self) -> None:
+                self.closed = True
+
+        read_fd, write_fd = os.pipe()
+        serial_instance = _Port()
+        protocol = _CollectingProtocol()
+        transport = SerialTransport(
+            asyncio.get_running_loop(), protocol, serial_instance, read_fd
+        )
+        await asyncio.wait_for(protocol.made.wait(), 1.0)
+
+        os.close(write_fd)
+        await asyncio.wait_for(protocol.lost.wait(), 1.0)
+
+        assert transport.is_closing()
+        assert serial_instance.closed
+        os.close(read_fd)
+
+
+class TestAsyncControllerOverPty:
+    """Tests for the async controller using the native transport."""
+
+    async def test_zone_status(self) -> None:
+        """Verify the async controller parses a reply delivered via the fd."""
+        port = create_dummy_port({b'?11#\r': b'\r\n#>110104000131112100601\r\n#'})
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+
+        assert amp is not None
+        status = await amp.zone_status(11)
+
+        assert status is not None
+        assert status['source'] == 4
+        assert status['volume'] == 13
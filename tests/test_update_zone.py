@@ -0,0 +1,127 @@
+"""Tests for atomic multi-attribute zone updates."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from pyxantech import async_get_amp_controller, get_amp_controller
+
+from . import create_responder_port
+
+STATUS_REQUEST = b'?11#\r'
+# zone 11: power on, source 4, unmuted, volume 13
+STATUS_REPLY = b'\r\n#>110104000131112100601\r\n#'
+
+
+class TestUpdateZone:
+    """Tests for update_zone()."""
+
+    async def test_combines_changed_fields_into_one_write(self) -> None:
+        """Verify unchanged fields are skipped and the rest sent as one line."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes:
+            requests.append(request)
+            return STATUS_REPLY if request == STATUS_REQUEST else b'\r\n#'
+
+        port = create_responder_port(handler)
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+        amp.enable_idempotent_writes()
+
+        await amp.zone_status(11)
+        changes = await amp.update_zone(11, volume=20, mute=False, source=2, power=True)
+
+        assert changes == {'source': 2, 'volume': 20}
+        assert list(changes) == ['source', 'volume']
+        assert requests == [STATUS_REQUEST, b'<11CH02#<11VO20#\r']
+        status = amp.cached_status(11)
+        assert status is not None
+        assert (status['source'], status['volume']) == (2, 20)
+        await amp.close()
+
+    async def test_sends_every_field_without_idempotent_mode(self) -> None:
+        """Verify fields are only skipped once idempotent writes are enabled."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes:
+            requests.append(request)
+            return STATUS_REPLY if request == STATUS_REQUEST else b'\r\n#'
+
+        port = create_responder_port(handler)
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        await amp.zone_status(11)
+        changes = await amp.update_zone(11, power=True, volume=20)
+
+        assert changes == {'power': True, 'volume': 20}
+        assert requests == [STATUS_REQUEST, b'<11PR01#<11VO20#\r']
+        assert amp.suppressed_writes == {}
+        status = amp.cached_status(11)
+        assert status is not None
+        assert status['volume'] == 13  # not merged; the next read resyncs
+        await amp.close()
+
+    async def test_groups_commands_without_separator(self) -> None:
+        """Verify commands stay ordered and uninterrupted on other protocols."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes:
+            requests.append(request)
+            return b'#\r'
+
+        port = create_responder_port(handler)
+        amp = await async_get_amp_controller('dax88', port, asyncio.get_running_loop())
+        assert amp is not None
+
+        await asyncio.gather(
+            amp.update_zone(11, volume=20, power=True, source=2),
+            amp.set_volume(12, 5),
+        )
+
+        update = [request for request in requests if request.startswith(b'<11')]
+        assert len(update) == 3
+        assert b'PR' in update[0]
+        assert b'VO' in update[-1]
+        start = requests.index(update[0])
+        assert requests[start : start + 3] == update
+        await amp.close()
+
+    async def test_rejects_unknown_fields(self) -> None:
+        """Verify invalid fields fail before anything is sent."""
+        port = create_responder_port(lambda request: None)
+        amp = await async_get_amp_controller(
+            'monoprice6', port, asyncio.get_running_loop()
+        )
+        assert amp is not None
+
+        with pytest.raises(ValueError):
+            await amp.update_zone(11, volume=10, loudness=True)
+        with pytest.raises(ValueError):
+            await amp.update_zone(99, volume=10)
+        await amp.close()
+
+    def test_sync_controller(self) -> None:
+        """Verify the sync controller sends the combined write."""
+        requests: list[bytes] = []
+
+        def handler(request: bytes) -> bytes:
+            requests.append(request)
+            return b'#\r'
+
+        amp = get_amp_controller('monoprice6', create_responder_port(handler))
+        assert amp is not None
+
+        assert amp.update_zone(11, power=True, volume=10) == {
+            'power': True,
+            'volume': 10,
+        }
+        assert requests == [b'<11PR01#<11VO10#\r']
+        amp.close()
@@ -85,7 +85,10 @@ class TestZoneStatusParsing:
     def test_invalid_format_returns_none(self) -> None:
         """Invalid format strings should return None."""
         # non-numeric zone
-        assert ZoneStatus.from_string('monoprice6', '\r\n#>a100010000101112100401\r\n#') is None
+        assert (
+            ZoneStatus.from_string('monoprice6', '\r\n#>a100010000101112100401\r\n#')
+            is None
+        )
         # empty response
         assert ZoneStatus.from_string('monoprice6', '\r\n#>\r\n#') is None
 